@@ -0,0 +1,72 @@
+from coconut.coupling_components.component import Component
+from coconut import tools
+
+import numpy as np
+
+
+def create(parameters):
+    return ConvergenceCriterionPredictive(parameters)
+
+
+# norm criterion with an iteration limit, which extrapolates the residual norm with the reduction rate observed in the
+# last coupling iterations to signal stagnation or to stop one iteration early
+class ConvergenceCriterionPredictive(Component):
+    def __init__(self, parameters):
+        super().__init__()
+
+        settings = parameters['settings']
+        self.tolerance = settings['tolerance']
+        self.order = settings['order']
+        self.maximum = settings['maximum']  # maximum number of iterations
+        self.relative = settings.get('relative', False)  # tolerance on norm relative to the one of the first iteration
+        self.window = settings.get('window', 3)  # number of last reductions of the norm used to determine the rate
+        self.anticipate = settings.get('anticipate', False)  # satisfied if the next iteration will converge
+        self.stop_stagnation = settings.get('stop_stagnation', False)  # satisfied if tolerance will not be reached
+        for key in ('maximum', 'window'):
+            if not isinstance(self.__getattribute__(key), int) or self.__getattribute__(key) < 1:
+                raise ValueError(f'Parameter "{key}" should be a positive integer')
+
+        self.norms = []  # norms of the residuals in the current time step
+        self.stagnated = False  # tolerance is not reached within the maximum number of iterations in this time step
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.norms = []
+        self.stagnated = False
+
+    def update(self, r):
+        norm = r.norm(order=self.order)
+        if self.relative and not self.norms and norm < np.finfo(type(norm)).eps:
+            raise Exception('Initial norm is too small')
+        self.norms.append(norm)
+
+    def get_norm(self):
+        return self.norms[-1] / self.norms[0] if self.relative else self.norms[-1]
+
+    def get_rates(self):
+        # reductions of the norm in the last iterations
+        norms = np.array(self.norms[-self.window - 1:])
+        return norms[1:] / norms[:-1]
+
+    def is_satisfied(self):
+        if not self.norms:
+            return False
+        norm = self.get_norm()
+        if norm < self.tolerance or len(self.norms) >= self.maximum:
+            return True
+        if len(self.norms) <= self.window:
+            return False
+        rates = self.get_rates()
+        # the next iteration converges even with the slowest reduction observed in the last iterations
+        if self.anticipate and norm * rates.max() < self.tolerance:
+            return True
+        # the tolerance is not reached before the maximum number of iterations even with the fastest reduction
+        rate = rates.min()
+        if rate >= 1 or norm * rate ** (self.maximum - len(self.norms)) >= self.tolerance:
+            if not self.stagnated:
+                tools.print_info(f'Stagnation after {len(self.norms)} iterations: with reduction rate {rate:.2g} the '
+                                 f'tolerance is not reached within {self.maximum} iterations', layout='warning')
+                self.stagnated = True
+            return self.stop_stagnation
+        return False
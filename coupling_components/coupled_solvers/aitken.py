@@ -17,6 +17,7 @@ class CoupledSolverAITKEN(CoupledSolver):
         self.omega = self.omega_max
         self.added = False
         self.rcurr = None
+        self.rprev = None
 
     def initialize(self):
         super().initialize()
@@ -28,28 +29,28 @@ class CoupledSolverAITKEN(CoupledSolver):
         super().initialize_solution_step()
 
         self.added = False
-        self.rcurr = None
 
     def predict(self, r_in):
-        r = r_in.get_interface_data()
         # calculate return value if sufficient data available
         if not self.added:
             raise RuntimeError('No information to predict')
-        dx = self.omega * r
-        dx_out = r_in.copy()
-        dx_out.set_interface_data(dx)
-        return dx_out
+        return r_in.multiply(self.omega)
 
     def update(self, x_in, xt_in):
-        x = x_in.get_interface_data().reshape(-1, 1)
-        xt = xt_in.get_interface_data().reshape(-1, 1)
-        r = xt - x
+        x = x_in.get_interface_data(copy=False).reshape(-1, 1)
+        xt = xt_in.get_interface_data(copy=False).reshape(-1, 1)
+        # reuse the arrays of the previous residuals
+        if self.rprev is None or self.rprev.shape != x.shape:
+            self.rprev = np.empty_like(x)
+        r = np.subtract(xt, x, out=self.rprev)
         rprev = self.rcurr
-        self.rcurr = r
+        self.rprev, self.rcurr = rprev, r
         if self.added:
             # Aitken relaxation
             # update omega
-            self.omega *= -float(rprev.T @ (r - rprev) / np.linalg.norm(r - rprev, 2) ** 2)
+            dr = np.subtract(r, rprev, out=rprev)  # previous residual is not needed afterwards
+            dr_norm2 = float(dr.T @ dr)
+            self.omega *= -(float(r.T @ dr) - dr_norm2) / dr_norm2
         else:
             # set first value of omega in a time step
             self.omega = np.sign(self.omega) * min(abs(self.omega), self.omega_max)
@@ -59,19 +60,20 @@ class CoupledSolverAITKEN(CoupledSolver):
         # initial value
         self.x = self.predictor.predict(self.x)
         # first coupling iteration
-        self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-        r = xt - self.x
-        self.update(self.x.copy(), xt)
+        self.y = self.solve_solver_wrapper(0, self.x)
+        xt = self.solve_solver_wrapper(1, self.y)
+        r = xt.subtract(self.x, out=self.pool_x.get())
+        self.update(self.x, xt)
         self.finalize_iteration(r)
         # coupling iteration loop
         while not self.convergence_criterion.is_satisfied():
-            self.x += self.predict(r)
-            self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-            xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-            r = xt - self.x
-            self.update(self.x.copy(), xt)
+            self.x.add_scaled(r, self.omega)
+            self.y = self.solve_solver_wrapper(0, self.x)
+            xt = self.solve_solver_wrapper(1, self.y)
+            xt.subtract(self.x, out=r)
+            self.update(self.x, xt)
             self.finalize_iteration(r)
+        self.pool_x.release(r)
 
     def is_ready(self):
         return self.added
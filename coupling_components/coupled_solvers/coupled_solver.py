@@ -1,9 +1,11 @@
 from coconut import tools
 from coconut.tools import create_instance
 from coconut.coupling_components.component import Component
+from coconut.data_structure import InterfacePool, InterfaceBlock
 
 import numpy as np
 import time
+import copy
 import pickle
 import os
 from datetime import datetime
@@ -35,12 +37,15 @@ class CoupledSolver(Component):
         self.settings['save_restart'] = self.save_restart  # in order to pass on default value
         self.write_results = self.settings.get('write_results', 0)  # time step interval to write coupling results
         self.anonymous = self.settings.get('anonymous', False)  # disables saving 'info' in the pickle file
+        self.results_precision = tools.get_precision(self.settings, 'results_precision')  # storage of results
         self.time_step = self.timestep_start_current  # time step
         self.delta_t = self.settings['delta_t']  # time step size
 
         self.predictor = create_instance(self.parameters['predictor'], 'predictors.dummy_predictor')
         self.convergence_criterion = create_instance(self.parameters['convergence_criterion'],
                                                      'convergence_criteria.dummy_convergence_criterion')
+        self.time_step_controller = create_instance(self.parameters.get('time_step_controller', {}),
+                                                    'time_step_controllers.dummy_time_step_controller')
         self.solver_wrappers = []
         self.index_mapped = None
         self.index_other = None
@@ -58,10 +63,13 @@ class CoupledSolver(Component):
         if self.index_other is None:
             raise ValueError('Not both solvers may be mapped solvers.')
 
-        self.components = [self.predictor, self.convergence_criterion, self.solver_wrappers[0], self.solver_wrappers[1]]
+        self.components = [self.predictor, self.convergence_criterion, self.solver_wrappers[0], self.solver_wrappers[1],
+                           self.time_step_controller]
 
         self.x = None  # input interface of solver 0
         self.y = None  # input interface of solver 1
+        self.pool_x = None  # scratch interfaces with layout of x
+        self.pool_y = None  # scratch interfaces with layout of y
         self.iteration = None  # iteration
         self.solver_level = 0  # 0 is main solver (time step is printed)
         self.init_time = None
@@ -71,6 +79,8 @@ class CoupledSolver(Component):
         self.save_time = 0
         self.time_allocation = {'previous_calculations': []}
         self.iterations = []
+        self.time_step_sizes = []
+        self.residual = []
 
         # restart
         if self.restart:
@@ -82,7 +92,6 @@ class CoupledSolver(Component):
         if self.write_results:
             self.complete_solution_x = None
             self.complete_solution_y = None
-            self.residual = []
             self.info = None
 
         # debug
@@ -107,7 +116,10 @@ class CoupledSolver(Component):
 
         self.x = self.solver_wrappers[1].get_interface_output().copy()
         self.y = self.solver_wrappers[0].get_interface_output().copy()
+        self.pool_x = InterfacePool(self.x)
+        self.pool_y = InterfacePool(self.y)
         self.predictor.initialize(self.x)
+        self.time_step_controller.initialize(self.delta_t)
 
         if self.solver_level == 0:
             title = '\n╔' + 78 * '═' + f'╗\n║{self.case_name.upper():^78}║\n╚' + 78 * '═' + '╝\n'
@@ -124,6 +136,8 @@ class CoupledSolver(Component):
             self.check_restart_data(self.restart_data)
             if self.restart_predictor:
                 self.predictor.restart(self.restart_data['predictor'])
+            if not self.time_step_controller.dummy and 'time_step_controller' in self.restart_data:
+                self.time_step_controller.restart(self.restart_data['time_step_controller'])
 
         # update save results
         if self.write_results:
@@ -133,13 +147,13 @@ class CoupledSolver(Component):
             if results_data is None:  # no results file to append to
                 self.info = f'{datetime.now().strftime("%Y-%m-%d %H:%M:%S")} : ' \
                             f'start calculation of time step {self.timestep_start_current} on {socket.gethostname()}\n'
+                self.complete_solution_x = InterfaceBlock(self.x, dtype=self.results_precision)
+                self.complete_solution_y = InterfaceBlock(self.y, dtype=self.results_precision)
                 if self.debug:
-                    self.complete_solution_x = np.empty((self.x.get_interface_data().shape[0], 0))
-                    self.complete_solution_y = np.empty((self.y.get_interface_data().shape[0], 0))
-                    self.complete_solution_r = np.empty((self.x.get_interface_data().shape[0], 0))
+                    self.complete_solution_r = InterfaceBlock(self.x, dtype=self.results_precision)
                 else:
-                    self.complete_solution_x = self.x.get_interface_data().reshape(-1, 1)
-                    self.complete_solution_y = self.y.get_interface_data().reshape(-1, 1)
+                    self.complete_solution_x.append(self.x)
+                    self.complete_solution_y.append(self.y)
 
         self.start_run_time = time.time()  # start of calculation
         self.init_time = self.start_run_time - self.start_init_time  # duration of initialization
@@ -151,6 +165,10 @@ class CoupledSolver(Component):
         self.time_step += 1
         self.iteration = 0
 
+        # update time step size, also in the components before their solution step is initialized
+        if not self.time_step_controller.dummy:
+            self.set_delta_t(self.time_step_controller.get_delta_t())
+
         # print time step
         if not self.solver_level:
             self.print_header()
@@ -158,32 +176,64 @@ class CoupledSolver(Component):
         for component in self.components:
             component.initialize_solution_step()
 
-        # update save results
-        if self.write_results:
-            self.residual.append([])
+        self.residual.append([])
 
     def solve_solution_step(self):
         pass
 
+    def solve_solver_wrapper(self, index, interface_input):
+        # input is only copied if required by the solver wrapper
+        # output belongs to the solver wrapper: it is overwritten in the next call, copy it to keep or modify it
+        solver_wrapper = self.solver_wrappers[index]
+        return solver_wrapper.solve_solution_step(tools.get_solver_input(solver_wrapper, interface_input))
+
+    def solve_solver_wrapper_async(self, index, interface_input):
+        # returns a Future of the output, interface_input should not be changed until the Future is done
+        solver_wrapper = self.solver_wrappers[index]
+        return solver_wrapper.solve_solution_step_async(tools.get_solver_input(solver_wrapper, interface_input))
+
+    def set_delta_t(self, delta_t):
+        self.delta_t = delta_t
+        for component in self.components:
+            if hasattr(component, 'set_delta_t'):
+                component.set_delta_t(delta_t)
+
     def finalize_iteration(self, r):
         self.iteration += 1  # increment iteration
-        self.convergence_criterion.update(r.copy())  # update convergence criterion
+        self.convergence_criterion.update(r)  # update convergence criterion
+        self.time_step_controller.update(r)  # update time step controller
         self.print_iteration_info(r)  # print iteration information
         self.output_iteration(r)
 
     @tools.time_save
     def output_iteration(self, r):
+        self.residual[-1].append(r.norm())
+
         # update save results
         if self.write_results:
-            self.residual[self.time_step - self.timestep_start_global - 1].append(r.norm())
             if self.debug:
-                self.complete_solution_x = np.hstack((self.complete_solution_x,
-                                                      self.x.get_interface_data().reshape(-1, 1)))
-                self.complete_solution_y = np.hstack((self.complete_solution_y,
-                                                      self.y.get_interface_data().reshape(-1, 1)))
-                self.complete_solution_r = np.hstack((self.complete_solution_r, r.get_interface_data().reshape(-1, 1)))
+                self.complete_solution_x.append(self.x)
+                self.complete_solution_y.append(self.y)
+                self.complete_solution_r.append(r)
                 self.output_solution_step()
 
+    def save_state(self):
+        # state from which the calculation can be continued with restore_state, also by another instance
+        state = {'time_step': self.time_step, 'x': self.x.get_interface_data(), 'y': self.y.get_interface_data(),
+                 'solver_wrappers': [solver_wrapper.save_state() for solver_wrapper in self.solver_wrappers]}
+        if hasattr(self.predictor, 'save_restart_data'):
+            state['predictor'] = copy.deepcopy(self.predictor.save_restart_data())
+        return state
+
+    def restore_state(self, state):
+        self.time_step = state['time_step']
+        self.x.set_interface_data(state['x'])
+        self.y.set_interface_data(state['y'])
+        for solver_wrapper, solver_wrapper_state in zip(self.solver_wrappers, state['solver_wrappers']):
+            solver_wrapper.restore_state(solver_wrapper_state)
+        if 'predictor' in state:
+            self.predictor.restart(copy.deepcopy(state['predictor']))
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -211,26 +261,26 @@ class CoupledSolver(Component):
 
         # update save results
         self.iterations.append(self.iteration)
+        self.time_step_sizes.append(self.delta_t)
         if self.write_results:
             if not self.debug:
-                self.complete_solution_x = np.hstack((self.complete_solution_x,
-                                                      self.x.get_interface_data().reshape(-1, 1)))
-                self.complete_solution_y = np.hstack((self.complete_solution_y,
-                                                      self.y.get_interface_data().reshape(-1, 1)))
+                self.complete_solution_x.append(self.x)
+                self.complete_solution_y.append(self.y)
 
         # output save results
         if self.write_results != 0 and (self.time_step % self.write_results == 0 or
                                         (self.save_restart != 0 and self.time_step % self.save_restart == 0)):
             self.time_allocation.update(self.get_time_allocation())
-            output = {'solution_x': self.complete_solution_x, 'solution_y': self.complete_solution_y,
+            output = {'solution_x': self.complete_solution_x.array, 'solution_y': self.complete_solution_y.array,
                       'interface_x': self.x, 'interface_y': self.y, 'iterations': self.iterations,
                       'residual': self.residual, 'run_time': self.run_time + self.run_time_previous,
-                      'time_allocation': self.time_allocation, 'delta_t': self.delta_t,
+                      'time_allocation': self.time_allocation, 'delta_t': self.settings['delta_t'],
+                      'time_step_sizes': self.time_step_sizes,
                       'timestep_start': self.timestep_start_global, 'case_name': self.case_name}
             if not self.anonymous:
                 output['info'] = self.info
             if self.debug:
-                output.update({'solution_r': self.complete_solution_r})
+                output.update({'solution_r': self.complete_solution_r.array})
             with open(self.case_name + '_results.pickle', 'wb') as file:
                 pickle.dump(output, file)
 
@@ -263,7 +313,7 @@ class CoupledSolver(Component):
         if new_value != old_value:
             tools.print_info(f'Predictor type changed from "{old_value}" to "{new_value}"', layout='blue')
         extrapolators = ('predictors.constant', 'predictors.linear', 'predictors.quadratic', 'predictors.cubic',
-                         'predictors.legacy')
+                         'predictors.legacy', 'predictors.pod', 'predictors.adaptive')
         if new_value in extrapolators and old_value in extrapolators:
             self.restart_predictor = True
             self.predictor.check_restart_data(restart_data['parameters']['predictor'])  # check settings
@@ -283,8 +333,8 @@ class CoupledSolver(Component):
                     if new_value != old_value:
                         tools.print_info(f'"{coupled_solver_type}" parameter "{key}" changed from {old_value} to '
                                          f'{new_value}', layout='blue')
-        # delta_t
-        if self.delta_t != restart_data['delta_t']:
+        # delta_t, which can only change with a time step controller
+        if self.time_step_controller.dummy and self.delta_t != restart_data['delta_t']:
             raise ValueError(f"Time step size has changed upon restart:\n\told: {restart_data['delta_t']}s"
                              f"\n\tnew: {self.delta_t}s")
         return continue_check
@@ -294,6 +344,8 @@ class CoupledSolver(Component):
         restart_data = {'predictor': self.predictor.save_restart_data(), 'interface_x': self.x, 'interface_y': self.y,
                         'parameters': {key: self.parameters[key] for key in ('type', 'settings', 'predictor')},
                         'delta_t': self.delta_t, 'time_step': self.time_step}
+        if not self.time_step_controller.dummy:
+            restart_data['time_step_controller'] = self.time_step_controller.save_restart_data()
         self.add_restart_data(restart_data)
         return restart_data
 
@@ -312,13 +364,17 @@ class CoupledSolver(Component):
         if self.debug != ('solution_r' in results_data.keys()):
             raise ValueError(f'Value of debug attribute in {self.__class__.__name__} can not be changed upon restart')
         self.timestep_start_global = results_data['timestep_start']
-        self.complete_solution_x = results_data['solution_x'][:, :self.timestep_start_current
-                                                              - self.timestep_start_global + 1]
-        self.complete_solution_y = results_data['solution_y'][:, :self.timestep_start_current
-                                                              - self.timestep_start_global + 1]
         self.x = results_data['interface_x']
         self.y = results_data['interface_y']
+        self.complete_solution_x = InterfaceBlock(self.x, dtype=self.results_precision)
+        self.complete_solution_x.append(results_data['solution_x'][:, :self.timestep_start_current
+                                                                   - self.timestep_start_global + 1])
+        self.complete_solution_y = InterfaceBlock(self.y, dtype=self.results_precision)
+        self.complete_solution_y.append(results_data['solution_y'][:, :self.timestep_start_current
+                                                                   - self.timestep_start_global + 1])
         self.iterations = results_data['iterations'][:self.timestep_start_current - self.timestep_start_global]
+        self.time_step_sizes = results_data.get('time_step_sizes', [results_data['delta_t']] * len(self.iterations))[
+                               :self.timestep_start_current - self.timestep_start_global]
         self.run_time_previous = results_data['run_time']
         self.residual = results_data['residual'][:self.timestep_start_current - self.timestep_start_global]
         self.time_allocation['previous_calculations'] = results_data['time_allocation'].pop('previous_calculations')
@@ -327,7 +383,8 @@ class CoupledSolver(Component):
             f' restart calculation from time step {self.timestep_start_current} on {socket.gethostname()}\n'
         if self.debug:
             tools.print_info(f'Restart in debug mode may not append results to pickle file correctly', layout='warning')
-            self.complete_solution_r = results_data['solution_r']
+            self.complete_solution_r = InterfaceBlock(self.x, dtype=self.results_precision)
+            self.complete_solution_r.append(results_data['solution_r'])
         return results_data
 
     def print_summary(self, time_allocation):
@@ -404,7 +461,8 @@ class CoupledSolver(Component):
         return ''
 
     def print_header(self):
-        header = (80 * '═' + f'\n\tTime step {self.time_step}\n' +
+        time_step_size = '' if self.time_step_controller.dummy else f' (delta_t = {self.delta_t:g}s)'
+        header = (80 * '═' + f'\n\tTime step {self.time_step}{time_step_size}\n' +
                   80 * '═' + f'\n{"Iteration":<16}{"Norm residual":<28}')
         tools.print_info(header, flush=True)
 
@@ -1,6 +1,7 @@
 from coconut import tools
 from coconut.coupling_components.coupled_solvers.coupled_solver import CoupledSolver
 
+import numpy as np
 from scipy.sparse.linalg import gmres, LinearOperator
 
 
@@ -19,9 +20,18 @@ class CoupledSolverIBQN(CoupledSolver):
         self.model_f = tools.create_instance(self.parameters['settings']['model_f'])
         self.model_s = tools.create_instance(self.parameters['settings']['model_s'])
         self.models = [self.model_f, self.model_s]
+        # the inputs x of model_f and y of model_s are preconditioned separately
+        preconditioner_parameters = self.settings.get('preconditioner', {})
+        self.preconditioner_x = tools.create_instance(preconditioner_parameters,
+                                                      'coupled_solvers.preconditioners.dummy_preconditioner')
+        self.preconditioner_y = tools.create_instance(preconditioner_parameters,
+                                                      'coupled_solvers.preconditioners.dummy_preconditioner')
         self.omega = self.settings['omega']
         self.atol = self.settings['absolute_tolerance_gmres']
         self.rtol = self.settings['relative_tolerance_gmres']
+        self.linear_solver = self.settings.get('linear_solver', 'direct')  # 'direct' or 'gmres'
+        if self.linear_solver not in ('direct', 'gmres'):
+            raise ValueError(f'linear_solver "{self.linear_solver}" is not "direct" or "gmres"')
 
         self.xtemp = self.ytemp = None
         self.dxtemp = self.dytemp = None
@@ -48,17 +58,43 @@ class CoupledSolverIBQN(CoupledSolver):
             if self.restart_models[i]:  # restart with the same model type
                 model.restart(self.restart_data[model_name])
             self.components += [model]
+        self.preconditioner_x.initialize(self.x, [self.model_f])
+        self.preconditioner_y.initialize(self.y, [self.model_s])
+        for restart_model, preconditioner_name in zip(self.restart_models, ['preconditioner_x', 'preconditioner_y']):
+            if restart_model and preconditioner_name in self.restart_data:
+                self.__getattribute__(preconditioner_name).restart(self.restart_data[preconditioner_name])
+        self.components += [self.preconditioner_x, self.preconditioner_y]
+
+        if self.linear_solver == 'direct' and not all(hasattr(model, 'get_factors') for model in self.models):
+            tools.print_info('Direct solution not possible with these models: GMRES is used', layout='warning')
+            self.linear_solver = 'gmres'
 
         if self.solver_level == 0:
             self.print_components_info(' ')
 
     def lop_f(self, dx):
         self.dxtemp.set_interface_data(dx.flatten())
-        return self.model_f.predict(self.dxtemp).get_interface_data()
+        return self.model_f.predict(self.preconditioner_x.apply(self.dxtemp)).get_interface_data(copy=False)
 
     def lop_s(self, dy):
         self.dytemp.set_interface_data(dy.flatten())
-        return self.model_s.predict(self.dytemp).get_interface_data()
+        return self.model_s.predict(self.preconditioner_y.apply(self.dytemp)).get_interface_data(copy=False)
+
+    def get_factors(self, model, preconditioner):
+        # factors of the Jacobian approximation with respect to the input before preconditioning
+        a, b = model.get_factors()
+        if preconditioner.dummy:
+            return a, b
+        return a, b * preconditioner.weights.reshape(-1, 1)
+
+    @staticmethod
+    def solve_direct(factors_1, factors_2, b):
+        # solve (I - M1 @ M2) z = b for low-rank M1 = A1 @ B1.T and M2 = A2 @ B2.T with a small dense system:
+        # inv(I - A1 @ C @ B2.T) = I + A1 @ inv(I - C @ D) @ C @ B2.T, with C = B1.T @ A2 and D = B2.T @ A1
+        (a1, b1), (a2, b2) = factors_1, factors_2
+        c = b1.T @ a2
+        d = b2.T @ a1
+        return b + a1 @ np.linalg.solve(np.eye(c.shape[0]) - c @ d, c @ (b2.T @ b))
 
     # noinspection PyMethodMayBeStatic
     def identity_matvec(self, v):
@@ -70,51 +106,74 @@ class CoupledSolverIBQN(CoupledSolver):
     def solve_solution_step(self):
         iu = LinearOperator((self.u, self.u), self.identity_matvec)
         iw = LinearOperator((self.w, self.w), self.identity_matvec)
-        dx = self.x.copy()
-        dy = self.y.copy()
+        dx = self.pool_x.get()
+        dy = self.pool_y.get()
+        ry = self.pool_y.get()
         # initial value
         self.x = self.predictor.predict(self.x)
         # first coupling iteration
-        self.y = yt = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        self.model_f.add(self.x.copy(), yt.copy())
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-        r = xt - self.x
-        self.model_s.add(self.y.copy(), xt)
+        yt = self.solve_solver_wrapper(0, self.x)
+        self.y.set_interface_data(yt.get_interface_data(copy=False))  # self.y is modified in place
+        self.model_f.add(self.preconditioner_x.apply(self.x), yt)
+        xt = self.solve_solver_wrapper(1, self.y)
+        r = xt.subtract(self.x, out=self.pool_x.get())
+        self.preconditioner_x.update(r)
+        self.model_s.add(self.preconditioner_y.apply(self.y), xt)
         self.finalize_iteration(r)
         # coupling iteration loop
         while not self.convergence_criterion.is_satisfied():
             if not self.model_s.is_ready() or not self.model_f.is_ready:
-                dx = self.omega * r
+                self.x.add_scaled(r, self.omega)
+            elif self.linear_solver == 'direct':
+                factors_f = self.get_factors(self.model_f, self.preconditioner_x)
+                factors_s = self.get_factors(self.model_s, self.preconditioner_y)
+                a_s, b_s = factors_s
+                b = r.get_interface_data(copy=False) \
+                    + a_s @ (b_s.T @ yt.subtract(self.y, out=ry).get_interface_data(copy=False))
+                dx.set_interface_data(self.solve_direct(factors_s, factors_f, b))
+                self.x += dx
             else:
                 mf = LinearOperator((self.w, self.u), self.lop_f)
                 ms = LinearOperator((self.u, self.w), self.lop_s)
                 a = iu - ms @ mf
-                b = (xt - self.x).get_interface_data() + ms @ (yt - self.y).get_interface_data()
+                b = r.get_interface_data(copy=False) + ms @ yt.subtract(self.y, out=ry).get_interface_data(copy=False)
                 dx_sol, exitcode = gmres(a, b, tol=self.rtol, atol=self.atol, maxiter=20, callback=self.callback)
                 if exitcode != 0:
                     RuntimeError('GMRES failed')
                 dx.set_interface_data(dx_sol)
-            self.x += dx
-            yt = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-            self.model_f.add(self.x.copy(), yt.copy())
+                self.x += dx
+            yt = self.solve_solver_wrapper(0, self.x)
+            self.model_f.add(self.preconditioner_x.apply(self.x), yt)
+            self.preconditioner_y.update(yt.subtract(self.y, out=ry))
             if not self.model_s.is_ready() or not self.model_f.is_ready:
-                dy = yt - self.y
+                yt.subtract(self.y, out=dy)
+            elif self.linear_solver == 'direct':
+                factors_f = self.get_factors(self.model_f, self.preconditioner_x)
+                factors_s = self.get_factors(self.model_s, self.preconditioner_y)
+                a_f, b_f = factors_f
+                b = yt.subtract(self.y, out=ry).get_interface_data(copy=False) \
+                    + a_f @ (b_f.T @ xt.subtract(self.x, out=r).get_interface_data(copy=False))
+                dy.set_interface_data(self.solve_direct(factors_f, factors_s, b))
             else:
                 a = iw - mf @ ms
-                b = (yt - self.y).get_interface_data() + mf @ (xt - self.x).get_interface_data()
+                b = yt.subtract(self.y, out=ry).get_interface_data(copy=False) \
+                    + mf @ xt.subtract(self.x, out=r).get_interface_data(copy=False)
                 dy_sol, exitcode = gmres(a, b, tol=self.rtol, atol=self.atol, maxiter=20, callback=self.callback)
                 if exitcode != 0:
                     RuntimeError('GMRES failed')
                 dy.set_interface_data(dy_sol)
             self.y += dy
-            xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-            r = xt - self.x
-            self.model_s.add(self.y.copy(), xt)
+            xt = self.solve_solver_wrapper(1, self.y)
+            xt.subtract(self.x, out=r)
+            self.preconditioner_x.update(r)
+            self.model_s.add(self.preconditioner_y.apply(self.y), xt)
             self.finalize_iteration(r)
+        self.pool_x.release(dx, r)
+        self.pool_y.release(dy, ry)
 
     def check_restart_data(self, restart_data, coupled_solver_settings=None):
         continue_check = super().check_restart_data(restart_data, ['omega', 'absolute_tolerance_gmres',
-                                                                   'relative_tolerance_gmres'])
+                                                                   'relative_tolerance_gmres', 'linear_solver'])
         if continue_check:
             for i, model_name in enumerate(['model_f', 'model_s']):
                 old_model_type = restart_data['parameters']['settings'][model_name]['type']
@@ -126,4 +185,6 @@ class CoupledSolverIBQN(CoupledSolver):
                     self.models[i].check_restart_data(restart_data['parameters']['settings'][model_name])
 
     def add_restart_data(self, restart_data):
-        restart_data.update({'model_f': self.model_f.save_restart_data(), 'model_s': self.model_s.save_restart_data()})
+        restart_data.update({'model_f': self.model_f.save_restart_data(), 'model_s': self.model_s.save_restart_data(),
+                             'preconditioner_x': self.preconditioner_x.save_restart_data(),
+                             'preconditioner_y': self.preconditioner_y.save_restart_data()})
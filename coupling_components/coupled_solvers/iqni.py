@@ -14,6 +14,8 @@ class CoupledSolverIQNI(CoupledSolver):
                                  ['timestep_start', 'number_of_timesteps', 'delta_t', 'save_restart'])
 
         self.model = tools.create_instance(self.parameters['settings']['model'])
+        self.preconditioner = tools.create_instance(self.settings.get('preconditioner', {}),
+                                                    'coupled_solvers.preconditioners.dummy_preconditioner')
         self.omega = self.settings['omega']
 
         self.restart_model = False  # indicates if model has to be restarted
@@ -26,7 +28,10 @@ class CoupledSolverIQNI(CoupledSolver):
         self.model.initialize()
         if self.restart_model:  # restart with the same model type
             self.model.restart(self.restart_data['model'])
-        self.components += [self.model]
+        self.preconditioner.initialize(self.x, [self.model])
+        if self.restart_model and 'preconditioner' in self.restart_data:
+            self.preconditioner.restart(self.restart_data['preconditioner'])
+        self.components += [self.model, self.preconditioner]
 
         if self.solver_level == 0:
             self.print_components_info(' ')
@@ -35,24 +40,29 @@ class CoupledSolverIQNI(CoupledSolver):
         # initial value
         self.x = self.predictor.predict(self.x)
         # first coupling iteration
-        self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-        r = xt - self.x
-        self.model.add(r.copy(), xt)
+        self.y = self.solve_solver_wrapper(0, self.x)
+        xt = self.solve_solver_wrapper(1, self.y)
+        r = xt.subtract(self.x, out=self.pool_x.get())
+        self.preconditioner.update(r)
+        self.model.add(self.preconditioner.apply(r), xt)
         self.finalize_iteration(r)
         # coupling iteration loop
         while not self.convergence_criterion.is_satisfied():
             if not self.model.is_ready():
-                dx = self.omega * r
+                self.x.add_scaled(r, self.omega)
             else:
-                dr = -1 * r
-                dx = self.model.predict(dr.copy()) - dr
-            self.x += dx
-            self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-            xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-            r = xt - self.x
-            self.model.add(r.copy(), xt)
+                dr = r.multiply(-1, out=self.pool_x.get())
+                dx = self.model.predict(self.preconditioner.apply(dr))
+                dx -= dr
+                self.x += dx
+                self.pool_x.release(dr)
+            self.y = self.solve_solver_wrapper(0, self.x)
+            xt = self.solve_solver_wrapper(1, self.y)
+            xt.subtract(self.x, out=r)
+            self.preconditioner.update(r)
+            self.model.add(self.preconditioner.apply(r), xt)
             self.finalize_iteration(r)
+        self.pool_x.release(r)
 
     def check_restart_data(self, restart_data, coupled_solver_settings=None):
         continue_check = super().check_restart_data(restart_data, ['omega'])
@@ -66,4 +76,5 @@ class CoupledSolverIQNI(CoupledSolver):
                 self.model.check_restart_data(restart_data['parameters']['settings']['model'])
 
     def add_restart_data(self, restart_data):
-        restart_data.update({'model': self.model.save_restart_data()})
+        restart_data.update({'model': self.model.save_restart_data(),
+                             'preconditioner': self.preconditioner.save_restart_data()})
@@ -22,6 +22,8 @@ class CoupledSolverIQNISM(CoupledSolver):
                                  ['timestep_start', 'number_of_timesteps', 'delta_t', 'save_restart'])
 
         self.model = tools.create_instance(self.settings['model'])
+        self.preconditioner = tools.create_instance(self.settings.get('preconditioner', {}),
+                                                    'coupled_solvers.preconditioners.dummy_preconditioner')
         self.settings['surrogate']['type'] = self.settings['surrogate'].get('type',
                                                                             'coupled_solvers.models.dummy_model')
         self.surrogate = tools.create_instance(self.settings['surrogate'], 'models.dummy_model')
@@ -56,8 +58,11 @@ class CoupledSolverIQNISM(CoupledSolver):
             self.model.restart(self.restart_data['model'])
         if restart_surrogate:  # restart with the same surrogate type
             self.surrogate.restart(self.restart_data['surrogate'])
+        self.preconditioner.initialize(self.x, [self.model])  # the surrogate is not preconditioned
+        if restart_model and 'preconditioner' in self.restart_data:
+            self.preconditioner.restart(self.restart_data['preconditioner'])
 
-        self.components += [self.model, self.surrogate]
+        self.components += [self.model, self.surrogate, self.preconditioner]
 
         # set initial surrogate value in surrogate predictor
         if self.surrogate.provides_get_solution and not self.restart:
@@ -79,35 +84,42 @@ class CoupledSolverIQNISM(CoupledSolver):
         # initial value
         self.x = self.predictor.predict(self.x)
         # first coupling iteration
-        self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-        r = xt - self.x
-        self.model.add(r.copy(), xt.copy())
-        self.surrogate.add(r.copy(), xt)  # only used when derivative info of surrogate is updated every iteration
+        self.y = self.solve_solver_wrapper(0, self.x)
+        xt = self.solve_solver_wrapper(1, self.y)
+        r = xt.subtract(self.x, out=self.pool_x.get())
+        self.preconditioner.update(r)
+        self.model.add(self.preconditioner.apply(r), xt)
+        self.surrogate.add(r, xt)  # only used when derivative info of surrogate is updated every iteration
         self.finalize_iteration(r)
         # coupling iteration loop
         while not self.convergence_criterion.is_satisfied():
-            dr = -1 * r
+            dr = r.multiply(-1, out=self.pool_x.get())
             if not self.model.is_ready():
                 if not self.surrogate.is_ready():
-                    dx = -self.omega * dr
+                    self.x.add_scaled(r, self.omega)
                 else:
-                    dx = self.surrogate.predict(dr.copy(), modes=self.surrogate_modes) - dr
+                    dx = self.surrogate.predict(dr, modes=self.surrogate_modes)
+                    dx -= dr
                     # relax other modes
-                    dx -= (self.omega - 1.0) * self.surrogate.filter_q(dr.copy(), modes=self.surrogate_modes)
+                    dx.add_scaled(self.surrogate.filter_q(dr, modes=self.surrogate_modes), 1.0 - self.omega)
+                    self.x += dx
             else:
-                if not self.surrogate.is_ready():
-                    dx = self.model.predict(dr.copy()) - dr
-                else:
-                    dx = self.model.predict(dr.copy()) + self.surrogate.predict(self.model.filter_q(dr.copy()),
-                                                                                modes=self.surrogate_modes) - dr
-            self.x += dx
-            self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-            xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-            r = xt - self.x
-            self.model.add(r.copy(), xt.copy())
-            self.surrogate.add(r.copy(), xt)  # only used when derivative information of surrogate is function of x
+                dr_preconditioned = self.preconditioner.apply(dr)
+                dx = self.model.predict(dr_preconditioned)
+                if self.surrogate.is_ready():
+                    dr_filtered = self.preconditioner.revert(self.model.filter_q(dr_preconditioned))
+                    dx += self.surrogate.predict(dr_filtered, modes=self.surrogate_modes)
+                dx -= dr
+                self.x += dx
+            self.pool_x.release(dr)
+            self.y = self.solve_solver_wrapper(0, self.x)
+            xt = self.solve_solver_wrapper(1, self.y)
+            xt.subtract(self.x, out=r)
+            self.preconditioner.update(r)
+            self.model.add(self.preconditioner.apply(r), xt)
+            self.surrogate.add(r, xt)  # only used when derivative information of surrogate is function of x
             self.finalize_iteration(r)
+        self.pool_x.release(r)
         # synchronize
         if self.surrogate_synchronize and self.surrogate.provides_set_solution:
             self.surrogate.set_solution(self.x.copy())
@@ -126,7 +138,8 @@ class CoupledSolverIQNISM(CoupledSolver):
                 self.model.check_restart_data(restart_data['parameters']['settings']['model'])
 
     def add_restart_data(self, restart_data):
-        restart_data.update({'model': self.model.save_restart_data(), 'surrogate': self.surrogate.save_restart_data()})
+        restart_data.update({'model': self.model.save_restart_data(), 'surrogate': self.surrogate.save_restart_data(),
+                             'preconditioner': self.preconditioner.save_restart_data()})
 
     def add_time_allocation(self, time_allocation):
         if hasattr(self.surrogate, 'get_time_allocation'):
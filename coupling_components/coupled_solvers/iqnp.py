@@ -0,0 +1,161 @@
+from coconut import tools
+from coconut.tools import create_instance
+from coconut.coupling_components.coupled_solvers.coupled_solver import CoupledSolver
+from coconut.data_structure import Model, Interface, InterfacePool
+
+import numpy as np
+import time
+
+
+def create(parameters):
+    return CoupledSolverIQNP(parameters)
+
+
+class CoupledSolverIQNP(CoupledSolver):
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        tools.pass_on_parameters(self.settings, self.settings['model']['settings'],
+                                 ['timestep_start', 'number_of_timesteps', 'delta_t', 'save_restart'])
+
+        self.model = tools.create_instance(self.parameters['settings']['model'])
+        self.omega = self.settings['omega']
+        self.scaling = list(self.settings.get('scaling', [None, None]))  # scaling of x and y, None if automatic
+
+        self.predictor_y = create_instance(self.parameters['predictor'], 'predictors.dummy_predictor')
+        self.components.insert(1, self.predictor_y)
+
+        self.z = None  # stacked interface with the scaled x and y
+        self.zt = None
+        self.pool_z = None  # scratch interfaces with layout of z
+        self.solve_time = 0  # wall time of the parallel solver calls
+
+        self.restart_model = False  # indicates if model has to be restarted
+
+    def initialize(self):
+        super().initialize(print_components=False)
+
+        self.z = self.create_stacked_interface(self.x, self.y)
+        self.zt = self.z.copy()
+        self.pool_z = InterfacePool(self.z)
+        self.model.size_in = self.model.size_out = self.z.size
+        self.model.out = self.z.copy()
+        self.model.initialize()
+        self.predictor_y.initialize(self.y)
+        if self.restart:
+            if 'scaling' not in self.settings:  # information in model is scaled with the same factors
+                self.scaling = self.restart_data.get('scaling', self.scaling)
+            if self.restart_predictor and 'predictor_y' in self.restart_data:
+                self.predictor_y.restart(self.restart_data['predictor_y'])
+            if self.restart_model:  # restart with the same model type
+                self.model.restart(self.restart_data['model'])
+        self.components += [self.model]
+
+        if self.solver_level == 0:
+            self.print_components_info(' ')
+
+    @staticmethod
+    def create_stacked_interface(x, y):
+        # interface with the data of x followed by the data of y, on copies of the model parts with prefixed names
+        model = Model()
+        parameters = []
+        for prefix, interface in (('x_', x), ('y_', y)):
+            for model_part_dict in interface.parameters:
+                model_part_name = model_part_dict['model_part']
+                model_part = interface.get_model_part(model_part_name)
+                model.create_model_part(prefix + model_part_name, model_part.x0, model_part.y0, model_part.z0,
+                                        model_part.id)
+                parameters.append({'model_part': prefix + model_part_name,
+                                   'variables': model_part_dict['variables']})
+        return Interface(parameters, model)
+
+    def stack(self, x, y, out):
+        sx, sy = (scaling or 1. for scaling in self.scaling)
+        data = out.get_interface_data(copy=False)
+        data[:x.size] = x.get_interface_data(copy=False) / sx
+        data[x.size:] = y.get_interface_data(copy=False) / sy
+        return out
+
+    def unstack(self, z):
+        sx, sy = (scaling or 1. for scaling in self.scaling)
+        data = z.get_interface_data(copy=False)
+        self.x.set_interface_data(data[:self.x.size] * sx)
+        self.y.set_interface_data(data[self.x.size:] * sy)
+
+    def update_scaling(self, xt, yt):
+        # undetermined scaling factors are set to the root mean square of the first non-zero output
+        for i, interface in enumerate((xt, yt)):
+            if self.scaling[i] is None and interface.norm() > 0.:
+                self.scaling[i] = float(interface.norm() / np.sqrt(interface.size))
+        return None not in self.scaling
+
+    def solve_solver_wrappers(self):
+        # both solver wrappers are solved at the same time, the first one asynchronously
+        start_time = time.time()
+        future = self.solve_solver_wrapper_async(0, self.x)
+        xt = self.solve_solver_wrapper(1, self.y)
+        yt = future.result()
+        self.solve_time += time.time() - start_time
+        return xt, yt
+
+    def solve_solution_step(self):
+        rz = self.pool_z.get()
+        r = self.pool_z.get()
+        dr = self.pool_z.get()
+        # initial value
+        self.x = self.predictor.predict(self.x)
+        self.y = self.predictor_y.predict(self.y)
+        # coupling iteration loop
+        while True:
+            xt, yt = self.solve_solver_wrappers()
+            scaled = self.update_scaling(xt, yt)
+            self.stack(xt, yt, self.zt).subtract(self.stack(self.x, self.y, self.z), out=rz)
+            if scaled:  # relaxation is used until the scaling is known, it does not depend on the scaling
+                self.model.add(rz, self.zt)
+            rz.multiply(self.scaling[0] or 1., out=r)  # residual of x and y, in the units of x
+            self.finalize_iteration(r)
+            if self.convergence_criterion.is_satisfied():
+                break
+            if not self.model.is_ready():
+                self.z.add_scaled(rz, self.omega)
+            else:
+                rz.multiply(-1., out=dr)
+                dz = self.model.predict(dr)
+                dz -= dr
+                self.z += dz
+            self.unstack(self.z)
+        self.pool_z.release(rz, r, dr)
+
+    @tools.time_save
+    def output_iteration(self, r):
+        # the norm of the stacked residual is saved, in debug mode only the part corresponding to x is saved
+        self.residual[-1].append(r.norm())
+        if self.write_results:
+            if self.debug:
+                self.complete_solution_x.append(self.x)
+                self.complete_solution_y.append(self.y)
+                self.complete_solution_r.append(r.get_interface_data(copy=False)[:self.x.size])
+                self.output_solution_step()
+
+    def finalize_solution_step(self):
+        self.predictor_y.update(self.y)
+        super().finalize_solution_step()
+
+    def check_restart_data(self, restart_data, coupled_solver_settings=None):
+        continue_check = super().check_restart_data(restart_data, ['omega', 'scaling'])
+        if continue_check:
+            old_model_type = restart_data['parameters']['settings']['model']['type']
+            new_model_type = self.parameters['settings']['model']['type']
+            if new_model_type != old_model_type:
+                tools.print_info(f'Model type changed from "{old_model_type}" to "{new_model_type}"', layout='blue')
+            else:
+                self.restart_model = True
+                self.model.check_restart_data(restart_data['parameters']['settings']['model'])
+
+    def add_restart_data(self, restart_data):
+        restart_data.update({'model': self.model.save_restart_data(), 'scaling': self.scaling,
+                             'predictor_y': self.predictor_y.save_restart_data()})
+
+    def add_time_allocation(self, time_allocation):
+        # the solver wrappers run at the same time, so the coupling time is the run time minus their wall time
+        time_allocation['run_time']['coupling'] = self.run_time - self.solve_time
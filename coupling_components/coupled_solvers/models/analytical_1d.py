@@ -66,6 +66,10 @@ class ModelAnalytical1D(Component):
         if not self.update_every_iteration:
             self.jit = self.get_inverse_jacobian()
 
+    def set_delta_t(self, delta_t):
+        for solver_model in self.solver_models:
+            solver_model.set_delta_t(delta_t)
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -1,8 +1,9 @@
 from coconut.coupling_components.component import Component
+from coconut.data_structure import InterfaceBlock
 from coconut import tools
 
 import numpy as np
-from scipy.linalg import solve_triangular
+from scipy.linalg import solve_triangular, qr_insert, qr_delete, LinAlgError
 
 
 def create(parameters):
@@ -16,6 +17,7 @@ class ModelLS(Component):
         self.settings = parameters['settings']
         self.min_significant = self.settings['min_significant']
         self.q = self.settings['q']
+        self.precision = tools.get_precision(self.settings)  # storage precision of vprev and wprev
 
         self.size_in = None  # set by coupled solver
         self.size_out = None  # set by coupled solver
@@ -23,69 +25,121 @@ class ModelLS(Component):
         self.added = False
         self.rref = None
         self.xtref = None
-        self.vcurr = None
-        self.wcurr = None
+        self.vcurr_block = None  # InterfaceBlocks are created when the first differences are added
+        self.wcurr_block = None
         self.vprev = None
         self.wprev = None
+        self.qq = None  # economic QR decomposition of V = [vcurr, vprev[0], vprev[1], ...], updated incrementally
+        self.rr = None
+        self.factors = None  # cached low-rank factors of the Jacobian approximation, reset when V changes
+
+    @property
+    def vcurr(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_in, 0)) if self.vcurr_block is None else self.vcurr_block.array
+
+    @property
+    def wcurr(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_out, 0)) if self.wcurr_block is None else self.wcurr_block.array
 
     def initialize(self):
         super().initialize()
 
-        self.vprev = [np.empty((self.size_in, 0))]
-        self.wprev = [np.empty((self.size_out, 0))]
+        self.vprev = [np.empty((self.size_in, 0), dtype=self.precision)]
+        self.wprev = [np.empty((self.size_out, 0), dtype=self.precision)]
+
+    @property
+    def n_columns(self):
+        return self.vcurr.shape[1] + sum(v.shape[1] for v in self.vprev)
+
+    def get_v(self):
+        return np.hstack((self.vcurr, np.hstack(self.vprev)))
+
+    def get_qr(self):
+        # QR decomposition of V in float64, only calculated from scratch if it could not be updated
+        if self.qq is None:
+            self.qq, self.rr = np.linalg.qr(self.get_v().astype(float, copy=False), mode='reduced')
+        return self.qq, self.rr
+
+    def insert_qr(self, v):
+        # update QR decomposition after prepending column v to V, with Givens rotations in O(n*k)
+        self.factors = None
+        if self.qq is None or self.rr.shape[0] != self.rr.shape[1] or self.rr.shape[1] >= self.size_in:
+            self.qq = self.rr = None  # more columns than rows: decomposition is calculated from scratch
+            return
+        try:
+            self.qq, self.rr = qr_insert(self.qq, self.rr, v.astype(float, copy=False).ravel(), 0, which='col')
+        except LinAlgError:  # v lies in the span of V
+            self.qq = self.rr = None
+
+    def delete_qr(self, i):
+        # update QR decomposition after removing column i from V, with Givens rotations in O(n*k)
+        self.factors = None
+        if self.qq is None or self.rr.shape[0] != self.rr.shape[1]:
+            self.qq = self.rr = None
+            return
+        k = self.rr.shape[1] - 1
+        qq, rr = qr_delete(self.qq, self.rr, i, which='col')
+        self.qq, self.rr = qq[:, :k], rr[:k]  # square Q is returned as a full decomposition
+
+    def delete_column(self, i):
+        # remove column i from V and W
+        if i < self.vcurr.shape[1]:
+            self.vcurr_block.delete(i)
+            self.wcurr_block.delete(i)
+        else:
+            num_columns = self.vcurr.shape[1]
+            j = -1
+            while i >= num_columns:
+                j += 1
+                num_columns += self.vprev[j].shape[1]
+            num_columns -= self.vprev[j].shape[1]
+            self.vprev[j] = np.delete(self.vprev[j], i - num_columns, 1)
+            self.wprev[j] = np.delete(self.wprev[j], i - num_columns, 1)
+        self.delete_qr(i)
 
     def filter(self):
-        v = np.hstack((self.vcurr, np.hstack(self.vprev)))
-        if not v.shape[1]:
+        if not self.n_columns:
             raise RuntimeError('No information to filter')
         # remove columns resulting in small diagonal elements in R
-        singular = True
-        while singular and v.shape[1]:
-            rr = np.linalg.qr(v, mode='r')
-            diag = np.diagonal(rr)
-            m = min(abs(diag))
-            if m < self.min_significant:
-                i = np.argmin(abs(diag))
-                tools.print_info(f'Removing column {i}: {m} < min_significant', layout='info')
-                if i < self.vcurr.shape[1]:
-                    self.vcurr = np.delete(self.vcurr, i, 1)
-                    self.wcurr = np.delete(self.wcurr, i, 1)
-                else:
-                    num_columns = self.vcurr.shape[1]
-                    j = -1
-                    while i >= num_columns:
-                        j += 1
-                        num_columns += self.vprev[j].shape[1]
-                    num_columns -= self.vprev[j].shape[1]
-                    self.vprev[j] = np.delete(self.vprev[j], i - num_columns, 1)
-                    self.wprev[j] = np.delete(self.wprev[j], i - num_columns, 1)
-                v = np.hstack((self.vcurr, np.hstack(self.vprev)))
-            else:
-                singular = False
+        while self.n_columns:
+            _, rr = self.get_qr()
+            diag = abs(np.diagonal(rr))
+            i = np.argmin(diag)
+            if diag[i] >= self.min_significant:
+                break
+            tools.print_info(f'Removing column {i}: {diag[i]} < min_significant', layout='info')
+            self.delete_column(i)
         # remove columns if number of columns exceeds number of rows
-        while v.shape[0] < v.shape[1]:
+        while self.size_in < self.n_columns:
             if self.vcurr.shape[0] < self.vcurr.shape[1]:
-                self.vcurr = np.delete(self.vcurr, -1, 1)
-                self.wcurr = np.delete(self.wcurr, -1, 1)
+                self.delete_column(self.vcurr.shape[1] - 1)
             else:
                 i = -1
                 while self.vprev[i].shape[1] == 0:
                     i -= 1
-                self.vprev[i] = np.delete(self.vprev[i], -1, 1)
-                self.wprev[i] = np.delete(self.wprev[i], -1, 1)
+                self.delete_column(self.n_columns - 1)
                 tools.print_info(f'Removing column {i}: too many columns', layout='warning')
-            v = np.hstack((self.vcurr, np.hstack(self.vprev)))
 
     def predict(self, dr_in, modes=None):
-        dr = dr_in.get_interface_data().reshape(-1, 1)
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
         self.filter()
-        v = np.hstack((limit(self.vcurr, modes), np.hstack([limit(v, modes) for v in self.vprev])))
-        w = np.hstack((limit(self.wcurr, modes), np.hstack([limit(w, modes) for w in self.wprev])))
-        if not v.shape[1]:
+        if modes is None:
+            n_columns = self.n_columns
+            w = np.hstack((self.wcurr, np.hstack(self.wprev)))
+        else:
+            v = np.hstack((limit(self.vcurr, modes), np.hstack([limit(v, modes) for v in self.vprev])))
+            w = np.hstack((limit(self.wcurr, modes), np.hstack([limit(w, modes) for w in self.wprev])))
+            n_columns = v.shape[1]
+        if not n_columns:
             tools.print_info('Least-squares model has no information to predict: zero returned', layout='warning')
             return dr_in * 0
         # approximation for the inverse of the Jacobian from a least-squares model
-        qq, rr = np.linalg.qr(v, mode='reduced')
+        if modes is None:
+            qq, rr = self.get_qr()
+        else:
+            qq, rr = np.linalg.qr(v.astype(float, copy=False), mode='reduced')
         b = qq.T @ dr
         c = solve_triangular(rr, b)
         dxt = w @ c
@@ -93,6 +147,17 @@ class ModelLS(Component):
         dxt_out.set_interface_data(dxt.flatten())
         return dxt_out
 
+    def get_factors(self):
+        # factors A and B of the Jacobian approximation N = A @ B.T, with A = W @ inv(R) and B = Q
+        if not self.n_columns:
+            return np.empty((self.size_out, 0)), np.empty((self.size_in, 0))
+        self.filter()
+        if self.factors is None:
+            qq, rr = self.get_qr()
+            w = np.hstack((self.wcurr, np.hstack(self.wprev))).astype(float, copy=False)
+            self.factors = (solve_triangular(rr, w.T, trans='T').T, qq)
+        return self.factors
+
     def add(self, r_in, xt_in):
         r = r_in.get_interface_data().reshape(-1, 1)
         xt = xt_in.get_interface_data().reshape(-1, 1)
@@ -100,55 +165,74 @@ class ModelLS(Component):
             dr = r - self.rref
             dxt = xt - self.xtref
             # Update V and W matrices
-            self.vcurr = np.hstack((dr, self.vcurr))
-            self.wcurr = np.hstack((dxt, self.wcurr))
+            self.vcurr_block.prepend(dr)
+            self.wcurr_block.prepend(dxt)
+            self.insert_qr(dr)
         else:
             self.added = True
+            self.vcurr_block = InterfaceBlock(r_in)
+            self.wcurr_block = InterfaceBlock(xt_in)
         self.rref = r
         self.xtref = xt
 
     def is_ready(self):
-        v = np.hstack((self.vcurr, np.hstack(self.vprev)))
-        return v.shape[1]
+        return self.n_columns
 
     def initialize_solution_step(self):
         super().initialize_solution_step()
 
         self.rref = None
         self.xtref = None
-        self.vcurr = np.empty((self.size_in, 0))
-        self.wcurr = np.empty((self.size_out, 0))
+        self.vcurr_block = None
+        self.wcurr_block = None
         self.added = False
 
         while len(self.vprev) > max(self.q, 1):  # for q = 0, there is one item: an empty array
             self.vprev.pop()
             self.wprev.pop()
+        self.qq = None  # decomposition is calculated from scratch once per time step, as upon restart
+        self.rr = None
+        self.factors = None
 
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
         if self.q > 0:
-            self.vprev = [self.vcurr] + self.vprev
-            self.wprev = [self.wcurr] + self.wprev
+            self.vprev = [self.vcurr.astype(self.precision)] + self.vprev  # compact copy of the InterfaceBlock
+            self.wprev = [self.wcurr.astype(self.precision)] + self.wprev
 
     def filter_q(self, dr_in, modes=None):
-        dr = dr_in.get_interface_data().reshape(-1, 1)
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
         dr_out = dr_in.copy()
-        v = np.hstack((limit(self.vcurr, modes), np.hstack([limit(v, modes) for v in self.vprev])))
-        if v.shape[1]:
-            qq, *_ = np.linalg.qr(v, mode='reduced')
+        if modes is None:
+            qq, _ = self.get_qr()
+        else:
+            v = np.hstack((limit(self.vcurr, modes), np.hstack([limit(v, modes) for v in self.vprev])))
+            qq, *_ = np.linalg.qr(v.astype(float, copy=False), mode='reduced')
+        if qq.shape[1]:
             dr = dr - qq @ (qq.T @ dr)
             dr_out.set_interface_data(dr.flatten())
         return dr_out
 
+    def scale_input(self, factors):
+        # the input is multiplied element-wise with factors from now on, the stored differences are scaled accordingly
+        factors = factors.reshape(-1, 1)
+        if self.vcurr_block is not None:
+            self.vcurr_block.array[:] *= factors
+        if self.rref is not None:
+            self.rref = self.rref * factors
+        self.vprev = [(v * factors).astype(self.precision) for v in self.vprev]
+        self.qq = self.rr = self.factors = None
+
     def restart(self, restart_data):
         if self.q != 0:
-            self.vprev = restart_data['vprev']
-            self.wprev = restart_data['wprev']
+            self.vprev = [v.astype(self.precision, copy=False) for v in restart_data['vprev']]
+            self.wprev = [w.astype(self.precision, copy=False) for w in restart_data['wprev']]
+            self.qq = self.rr = self.factors = None
 
     def check_restart_data(self, restart_data):
         model_type = restart_data['type']
-        for key in ['min_significant', 'q']:
+        for key in ['min_significant', 'q', 'precision']:
             new_value = self.settings.get(key)
             old_value = restart_data['settings'].get(key)
             if new_value != old_value:
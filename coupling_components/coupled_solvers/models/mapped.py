@@ -102,6 +102,10 @@ class ModelMapped(Component):
         self.mapper_interface_output(interface_output_from, self.interface_output_to)
         return self.interface_output_to.copy()
 
+    def set_delta_t(self, delta_t):
+        if hasattr(self.surrogate, 'set_delta_t'):
+            self.surrogate.set_delta_t(delta_t)
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
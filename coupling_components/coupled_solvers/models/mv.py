@@ -1,4 +1,5 @@
 from coconut.coupling_components.component import Component
+from coconut.data_structure import InterfaceBlock
 from coconut import tools
 
 import numpy as np
@@ -14,6 +15,7 @@ class ModelMV(Component):
 
         self.settings = parameters['settings']
         self.min_significant = self.settings.get('min_significant', 0)
+        self.precision = tools.get_precision(self.settings)  # storage precision of nprev
 
         self.size_in = None  # set by coupled solver
         self.size_out = None  # set by coupled solver
@@ -21,15 +23,25 @@ class ModelMV(Component):
         self.added = False
         self.rref = None
         self.xtref = None
-        self.v = None
-        self.w = None
+        self.v_block = None  # InterfaceBlocks are created when the first differences are added
+        self.w_block = None
         self.ncurr = None
         self.nprev = None
 
+    @property
+    def v(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_in, 0)) if self.v_block is None else self.v_block.array
+
+    @property
+    def w(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_out, 0)) if self.w_block is None else self.w_block.array
+
     def initialize(self):
         super().initialize()
 
-        self.nprev = np.zeros((self.size_out, self.size_in))
+        self.nprev = np.zeros((self.size_out, self.size_in), dtype=self.precision)
 
     def filter(self):
         if self.v.shape[1] == 0:
@@ -43,17 +55,17 @@ class ModelMV(Component):
             if m < self.min_significant:
                 i = np.argmin(abs(diag))
                 tools.print_info(f'Removing column {i}: {m} < minsignificant', layout='warning')
-                self.v = np.delete(self.v, i, 1)
-                self.w = np.delete(self.w, i, 1)
+                self.v_block.delete(i)
+                self.w_block.delete(i)
             else:
                 singular = False
         # remove columns if number of columns exceeds number of rows
         if self.v.shape[0] < self.v.shape[1]:
-            self.v = np.delete(self.v, -1, 1)
-            self.w = np.delete(self.w, -1, 1)
+            self.v_block.delete(-1)
+            self.w_block.delete(-1)
 
     def predict(self, dr_in, modes=None):
-        dr = dr_in.get_interface_data().reshape(-1, 1)
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
         if modes == 0:
             tools.print_info("Jacobian of model MV disabled: zero returned", layout='warning')
             return dr_in * 0
@@ -74,13 +86,15 @@ class ModelMV(Component):
             dr = r - self.rref
             dxt = xt - self.xtref
             # update V and W matrices
-            self.v = np.hstack((dr, self.v))
-            self.w = np.hstack((dxt, self.w))
+            self.v_block.prepend(dr)
+            self.w_block.prepend(dxt)
             self.filter()
             # update of the matrix N
             self.ncurr = self.nprev + (self.w - self.nprev @ self.v) @ np.linalg.inv(self.v.T @ self.v) @ self.v.T
         else:
             self.added = True
+            self.v_block = InterfaceBlock(r_in)
+            self.w_block = InterfaceBlock(xt_in)
         self.rref = r
         self.xtref = xt
 
@@ -92,17 +106,17 @@ class ModelMV(Component):
 
         self.rref = None
         self.xtref = None
-        self.v = np.empty((self.size_in, 0))
-        self.w = np.empty((self.size_out, 0))
+        self.v_block = None
+        self.w_block = None
         self.added = False
 
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
-        self.nprev = self.ncurr
+        self.nprev = self.ncurr if self.ncurr is None else self.ncurr.astype(self.precision, copy=False)
 
     def filter_q(self, dr_in, modes=None):
-        dr = dr_in.get_interface_data().reshape(-1, 1)
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
         dr_out = dr_in.copy()
         if modes == 0:
             pass  # return copy of dr_in
@@ -115,12 +129,26 @@ class ModelMV(Component):
         dr_out.set_interface_data(dr.flatten())
         return dr_out
 
+    def scale_input(self, factors):
+        # the input is multiplied element-wise with factors from now on, the stored information is scaled accordingly
+        factors = factors.reshape(-1, 1)
+        if self.v_block is not None:
+            self.v_block.array[:] *= factors
+        if self.rref is not None:
+            self.rref = self.rref * factors
+        if self.ncurr is not None:
+            self.ncurr = self.ncurr / factors.T
+        if self.nprev is not None:
+            self.nprev = (self.nprev / factors.T).astype(self.precision)
+
     def restart(self, restart_data):
         self.nprev = restart_data['nprev']
+        if self.nprev is not None:
+            self.nprev = self.nprev.astype(self.precision, copy=False)
 
     def check_restart_data(self, restart_data):
         model_type = restart_data['type']
-        for key in ['min_significant']:
+        for key in ['min_significant', 'precision']:
             new_value = self.settings.get(key)
             old_value = restart_data['settings'].get(key)
             if new_value != old_value:
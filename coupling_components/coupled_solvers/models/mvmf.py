@@ -1,4 +1,5 @@
 from coconut.coupling_components.component import Component
+from coconut.data_structure import InterfaceBlock
 from coconut import tools
 
 import numpy as np
@@ -16,6 +17,9 @@ class ModelMVMF(Component):
         self.settings = parameters['settings']
         self.min_significant = self.settings.get('min_significant', 0)
         self.q = self.settings['q']
+        self.precision = tools.get_precision(self.settings)  # storage precision of wprev and qqprev
+        self.max_columns = self.settings.get('max_columns')  # memory budget in number of stored columns
+        self.max_memory = self.settings.get('max_memory')  # memory budget in MB
 
         self.size_in = None  # set by coupled solver
         self.size_out = None  # set by coupled solver
@@ -23,11 +27,24 @@ class ModelMVMF(Component):
         self.added = False
         self.rref = None
         self.xtref = None
-        self.v = None
-        self.w = None
+        self.v_block = None  # InterfaceBlocks are created when the first differences are added
+        self.w_block = None
         self.wprev = None
         self.rrprev = None
         self.qqprev = None
+        self.qq = None  # cached QR decomposition of V, reset when V changes
+        self.rr = None
+        self.factors = None  # cached low-rank factors of the Jacobian approximation
+
+    @property
+    def v(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_in, 0)) if self.v_block is None else self.v_block.array
+
+    @property
+    def w(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_out, 0)) if self.w_block is None else self.w_block.array
 
     def initialize(self):
         super().initialize()
@@ -36,26 +53,37 @@ class ModelMVMF(Component):
         self.rrprev = []
         self.qqprev = []
 
+    def get_qr(self):
+        # QR decomposition of V, only calculated once between two changes of V
+        if self.qq is None:
+            self.qq, self.rr = np.linalg.qr(self.v, mode='reduced')
+        return self.qq, self.rr
+
+    def reset_qr(self):
+        self.qq = self.rr = self.factors = None
+
     def filter(self):
         if self.v.shape[1] == 0:
             raise RuntimeError('No information to filter')
         # remove columns resulting in small diagonal elements in R
         singular = True
         while singular and self.v.shape[1]:
-            rr = np.linalg.qr(self.v, mode='r')
+            _, rr = self.get_qr()
             diag = np.diagonal(rr)
             m = min(abs(diag))
             if m < self.min_significant:
                 i = np.argmin(abs(diag))
                 tools.print_info(f'Removing column {i}: {m} < minsignificant', layout='info')
-                self.v = np.delete(self.v, i, 1)
-                self.w = np.delete(self.w, i, 1)
+                self.v_block.delete(i)
+                self.w_block.delete(i)
+                self.reset_qr()
             else:
                 singular = False
         # remove columns if number of columns exceeds number of rows
         if self.v.shape[0] < self.v.shape[1]:
-            self.v = np.delete(self.v, -1, 1)
-            self.w = np.delete(self.w, -1, 1)
+            self.v_block.delete(-1)
+            self.w_block.delete(-1)
+            self.reset_qr()
 
     def predict(self, dr_in, modes=None):
         dr = dr_in.get_interface_data().reshape(-1, 1)
@@ -70,7 +98,7 @@ class ModelMVMF(Component):
             raise RuntimeError('No information to predict')
         # approximation for the inverse of the Jacobian from a multiple vector model
         if self.v.shape[1]:
-            qq, rr = np.linalg.qr(self.v, mode='reduced')
+            qq, rr = self.get_qr()
             b = qq.T @ dr
             c = solve_triangular(rr, b)
             dxt = self.w @ c
@@ -96,6 +124,48 @@ class ModelMVMF(Component):
         dxt_out.set_interface_data(dxt.flatten())
         return dxt_out
 
+    def multiply_prev(self, x, start=0):
+        # contribution of the previous time steps start, start + 1, ... to N @ x, x is overwritten by the remainder
+        y = np.zeros((self.size_out, x.shape[1]))
+        for w, rr, qq in zip(self.wprev[start:], self.rrprev[start:], self.qqprev[start:]):
+            if w.shape[1]:
+                b = qq.T @ x
+                y += w @ solve_triangular(rr, b)
+                x -= qq @ b
+        return y
+
+    def get_factors(self):
+        # factors A and B of the Jacobian approximation N = A @ B.T, with B = [Q, Qprev[0], Qprev[1], ...]
+        # the coefficients c_i = inv(R_i) @ Q_i.T @ x_i of the time steps, with x_i the remainder after the more recent
+        # time steps, satisfy L @ R @ c = B.T @ x, with R block diagonal and L block unit lower triangular
+        if self.v.shape[1] > 1:
+            self.filter()
+        if self.factors is None:
+            qq, rr = self.get_qr()
+            qqs = [qq] + self.qqprev
+            rrs = [rr] + self.rrprev
+            bb = np.hstack(qqs).astype(float, copy=False)
+            if not bb.shape[1]:
+                self.factors = (np.empty((self.size_out, 0)), bb)
+                return self.factors
+            ll = bb.T @ bb
+            start = 0
+            for qq in qqs:
+                end = start + qq.shape[1]
+                ll[start:end, start:] = 0.
+                ll[start:end, start:end] = np.eye(end - start)
+                start = end
+            c = solve_triangular(ll, np.eye(bb.shape[1]), lower=True, unit_diagonal=True)
+            start = 0
+            for rr in rrs:
+                end = start + rr.shape[1]
+                if end > start:
+                    c[start:end] = solve_triangular(rr, c[start:end])
+                start = end
+            aa = np.hstack([self.w] + self.wprev).astype(float, copy=False) @ c
+            self.factors = (aa, bb)
+        return self.factors
+
     def add(self, r_in, xt_in):
         r = r_in.get_interface_data().reshape(-1, 1)
         xt = xt_in.get_interface_data().reshape(-1, 1)
@@ -103,10 +173,13 @@ class ModelMVMF(Component):
             dr = r - self.rref
             dxt = xt - self.xtref
             # update V and W matrices
-            self.v = np.hstack((dr, self.v))
-            self.w = np.hstack((dxt, self.w))
+            self.v_block.prepend(dr)
+            self.w_block.prepend(dxt)
+            self.reset_qr()
         else:
             self.added = True
+            self.v_block = InterfaceBlock(r_in)
+            self.w_block = InterfaceBlock(xt_in)
         self.rref = r
         self.xtref = xt
 
@@ -118,9 +191,10 @@ class ModelMVMF(Component):
 
         self.rref = None
         self.xtref = None
-        self.v = np.empty((self.size_in, 0))
-        self.w = np.empty((self.size_out, 0))
+        self.v_block = None
+        self.w_block = None
         self.added = False
+        self.reset_qr()
 
         # limit number of time steps reused to q
         while len(self.wprev) > max(self.q, 1):  # for q = 0, there is one item: an empty array
@@ -128,21 +202,60 @@ class ModelMVMF(Component):
             self.rrprev.pop()
             self.qqprev.pop()
 
+        # compress older time steps to respect the memory budget
+        budget = self.get_budget()
+        if budget is not None:
+            self.compress(budget)
+
+    def get_budget(self):
+        # maximal number of columns of qqprev (and wprev), None if unlimited
+        budgets = []
+        if self.max_columns is not None:
+            budgets.append(self.max_columns)
+        if self.max_memory is not None:
+            bytes_per_column = (self.size_in + self.size_out) * np.dtype(self.precision).itemsize
+            budgets.append(int(self.max_memory * 1e6 // bytes_per_column))
+        return min(budgets) if budgets else None
+
+    def compress(self, budget):
+        # keep the most recent time steps exactly, merge the older ones into one truncated SVD
+        n_columns = [qq.shape[1] for qq in self.qqprev]
+        if sum(n_columns) <= budget:
+            return
+        i = 0
+        while n_columns[i] <= budget:
+            budget -= n_columns[i]
+            i += 1
+        # apply the entries i, i + 1, ... in sequence to an orthonormal basis of their combined row space
+        qq_merged, _ = np.linalg.qr(np.hstack(self.qqprev[i:]).astype(float, copy=False), mode='reduced')
+        a = self.multiply_prev(qq_merged.copy(), start=i)
+        u, s, vt = np.linalg.svd(a, full_matrices=False)
+        numerical_rank = np.count_nonzero(s > s[0] * max(a.shape) * np.finfo(float).eps) if s.size else 0
+        rank = min(budget, numerical_rank)
+        dropped = s[rank] / s[0] if rank < numerical_rank else 0.
+        tools.print_info(f'Compressing MVMF information older than {i} time step(s): '
+                         f'{rank} of {sum(n_columns[i:])} columns retained, '
+                         f'largest relative singular value dropped: {dropped:.2e}',
+                         layout='warning' if dropped else 'info')
+        self.wprev[i:] = [(u[:, :rank] * s[:rank]).astype(self.precision)]
+        self.rrprev[i:] = [np.eye(rank)]
+        self.qqprev[i:] = [(qq_merged @ vt[:rank].T).astype(self.precision)]
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
-        self.wprev = [self.w] + self.wprev
-        qq, rr = np.linalg.qr(self.v, mode='reduced')
-        self.rrprev = [rr] + self.rrprev
-        self.qqprev = [qq] + self.qqprev
+        self.wprev = [self.w.astype(self.precision)] + self.wprev  # compact copy of the InterfaceBlock
+        qq, rr = self.get_qr()
+        self.rrprev = [rr] + self.rrprev  # small, always stored in float64
+        self.qqprev = [qq.astype(self.precision, copy=False)] + self.qqprev
 
     def filter_q(self, dr_in, modes=None):
-        dr = dr_in.get_interface_data().reshape(-1, 1)
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
         dr_out = dr_in.copy()
         if modes == 0:
             pass  # return copy of dr_in
         elif modes is None:
-            qq, _ = np.linalg.qr(self.v, mode='reduced')
+            qq, _ = self.get_qr()
             dr = dr - qq @ (qq.T @ dr)
             for qq in self.qqprev:
                 dr = dr - qq @ (qq.T @ dr)
@@ -151,15 +264,29 @@ class ModelMVMF(Component):
         dr_out.set_interface_data(dr.flatten())
         return dr_out
 
+    def scale_input(self, factors):
+        # the input is multiplied element-wise with factors from now on, the stored information is scaled accordingly
+        # the scaled V = diag(factors) @ Q @ R of the previous time steps is decomposed again
+        factors = factors.reshape(-1, 1)
+        if self.v_block is not None:
+            self.v_block.array[:] *= factors
+        if self.rref is not None:
+            self.rref = self.rref * factors
+        for i, (rr, qq) in enumerate(zip(self.rrprev, self.qqprev)):
+            qq_scaled, rr_scaled = np.linalg.qr(qq * factors, mode='reduced')
+            self.qqprev[i] = qq_scaled.astype(self.precision)
+            self.rrprev[i] = rr_scaled @ rr
+        self.reset_qr()
+
     def restart(self, restart_data):
         if self.q != 0:
-            self.wprev = restart_data['wprev']
+            self.wprev = [w.astype(self.precision, copy=False) for w in restart_data['wprev']]
             self.rrprev = restart_data['rrprev']
-            self.qqprev = restart_data['qqprev']
+            self.qqprev = [qq.astype(self.precision, copy=False) for qq in restart_data['qqprev']]
 
     def check_restart_data(self, restart_data):
         model_type = restart_data['type']
-        for key in ['min_significant', 'q']:
+        for key in ['min_significant', 'q', 'precision', 'max_columns', 'max_memory']:
             new_value = self.settings.get(key)
             old_value = restart_data['settings'].get(key)
             if new_value != old_value:
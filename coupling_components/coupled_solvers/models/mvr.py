@@ -0,0 +1,221 @@
+from coconut.coupling_components.component import Component
+from coconut.data_structure import InterfaceBlock
+from coconut import tools
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+
+def create(parameters):
+    return ModelMVR(parameters)
+
+
+class ModelMVR(Component):
+    def __init__(self, parameters):
+        super().__init__()
+
+        self.settings = parameters['settings']
+        self.min_significant = self.settings.get('min_significant', 0)
+        self.restart_type = self.settings.get('restart_type', 'svd')  # 'svd' or 'zero'
+        self.chunk_size = self.settings.get('chunk_size', 8)  # number of time steps between restarts
+        self.truncation = self.settings.get('truncation', 1e-3)  # relative singular value threshold for 'svd'
+        self.precision = tools.get_precision(self.settings)  # storage precision of aprev and bprev
+        if self.restart_type not in ('svd', 'zero'):
+            raise ValueError(f'restart_type "{self.restart_type}" is not "svd" or "zero"')
+        if self.chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {self.chunk_size}')
+
+        self.size_in = None  # set by coupled solver
+        self.size_out = None  # set by coupled solver
+        self.out = None  # interface of output, set by coupled solver
+        self.added = False
+        self.rref = None
+        self.xtref = None
+        self.v_block = None  # InterfaceBlocks are created when the first differences are added
+        self.w_block = None
+        self.acurr = None  # Jacobian approximation N = sum of A @ B.T over the current and previous time steps
+        self.bcurr = None
+        self.aprev = None
+        self.bprev = None
+        self.chunk = 0  # number of time steps since last restart
+
+    @property
+    def v(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_in, 0)) if self.v_block is None else self.v_block.array
+
+    @property
+    def w(self):
+        # *** view on the columns of the current time step, no copy
+        return np.empty((self.size_out, 0)) if self.w_block is None else self.w_block.array
+
+    def initialize(self):
+        super().initialize()
+
+        self.aprev = []
+        self.bprev = []
+
+    def filter(self):
+        if self.v.shape[1] == 0:
+            raise RuntimeError('No information to filter')
+        # remove columns resulting in small diagonal elements in R
+        singular = True
+        while singular and self.v.shape[1]:
+            rr = np.linalg.qr(self.v, mode='r')
+            diag = np.diagonal(rr)
+            m = min(abs(diag))
+            if m < self.min_significant:
+                i = np.argmin(abs(diag))
+                tools.print_info(f'Removing column {i}: {m} < minsignificant', layout='warning')
+                self.v_block.delete(i)
+                self.w_block.delete(i)
+            else:
+                singular = False
+        # remove columns if number of columns exceeds number of rows
+        if self.v.shape[0] < self.v.shape[1]:
+            self.v_block.delete(-1)
+            self.w_block.delete(-1)
+
+    def multiply_nprev(self, x):
+        # product of the Jacobian approximation of the previous time steps with x, without constructing it
+        y = np.zeros((self.size_out, x.shape[1]))
+        for a, b in zip(self.aprev, self.bprev):
+            y += a @ (b.T @ x)
+        return y
+
+    def predict(self, dr_in, modes=None):
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
+        if modes == 0:
+            tools.print_info("Jacobian of model MVR disabled: zero returned", layout='warning')
+            return dr_in * 0
+        elif modes is not None:
+            tools.print_info(f'Mode limiting not possible for MVR model', layout='warning')
+        if not self.is_ready():
+            raise RuntimeError('No information to predict')
+        # approximation for the inverse of the Jacobian from a multiple vector model
+        dxt = self.multiply_nprev(dr)
+        if self.acurr is not None:
+            dxt += self.acurr @ (self.bcurr.T @ dr)
+        dxt_out = self.out.copy()
+        dxt_out.set_interface_data(dxt.flatten())
+        return dxt_out
+
+    def get_factors(self):
+        # factors A and B of the Jacobian approximation N = A @ B.T
+        a = self.aprev + ([] if self.acurr is None else [self.acurr])
+        b = self.bprev + ([] if self.bcurr is None else [self.bcurr])
+        if not a:
+            return np.empty((self.size_out, 0)), np.empty((self.size_in, 0))
+        return np.hstack(a).astype(float, copy=False), np.hstack(b).astype(float, copy=False)
+
+    def add(self, r_in, xt_in):
+        r = r_in.get_interface_data().reshape(-1, 1)
+        xt = xt_in.get_interface_data().reshape(-1, 1)
+        if self.added:
+            dr = r - self.rref
+            dxt = xt - self.xtref
+            # update V and W matrices
+            self.v_block.prepend(dr)
+            self.w_block.prepend(dxt)
+            self.filter()
+            # low-rank update of the current time step: N = Nprev + (W - Nprev @ V) @ inv(V.T @ V) @ V.T
+            if self.v.shape[1]:
+                qq, rr = np.linalg.qr(self.v, mode='reduced')  # inv(V.T @ V) @ V.T = inv(R) @ Q.T
+                self.acurr = solve_triangular(rr, (self.w - self.multiply_nprev(self.v)).T, trans='T').T
+                self.bcurr = qq
+            else:
+                self.acurr = self.bcurr = None
+        else:
+            self.added = True
+            self.v_block = InterfaceBlock(r_in)
+            self.w_block = InterfaceBlock(xt_in)
+        self.rref = r
+        self.xtref = xt
+
+    def is_ready(self):
+        return self.acurr is not None or bool(self.aprev)
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.rref = None
+        self.xtref = None
+        self.v_block = None
+        self.w_block = None
+        self.acurr = None
+        self.bcurr = None
+        self.added = False
+
+    def finalize_solution_step(self):
+        super().finalize_solution_step()
+
+        if self.acurr is not None:
+            self.aprev = [self.acurr.astype(self.precision)] + self.aprev
+            self.bprev = [self.bcurr.astype(self.precision)] + self.bprev
+        self.chunk += 1
+        if self.chunk == self.chunk_size:
+            self.restart_jacobian()
+
+    def restart_jacobian(self):
+        # limit the rank of the Jacobian approximation by discarding it or by truncating its SVD
+        self.chunk = 0
+        if self.restart_type == 'zero' or not self.aprev:
+            self.aprev = []
+            self.bprev = []
+            return
+        # SVD of A @ B.T via QR decompositions of the factors, in O(n * k^2)
+        qa, ra = np.linalg.qr(np.hstack(self.aprev).astype(float, copy=False), mode='reduced')
+        qb, rb = np.linalg.qr(np.hstack(self.bprev).astype(float, copy=False), mode='reduced')
+        u, s, vt = np.linalg.svd(ra @ rb.T)
+        rank = np.count_nonzero(s > self.truncation * s[0]) if s.size else 0
+        tools.print_info(f'Restart of MVR model: rank {rank} of {s.size} retained', layout='info')
+        self.aprev = [((qa @ u[:, :rank]) * s[:rank]).astype(self.precision)]
+        self.bprev = [(qb @ vt[:rank].T).astype(self.precision)]
+
+    def filter_q(self, dr_in, modes=None):
+        dr = dr_in.get_interface_data(copy=False).reshape(-1, 1)
+        dr_out = dr_in.copy()
+        if modes == 0:
+            pass  # return copy of dr_in
+        elif modes is None:
+            # remove the component in the row space of N, which lies in the column space of the B factors
+            a, b = self.get_factors()
+            if a.shape[1]:
+                qa, ra = np.linalg.qr(a, mode='reduced')
+                qb, rb = np.linalg.qr(b, mode='reduced')
+                u, s, _ = np.linalg.svd(rb @ ra.T)
+                rank = np.count_nonzero(s > s[0] * max(ra.shape) * np.finfo(float).eps) if s.size else 0
+                q = qb @ u[:, :rank]
+                dr = dr - q @ (q.T @ dr)
+        else:
+            tools.print_info(f'Mode limiting not possible for MVR model', layout='warning')
+        dr_out.set_interface_data(dr.flatten())
+        return dr_out
+
+    def scale_input(self, factors):
+        # the input is multiplied element-wise with factors from now on, the stored information is scaled accordingly
+        factors = factors.reshape(-1, 1)
+        if self.v_block is not None:
+            self.v_block.array[:] *= factors
+        if self.rref is not None:
+            self.rref = self.rref * factors
+        if self.bcurr is not None:
+            self.bcurr = self.bcurr / factors
+        self.bprev = [(b / factors).astype(self.precision) for b in self.bprev]
+
+    def restart(self, restart_data):
+        self.aprev = [a.astype(self.precision, copy=False) for a in restart_data['aprev']]
+        self.bprev = [b.astype(self.precision, copy=False) for b in restart_data['bprev']]
+        self.chunk = restart_data['chunk']
+
+    def check_restart_data(self, restart_data):
+        model_type = restart_data['type']
+        for key in ['min_significant', 'restart_type', 'chunk_size', 'truncation', 'precision']:
+            new_value = self.settings.get(key)
+            old_value = restart_data['settings'].get(key)
+            if new_value != old_value:
+                tools.print_info(f'"{model_type}" parameter "{key}" changed from {old_value} to {new_value}',
+                                 layout='blue')
+
+    def save_restart_data(self):
+        return {'settings': self.settings, 'aprev': self.aprev, 'bprev': self.bprev, 'chunk': self.chunk}
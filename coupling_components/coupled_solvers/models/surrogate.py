@@ -44,6 +44,9 @@ class ModelSurrogate(Component):
 
         self.coupled_solver.initialize_solution_step()
 
+    def set_delta_t(self, delta_t):
+        self.coupled_solver.set_delta_t(delta_t)
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -1,6 +1,8 @@
 from coconut.tools import print_info
 from coconut.coupling_components.coupled_solvers.coupled_solver import CoupledSolver
 
+import time
+
 
 def create(parameters):
     return CoupledSolverOneWay(parameters)
@@ -11,10 +13,65 @@ class CoupledSolverOneWay(CoupledSolver):
         super().__init__(parameters)
         print_info('CoupledSolverOneWay is chosen: convergence criterion and predictor are ignored', layout='info')
 
+        self.pipelined = self.settings.get('pipelined', False)  # solve next time step of solver 0 during solver 1
+        if self.pipelined:
+            if 'number_of_timesteps' not in self.settings:
+                raise ValueError('Pipelined one-way coupling requires "number_of_timesteps"')
+            if not self.time_step_controller.dummy:
+                raise ValueError('Pipelined one-way coupling requires a fixed time step size')
+            self.timestep_end = self.timestep_start_current + self.settings['number_of_timesteps']
+        self.future_y = None  # output of solver 0 for the next time step, already started if pipelined
+        self.solve_time = 0  # wall time of the solver calls in pipelined mode
+
+    def initialize(self, print_components=True):
+        super().initialize(print_components=print_components)
+
+        if self.pipelined:
+            # time steps of solver 0 are started and ended in solve_solution_step
+            self.components.remove(self.solver_wrappers[0])
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        if self.pipelined and self.future_y is None:
+            self.solver_wrappers[0].initialize_solution_step()
+
     def solve_solution_step(self):
-        self.x *= 0  # set interface to zero: no effect of other solver
-        self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy())
-        r = xt - self.x
-        self.x = xt  # for storing resulting interface
+        x = self.x * 0  # zero interface: no effect of other solver
+        if not self.pipelined:
+            self.y = self.solve_solver_wrapper(0, x).copy()
+            xt = self.solve_solver_wrapper(1, self.y)
+        else:
+            start_time = time.time()
+            if self.future_y is None:
+                self.y = self.solve_solver_wrapper(0, x).copy()
+            else:
+                self.y = self.future_y.result().copy()
+                self.future_y = None
+            future_xt = self.solve_solver_wrapper_async(1, self.y)
+            # solver 0 does not depend on solver 1, so it continues with the next time step while solver 1 runs
+            solver_wrapper = self.solver_wrappers[0]
+            solver_wrapper.finalize_solution_step()
+            solver_wrapper.output_solution_step()
+            if self.time_step < self.timestep_end:
+                solver_wrapper.initialize_solution_step()
+                self.future_y = self.solve_solver_wrapper_async(0, x)
+            xt = future_xt.result()
+            self.solve_time += time.time() - start_time
+        r = xt - x
+        self.x = xt.copy()  # for storing resulting interface
         self.finalize_iteration(r)
+
+    def finalize(self):
+        if self.pipelined:
+            if self.future_y is not None:  # calculation stopped before the last time step
+                self.future_y.result()
+                self.future_y = None
+                self.solver_wrappers[0].finalize_solution_step()
+            self.solver_wrappers[0].finalize()
+        super().finalize()
+
+    def add_time_allocation(self, time_allocation):
+        if self.pipelined:
+            # the solvers run at the same time, so the coupling time is the run time minus their wall time
+            time_allocation['run_time']['coupling'] = self.run_time - self.solve_time
@@ -0,0 +1,294 @@
+from coconut import tools
+from coconut.tools import create_instance, cd
+from coconut.coupling_components.coupled_solvers.coupled_solver import CoupledSolver
+
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import numpy as np
+import time
+import copy
+import os
+from os.path import join
+import shutil
+
+
+def create(parameters):
+    return CoupledSolverParareal(parameters)
+
+
+def propagate(parameters, state, number_of_timesteps, working_directory):
+    # performs time steps with a new coupled solver starting from state, executed in a separate process
+    with cd(working_directory), open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        coupled_solver = create_instance(parameters)
+        coupled_solver.initialize()
+        coupled_solver.restore_state(state)
+        time_steps = []
+        for _ in range(number_of_timesteps):
+            coupled_solver.initialize_solution_step()
+            coupled_solver.solve_solution_step()
+            coupled_solver.finalize_solution_step()
+            coupled_solver.output_solution_step()
+            time_steps.append({'state': coupled_solver.save_state(), 'iterations': coupled_solver.iteration,
+                               'residual': coupled_solver.residual[-1]})
+        coupled_solver.finalize()
+    return time_steps
+
+
+def get_working_directories(parameters):
+    if isinstance(parameters, dict):
+        return [directory for key, value in parameters.items() for directory in
+                ([value] if key == 'working_directory' else get_working_directories(value))]
+    elif isinstance(parameters, list):
+        return [directory for value in parameters for directory in get_working_directories(value)]
+    else:
+        return []
+
+
+def set_working_directories(parameters, working_directories):
+    # replaces the working directories in the parameters according to the dictionary working_directories
+    if isinstance(parameters, dict):
+        return {key: working_directories[value] if key == 'working_directory' else
+                set_working_directories(value, working_directories) for key, value in parameters.items()}
+    elif isinstance(parameters, list):
+        return [set_working_directories(value, working_directories) for value in parameters]
+    else:
+        return parameters
+
+
+def combine_states(coarse, fine_previous, coarse_previous):
+    # parareal correction of the physical state, the history of the predictor is taken from the fine state
+    state = dict(fine_previous)
+    for key in ('x', 'y', 'solver_wrappers'):
+        state[key] = correct(coarse[key], fine_previous[key], coarse_previous[key])
+    return state
+
+
+def correct(coarse, fine_previous, coarse_previous):
+    # parareal correction of the arrays, other values such as the time step are taken from the fine state
+    if isinstance(fine_previous, dict):
+        return {key: correct(coarse[key], value, coarse_previous[key]) for key, value in fine_previous.items()}
+    elif isinstance(fine_previous, list):
+        return [correct(*values) for values in zip(coarse, fine_previous, coarse_previous)]
+    elif isinstance(fine_previous, np.ndarray):
+        return coarse + fine_previous - coarse_previous
+    else:
+        return fine_previous
+
+
+def set_time_step(state, time_step):
+    # time step of coupled solver and solver wrappers, a coarse state has fewer time steps than a fine one
+    if isinstance(state, dict):
+        return {key: time_step if key in ('time_step', 'n') else set_time_step(value, time_step)
+                for key, value in state.items()}
+    elif isinstance(state, list):
+        return [set_time_step(value, time_step) for value in state]
+    else:
+        return state
+
+
+def get_arrays(state):
+    if isinstance(state, dict):
+        return [array for value in state.values() for array in get_arrays(value)]
+    elif isinstance(state, list):
+        return [array for value in state for array in get_arrays(value)]
+    elif isinstance(state, np.ndarray):
+        return [state]
+    else:
+        return []
+
+
+def get_change(state, state_previous):
+    # largest relative change of the arrays in the state, except for the history of the predictor
+    change = 0
+    for array, array_previous in zip(*[get_arrays([s[key] for key in ('x', 'y', 'solver_wrappers')])
+                                       for s in (state, state_previous)]):
+        norm = np.linalg.norm(array)
+        norm_change = np.linalg.norm(array - array_previous)
+        change = max(change, norm_change / norm if norm > 0 else norm_change)
+    return change
+
+
+class CoupledSolverParareal(CoupledSolver):
+    def __init__(self, parameters):
+        # the contained coupled solvers use the components of this coupled solver, before settings are passed on
+        components_parameters = copy.deepcopy({key: parameters[key] for key in
+                                               ('predictor', 'convergence_criterion', 'solver_wrappers')})
+
+        super().__init__(parameters)
+
+        self.time_steps_per_slice = self.settings['time_steps_per_slice']  # fine time steps per time slice
+        self.coarse_time_steps_per_slice = self.settings.get('coarse_time_steps_per_slice', 1)
+        self.number_of_slices = self.settings['number_of_slices']  # time slices per window, solved in parallel
+        self.processes = self.settings.get('processes', self.number_of_slices)  # number of fine coupled solvers
+        self.maximum_iterations = self.settings.get('maximum_iterations', self.number_of_slices)
+        self.tolerance = self.settings['tolerance']  # on the relative change of the state at the end of the slices
+        for key in ('time_steps_per_slice', 'coarse_time_steps_per_slice', 'number_of_slices', 'processes',
+                    'maximum_iterations'):
+            if not isinstance(self.__getattribute__(key), int) or self.__getattribute__(key) < 1:
+                raise ValueError(f'Parameter "{key}" should be a positive integer')
+        if 'number_of_timesteps' not in self.settings:
+            raise ValueError('Parareal coupled solver requires "number_of_timesteps"')
+        if self.settings['number_of_timesteps'] % self.time_steps_per_slice:
+            raise ValueError('Parameter "number_of_timesteps" should be a multiple of "time_steps_per_slice"')
+        if not self.time_step_controller.dummy:
+            raise ValueError('Parareal coupled solver requires a fixed time step size')
+        if self.debug:
+            raise ValueError('Parareal coupled solver has no debug mode')
+        self.timestep_end = self.timestep_start_current + self.settings['number_of_timesteps']
+
+        # fine and coarse coupled solver, the latter performs larger time steps
+        # they start at time step 0 and their state is set with restore_state
+        fine_parameters = self.get_parameters(self.settings['fine_coupled_solver'], components_parameters,
+                                              self.delta_t, self.timestep_end)
+        coarse_parameters = self.get_parameters(
+            self.settings['coarse_coupled_solver'], components_parameters,
+            self.delta_t * self.time_steps_per_slice / self.coarse_time_steps_per_slice,
+            -(-self.timestep_end * self.coarse_time_steps_per_slice // self.time_steps_per_slice))
+
+        # each coupled solver runs in a copy of the working directories of its solver wrappers,
+        # which are renamed such that absolute paths and paths outside the case directory are copied as well
+        self.working_directory = join(os.getcwd(), f'{self.case_name}_parareal')
+        self.fine_directories = [join(self.working_directory, f'slice{i}') for i in range(self.number_of_slices)]
+        self.coarse_directory = join(self.working_directory, 'coarse')
+        shutil.rmtree(self.working_directory, ignore_errors=True)
+        ignore = shutil.ignore_patterns(os.path.basename(self.working_directory))  # if a working directory is '.'
+        self.fine_parameters = self.copy_working_directories(fine_parameters, self.fine_directories, ignore)
+        coarse_parameters = self.copy_working_directories(coarse_parameters, [self.coarse_directory], ignore)
+        with cd(self.coarse_directory):
+            self.coarse_coupled_solver = create_instance(coarse_parameters)
+
+        self.pool = None
+        self.time_steps = []  # solution of the remaining time steps of the current window
+        self.parareal_iterations = []  # number of parareal iterations per window
+        self.coarse_time = 0  # wall time of the coarse coupled solver
+        self.fine_time = 0  # wall time of the fine coupled solvers
+
+    @staticmethod
+    def get_parameters(parameters, components_parameters, delta_t, number_of_timesteps):
+        parameters = copy.deepcopy(parameters)
+        for key, value in components_parameters.items():
+            parameters.setdefault(key, copy.deepcopy(value))
+        # no files are written by the contained coupled solvers
+        parameters['settings'].update({'timestep_start': 0, 'number_of_timesteps': number_of_timesteps,
+                                       'delta_t': delta_t, 'save_restart': 0, 'write_results': 0})
+        return parameters
+
+    @staticmethod
+    def copy_working_directories(parameters, directories, ignore):
+        working_directories = {}
+        for working_directory in get_working_directories(parameters['solver_wrappers']):
+            if working_directory not in working_directories:
+                working_directories[working_directory] = f'wrapper{len(working_directories)}'
+                for directory in directories:
+                    shutil.copytree(working_directory, join(directory, working_directories[working_directory]),
+                                    ignore=ignore)
+        parameters['solver_wrappers'] = set_working_directories(parameters['solver_wrappers'], working_directories)
+        return parameters
+
+    def initialize(self, print_components=True):
+        super().initialize(print_components=print_components)
+
+        if self.restart:
+            self.x = self.restart_data['interface_x'].copy()
+            self.y = self.restart_data['interface_y'].copy()
+        with cd(self.coarse_directory), open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            self.coarse_coupled_solver.initialize()
+        self.pool = ProcessPoolExecutor(max_workers=self.processes)
+
+    def initialize_solution_step(self):
+        # the time steps of a window are solved at its start, from the state at the end of the previous time step
+        if not self.time_steps:
+            self.solve_window()
+
+        super().initialize_solution_step()
+
+    def solve_window(self):
+        number_of_slices = min(self.number_of_slices,
+                               (self.timestep_end - self.time_step) // self.time_steps_per_slice)
+        time_steps_end = [self.time_step + (i + 1) * self.time_steps_per_slice for i in range(number_of_slices)]
+        tools.print_info(f'Parareal window from time step {self.time_step + 1} to {time_steps_end[-1]} '
+                         f'with {number_of_slices} time slices', layout='info')
+
+        # initial states at the start of the time slices from the coarse coupled solver
+        states = [self.save_state()]
+        self.coarse_coupled_solver.restore_state(states[0])
+        states_coarse = [self.solve_coarse(time_step_end) for time_step_end in time_steps_end]
+        states += states_coarse
+
+        first = 0  # the initial state of the first time slices is converged
+        time_steps_fine = [None] * number_of_slices
+        iteration = 0
+        while True:
+            iteration += 1
+
+            # fine coupled solvers in parallel
+            start_time = time.time()
+            futures = [self.pool.submit(propagate, self.fine_parameters, states[i], self.time_steps_per_slice,
+                                        self.fine_directories[i]) for i in range(first, number_of_slices)]
+            for i, future in zip(range(first, number_of_slices), futures):
+                time_steps_fine[i] = future.result()
+            self.fine_time += time.time() - start_time
+
+            # sequential correction with coarse coupled solver
+            states_new = states[:first + 1] + [time_steps_fine[first][-1]['state']]
+            for i in range(first + 1, number_of_slices):
+                self.coarse_coupled_solver.restore_state(states_new[i])
+                state_coarse = self.solve_coarse(time_steps_end[i])
+                states_new.append(combine_states(state_coarse, time_steps_fine[i][-1]['state'], states_coarse[i]))
+                states_coarse[i] = state_coarse
+            change = max(get_change(states_new[i], states[i]) for i in range(first + 1, number_of_slices + 1))
+            states = states_new
+            first += 1
+
+            tools.print_info(f'Parareal iteration {iteration}: maximum relative change {change:.3e}', layout='info')
+            if first == number_of_slices or change <= self.tolerance or iteration == self.maximum_iterations:
+                break
+
+        self.parareal_iterations.append(iteration)
+        self.time_steps = [time_step for time_steps in time_steps_fine for time_step in time_steps]
+
+    def solve_coarse(self, time_step_end):
+        start_time = time.time()
+        coupled_solver = self.coarse_coupled_solver
+        with cd(self.coarse_directory), open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for _ in range(self.coarse_time_steps_per_slice):
+                coupled_solver.initialize_solution_step()
+                coupled_solver.solve_solution_step()
+                coupled_solver.finalize_solution_step()
+                coupled_solver.output_solution_step()
+        self.coarse_time += time.time() - start_time
+        return set_time_step(coupled_solver.save_state(), time_step_end)
+
+    def solve_solution_step(self):
+        # the solution of the fine coupled solver is loaded in the solver wrappers
+        time_step = self.time_steps.pop(0)
+        state = time_step['state']
+        self.x.set_interface_data(state['x'])
+        self.y.set_interface_data(state['y'])
+        for solver_wrapper, solver_wrapper_state in zip(self.solver_wrappers, state['solver_wrappers']):
+            solver_wrapper.restore_state(solver_wrapper_state)
+        self.iteration = time_step['iterations']
+        self.residual[-1] = time_step['residual']
+        tools.print_info(f'{self.iteration:<16d}{self.residual[-1][-1]:<28.17e}', flush=True)
+
+    def finalize(self):
+        self.pool.shutdown()
+        with cd(self.coarse_directory), open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            self.coarse_coupled_solver.finalize()
+        shutil.rmtree(self.working_directory)
+
+        super().finalize()
+
+    def add_time_allocation(self, time_allocation):
+        time_allocation['run_time'].update({'coarse': self.coarse_time, 'fine': self.fine_time})
+        time_allocation['run_time']['coupling'] -= self.coarse_time + self.fine_time
+
+    def add_time_distribution(self, ta, pre, reference=None):
+        out = ''
+        if 'coarse' not in ta:
+            return out
+        if reference is None:
+            reference = ta['total']
+        for key in ('coarse', 'fine'):
+            out += f'{pre}├─{key.capitalize()} coupled solver: {ta[key]:.0f}s ({ta[key] / reference * 100:0.1f}%)\n'
+        return out
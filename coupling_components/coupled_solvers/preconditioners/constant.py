@@ -0,0 +1,29 @@
+from coconut.coupling_components.coupled_solvers.preconditioners.preconditioner import Preconditioner
+
+import numpy as np
+
+
+def create(parameters):
+    return PreconditionerConstant(parameters)
+
+
+# constant weights per variable, or per model part and variable
+class PreconditionerConstant(Preconditioner):
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        self.factors = self.settings['factors']  # variable: weight or model part: {variable: weight}
+        for factors in self.factors.values():
+            for factor in factors.values() if isinstance(factors, dict) else [factors]:
+                if not isinstance(factor, (int, float)) or not np.isfinite(factor) or factor <= 0:
+                    raise ValueError(f'Preconditioner factors should be positive finite numbers, not {factor}')
+
+    def initialize(self, interface, models):
+        super().initialize(interface, models)
+
+        for (model_part_name, variable), block in self.slices.items():
+            factors = self.factors.get(model_part_name)
+            if isinstance(factors, dict) and variable in factors:
+                self.weights[block] = factors[variable]
+            else:
+                self.weights[block] = self.factors.get(variable, 1.)
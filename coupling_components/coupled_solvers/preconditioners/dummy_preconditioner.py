@@ -0,0 +1,16 @@
+from coconut.coupling_components.coupled_solvers.preconditioners.preconditioner import Preconditioner
+
+
+def create(parameters):
+    return PreconditionerDummy(parameters)
+
+
+# no preconditioning: the interfaces are given to the models as they are
+class PreconditionerDummy(Preconditioner):
+    dummy = True
+
+    def apply(self, interface):
+        return interface
+
+    def revert(self, interface):
+        return interface
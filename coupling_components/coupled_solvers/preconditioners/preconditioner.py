@@ -0,0 +1,71 @@
+from coconut.coupling_components.component import Component
+
+import numpy as np
+
+
+def create(parameters):
+    return Preconditioner(parameters)
+
+
+# base class for the scaling of the input of the quasi-Newton models per model part and variable
+# the data of an interface is multiplied with the weights before it is given to the models
+class Preconditioner(Component):
+    def __init__(self, parameters):
+        super().__init__()
+
+        self.settings = parameters.get('settings', {})
+
+        self.models = None  # models whose input is preconditioned, set upon initialization
+        self.slices = None  # slice of the interface data per model part and variable
+        self.weights = None
+
+    def initialize(self, interface, models):
+        super().initialize()
+
+        self.models = models
+        self.slices = {pair: interface.get_variable_slice(*pair)[0] for pair in interface.model_part_variable_pairs}
+        self.weights = np.ones(interface.size)
+
+    def set_weights(self, weights):
+        # the information in the models is scaled, such that it corresponds to the new weights
+        if not np.array_equal(weights, self.weights):
+            for model in self.models:
+                model.scale_input(weights / self.weights)
+            self.weights = weights
+
+    def get_block_norms(self, r):
+        # norm of the residual per model part and variable
+        data = r.get_interface_data(copy=False)
+        return {pair: np.linalg.norm(data[block]) for pair, block in self.slices.items()}
+
+    def get_block_weights(self, block_norms, norm):
+        # weights for which every non-zero block of the reference residual has the same norm, while the norm of the
+        # whole reference residual is retained, weights of zero blocks are not changed
+        weights = self.weights.copy()
+        n = np.count_nonzero(list(block_norms.values()))
+        for pair, block_norm in block_norms.items():
+            if block_norm > 0.:
+                weights[self.slices[pair]] = norm / (np.sqrt(n) * block_norm)
+        return weights
+
+    def update(self, r):
+        pass
+
+    def apply(self, interface):
+        out = interface.copy()
+        out.get_interface_data(copy=False)[:] *= self.weights
+        return out
+
+    def revert(self, interface):
+        out = interface.copy()
+        out.get_interface_data(copy=False)[:] /= self.weights
+        return out
+
+    def restart(self, restart_data):
+        # the information in the restarted models was stored with the old weights
+        weights = self.weights
+        self.weights = restart_data['weights']
+        self.set_weights(weights)
+
+    def save_restart_data(self):
+        return {'weights': self.weights}
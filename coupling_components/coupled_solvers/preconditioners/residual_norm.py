@@ -0,0 +1,26 @@
+from coconut.coupling_components.coupled_solvers.preconditioners.preconditioner import Preconditioner
+
+
+def create(parameters):
+    return PreconditionerResidualNorm(parameters)
+
+
+# weights from the norm per model part and variable of the first non-zero residual of every time step
+class PreconditionerResidualNorm(Preconditioner):
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        self.updated = False  # weights are updated once per time step
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.updated = False
+
+    def update(self, r):
+        if self.updated:
+            return
+        norm = r.norm()
+        if norm > 0.:
+            self.set_weights(self.get_block_weights(self.get_block_norms(r), norm))
+            self.updated = True
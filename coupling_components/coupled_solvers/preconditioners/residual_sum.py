@@ -0,0 +1,48 @@
+from coconut.coupling_components.coupled_solvers.preconditioners.preconditioner import Preconditioner
+
+
+def create(parameters):
+    return PreconditionerResidualSum(parameters)
+
+
+# weights from the sum over all residuals of the relative norms per model part and variable,
+# the weights are updated once per time step, upon the first non-zero residual
+class PreconditionerResidualSum(Preconditioner):
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        self.updated = False
+        self.block_sums = None  # sum of the norms per model part and variable, relative to the norm of the residual
+        self.count = 0  # number of non-zero residuals in the sums
+
+    def initialize(self, interface, models):
+        super().initialize(interface, models)
+
+        self.block_sums = dict.fromkeys(self.slices, 0.)
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.updated = False
+
+    def update(self, r):
+        norm = r.norm()
+        if norm == 0.:
+            return
+        for pair, block_norm in self.get_block_norms(r).items():
+            self.block_sums[pair] += block_norm / norm
+        self.count += 1
+        if not self.updated:
+            # the average relative norms are used, this retains the norm of a residual with these relative norms
+            self.set_weights(self.get_block_weights(self.block_sums, self.count))
+            self.updated = True
+
+    def restart(self, restart_data):
+        super().restart(restart_data)
+
+        if 'block_sums' in restart_data:
+            self.block_sums = restart_data['block_sums']
+            self.count = restart_data['count']
+
+    def save_restart_data(self):
+        return {'weights': self.weights, 'block_sums': self.block_sums, 'count': self.count}
@@ -15,17 +15,18 @@ class CoupledSolverRelaxation(CoupledSolver):
         # initial value
         self.x = self.predictor.predict(self.x)
         # first coupling iteration
-        self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-        xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-        r = xt - self.x
+        self.y = self.solve_solver_wrapper(0, self.x)
+        xt = self.solve_solver_wrapper(1, self.y)
+        r = xt.subtract(self.x, out=self.pool_x.get())
         self.finalize_iteration(r)
         # coupling iteration loop
         while not self.convergence_criterion.is_satisfied():
-            self.x += self.omega * r
-            self.y = self.solver_wrappers[0].solve_solution_step(self.x.copy()).copy()
-            xt = self.solver_wrappers[1].solve_solution_step(self.y.copy()).copy()
-            r = xt - self.x
+            self.x.add_scaled(r, self.omega)
+            self.y = self.solve_solver_wrapper(0, self.x)
+            xt = self.solve_solver_wrapper(1, self.y)
+            xt.subtract(self.x, out=r)
             self.finalize_iteration(r)
+        self.pool_x.release(r)
 
     def check_restart_data(self, restart_data, coupled_solver_settings=None):
         super().check_restart_data(restart_data, ['omega'])
@@ -37,12 +37,14 @@ class CoupledSolverTestSingleSolver(CoupledSolver):
         self.save_restart = 0  # no restart files are saved
         self.write_results = self.settings.get('write_results', 0)  # time step interval to save results
         self.anonymous = self.settings.get('anonymous', False)  # disables saving 'info' in the pickle file
+        self.results_precision = tools.get_precision(self.settings, 'results_precision')  # storage of results
         self.delta_t = self.settings['delta_t']
         tools.print_info(f'Using delta_t = {self.delta_t} and timestep_start = {self.timestep_start_current}')
 
         # create dummy components
         self.predictor = DummyComponent()
         self.convergence_criterion = DummyComponent()
+        self.time_step_controller = DummyComponent()
         self.dummy_solver = None
 
         # solver wrapper settings
@@ -71,12 +73,13 @@ class CoupledSolverTestSingleSolver(CoupledSolver):
         self.run_time_previous = 0
         self.time_allocation = {'previous_calculations': []}
         self.iterations = []
+        self.time_step_sizes = []
+        self.residual = []
 
         # save results variables
         if self.write_results:
             self.complete_solution_x = None
             self.complete_solution_y = None
-            self.residual = []
             self.info = None
             self.case_name = self.settings.get('case_name', 'case')  # case name
             self.case_name += '_' + settings['working_directory']  # add working directory to pickle file name
@@ -128,8 +131,10 @@ class CoupledSolverTestSingleSolver(CoupledSolver):
             self.y = self.solver_wrapper.get_interface_output()
 
         if self.write_results:
-            self.complete_solution_x = self.x.get_interface_data().reshape(-1, 1)
-            self.complete_solution_y = self.y.get_interface_data().reshape(-1, 1)
+            self.complete_solution_x = data_structure.InterfaceBlock(self.x, dtype=self.results_precision)
+            self.complete_solution_x.append(self.x)
+            self.complete_solution_y = data_structure.InterfaceBlock(self.y, dtype=self.results_precision)
+            self.complete_solution_y.append(self.y)
         self.start_run_time = time.time()  # start of calculation
         self.init_time = self.start_run_time - self.start_init_time  # duration of initialization
 
@@ -169,5 +174,7 @@ class CoupledSolverTestSingleSolver(CoupledSolver):
 
 
 class DummyComponent:
+    dummy = True
+
     def update(self, x):
         pass
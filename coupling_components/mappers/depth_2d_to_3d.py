@@ -40,7 +40,7 @@ class MapperDepth2DTo3D(MapperTransformer):
             self.n_from = n_in
             self.n_to = n_out
 
-            coords_in = np.column_stack((mp_in.x0, mp_in.y0, mp_in.z0))
+            coords_in = mp_in.coords
 
             coords_out = np.zeros((n_out, 3))
             ids_out = np.arange(n_out)
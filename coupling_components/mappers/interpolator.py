@@ -4,12 +4,46 @@ from coconut import tools
 
 from scipy.spatial import cKDTree
 import numpy as np
+import weakref
 
 
 def create(parameters):
     raise NotImplementedError('this class can only be used as super-class')
 
 
+# process-wide cache of spatial trees, shared by all interpolators that map from the same ModelPart
+spatial_trees = {}
+
+
+def get_spatial_tree(model_part, directions, scaling=None, balanced_tree=False):
+    """
+    Returns dict with the (scaled) coordinates of model_part in the given directions, the cKDTree built on these
+    coordinates and a boolean indicating whether the points have already been checked for duplicates.
+    As ModelParts can not be changed, the entry is kept for as long as the ModelPart exists.
+    """
+    key = (id(model_part), tuple(directions), None if scaling is None else tuple(scaling.flatten()),
+           bool(balanced_tree))
+    entry = spatial_trees.get(key)
+    if entry is None or entry['model_part']() is not model_part:
+        columns = [['x0', 'y0', 'z0'].index(direction) for direction in directions]
+        coords = model_part.coords[:, columns].astype(float)
+        if scaling is not None:
+            coords *= scaling
+        coords.flags.writeable = False
+        if balanced_tree:  # time-intensive
+            tree = cKDTree(coords)
+        else:  # less stable
+            tree = cKDTree(coords, balanced_tree=False)
+        entry = {'model_part': weakref.ref(model_part, lambda _: spatial_trees.pop(key, None)), 'coords': coords,
+                 'tree': tree, 'duplicates_checked': False}
+        spatial_trees[key] = entry
+    return entry
+
+
+def clear_spatial_trees():
+    spatial_trees.clear()
+
+
 class MapperInterpolator(Component):
     def __init__(self, parameters):
         super().__init__()
@@ -23,6 +57,7 @@ class MapperInterpolator(Component):
         # initialization
         self.n_from, self.n_to = None, None
         self.coords_from, self.coords_to = None, None
+        self.spatial_tree = None
         self.tree = None
         self.distances = None
         self.nearest = None
@@ -51,17 +86,16 @@ class MapperInterpolator(Component):
     def initialize(self, model_part_from, model_part_to):
         super().initialize()
 
-        # get coords_from
+        # get coords_from and tree, shared with other interpolators using the same from-ModelPart
         self.n_from = model_part_from.size
-        self.coords_from = np.zeros((self.n_from, len(self.directions)))
-        for j, direction in enumerate(self.directions):
-            self.coords_from[:, j] = getattr(model_part_from, direction)
+        self.spatial_tree = get_spatial_tree(model_part_from, self.directions, self.scaling, self.balanced_tree)
+        self.coords_from = self.spatial_tree['coords']
+        self.tree = self.spatial_tree['tree']
 
         # get coords_to
         self.n_to = model_part_to.size
-        self.coords_to = np.zeros((self.n_to, len(self.directions)))
-        for j, direction in enumerate(self.directions):
-            self.coords_to[:, j] = getattr(model_part_to, direction)
+        columns = [['x0', 'y0', 'z0'].index(direction) for direction in self.directions]
+        self.coords_to = model_part_to.coords[:, columns].astype(float)
 
         # check if n_from is large enough
         if self.n_from < self.n_nearest:
@@ -77,15 +111,9 @@ class MapperInterpolator(Component):
         if self.scaling is not None:
             tools.print_info(f'Scaling {self.scaling} applied for interpolation from {model_part_from.name} '
                              f'to {model_part_to.name}')
-            self.coords_from *= self.scaling
             self.coords_to *= self.scaling
 
-        # build and query tree
-        if self.balanced_tree:  # time-intensive
-            self.tree = cKDTree(self.coords_from)
-        else:  # less stable
-            self.tree = cKDTree(self.coords_from, balanced_tree=False)
-
+        # query tree
         self.distances, self.nearest = self.tree.query(self.coords_to, k=self.n_nearest)
         self.nearest = self.nearest.reshape(-1, self.n_nearest)
 
@@ -112,7 +140,9 @@ class MapperInterpolator(Component):
         interface_to.set_variable_data(mp_name_to, var_to, data_to)
 
     def check_duplicate_points(self, model_part_from):
-        # checks only from-points
+        # checks only from-points, only once for each spatial tree
+        if self.spatial_tree['duplicates_checked']:
+            return
         tol_warning = 1e-8  # TODO: create optional parameter for this?
         tol_error = 1e-12
 
@@ -136,3 +166,5 @@ class MapperInterpolator(Component):
         if duplicate.any():
             raise Warning(f'{msg_1}{np.sum(duplicate)}{msg_2}' +
                           f'{self.coords_from[np.argmax(duplicate)]}.')
+
+        self.spatial_tree['duplicates_checked'] = True
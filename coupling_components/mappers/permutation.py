@@ -48,7 +48,7 @@ class MapperPermutation(MapperTransformer):
         permutation = self.permutation if forward else np.argsort(self.permutation)
 
         mp_in = model.get_model_part(model_part_name_in)
-        coords_in = np.column_stack((mp_in.x0, mp_in.y0, mp_in.z0))
+        coords_in = mp_in.coords
         coords_out = coords_in[:, permutation]
         model.create_model_part(model_part_name_out, coords_out[:, 0],
                                 coords_out[:, 1], coords_out[:, 2], np.arange(mp_in.size))
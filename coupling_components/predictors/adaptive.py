@@ -0,0 +1,82 @@
+from coconut.coupling_components.predictors.predictor import Predictor
+from coconut import tools
+
+import numpy as np
+
+
+def create(parameters):
+    return PredictorAdaptive(parameters)
+
+
+# extrapolation of which the order is selected in each time step, as the one that would have given the solution of the
+# previous time step most accurately
+class PredictorAdaptive(Predictor):
+    orders = {'constant': 0, 'linear': 1, 'quadratic': 2, 'legacy': 2, 'cubic': 3}
+
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        self.settings = parameters.get('settings', {})
+
+        # read parameters
+        self.extrapolations = self.settings.get('extrapolations', list(self.orders))  # candidates for selection
+        if not self.extrapolations:
+            raise ValueError('Parameter "extrapolations" should not be empty')
+        for extrapolation in self.extrapolations:
+            if extrapolation not in self.orders:
+                raise ValueError(f'Unknown extrapolation "{extrapolation}", possible extrapolations are '
+                                 f'{", ".join(self.orders)}')
+
+        self.order = max(self.orders[extrapolation] for extrapolation in self.extrapolations)
+        self.extrapolation = None  # extrapolation used in current time step
+        self.errors = {}  # error of the extrapolations with sufficient information in the previous time step
+
+    def predict(self, x):
+        if self.errors:
+            extrapolation = min(self.errors, key=self.errors.get)
+        else:
+            extrapolation = min(self.extrapolations, key=self.orders.get)
+        if extrapolation != self.extrapolation and self.extrapolation is not None:
+            errors = ', '.join(f'{key} {value:.2e}' for key, value in self.errors.items())
+            tools.print_info(f'Predictor extrapolation changed from {self.extrapolation} to {extrapolation} '
+                             f'(errors in previous time step: {errors})', layout='info')
+        self.extrapolation = extrapolation
+        return self.extrapolate_with(extrapolation, x)
+
+    def extrapolate_with(self, extrapolation, x):
+        # lower order as long as insufficient time steps are available, as for the polynomial predictors
+        if len(self.dataprev) <= self.orders[extrapolation]:
+            return self.quadratic(x) if extrapolation == 'cubic' and len(self.dataprev) == 3 else self.linear(x)
+        return getattr(self, extrapolation)(x)
+
+    def update(self, x):
+        # score the extrapolations from the previous solutions with the converged solution
+        if not self.updated:
+            data = x.get_interface_data()
+            self.errors = {extrapolation: np.linalg.norm(getattr(self, extrapolation)(x).get_interface_data() - data)
+                           for extrapolation in self.extrapolations
+                           if len(self.dataprev) > self.orders[extrapolation]}
+
+        super().update(x)
+
+    def restart(self, restart_data):
+        super().restart(restart_data)
+
+        self.extrapolation = restart_data.get('extrapolation')
+        self.errors = {key: value for key, value in restart_data.get('errors', {}).items()
+                       if key in self.extrapolations}
+
+    def check_restart_data(self, restart_data):
+        model_type = restart_data['type']
+        if model_type != 'predictors.adaptive':
+            return
+        new_value = self.settings.get('extrapolations')
+        old_value = restart_data.get('settings', {}).get('extrapolations')
+        if new_value != old_value:
+            tools.print_info(f'"{model_type}" parameter "extrapolations" changed from {old_value} to {new_value}',
+                             layout='blue')
+
+    def save_restart_data(self):
+        restart_data = super().save_restart_data()
+        restart_data.update({'extrapolation': self.extrapolation, 'errors': self.errors})
+        return restart_data
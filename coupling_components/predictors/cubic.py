@@ -5,7 +5,7 @@ def create(parameters):
     return PredictorCubic(parameters)
 
 
-# cubic extrapolation based on the last four time steps, assuming constant time step size
+# cubic extrapolation based on the last four time steps
 class PredictorCubic(Predictor):
     def __init__(self, _unused):
         super().__init__(_unused)
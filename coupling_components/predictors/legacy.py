@@ -5,7 +5,7 @@ def create(parameters):
     return PredictorLegacy(parameters)
 
 
-# quadratic extrapolation based on the last three time steps, assuming constant time step size
+# quadratic extrapolation based on the last three time steps
 class PredictorLegacy(Predictor):
     def __init__(self, _unused):
         super().__init__(_unused)
@@ -0,0 +1,143 @@
+from coconut.coupling_components.predictors.predictor import Predictor
+
+import numpy as np
+
+
+def create(parameters):
+    return PredictorPOD(parameters)
+
+
+# extrapolation of the coefficients of a proper orthogonal decomposition (POD) of the previous solutions, with a linear
+# recurrence on the coefficients of the last time steps, fitted to the solutions at constant time step size
+class PredictorPOD(Predictor):
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        self.settings = parameters.get('settings', {})
+
+        # read parameters
+        self.modes = self.settings.get('modes', 10)  # number of POD modes used for extrapolation
+        self.delays = self.settings.get('delays', 2)  # number of previous time steps in the recurrence
+        self.snapshots = self.settings.get('snapshots', 2 * self.delays * (self.modes + 1))  # time steps for the fit
+        self.tolerance = self.settings.get('tolerance', 1e-8)  # relative singular value below which modes are removed
+        for key in ('modes', 'delays'):
+            if not isinstance(self.__getattribute__(key), int) or self.__getattribute__(key) < 1:
+                raise ValueError(f'Parameter "{key}" should be a positive integer')
+        if self.snapshots < self.delays * (self.modes + 1) + 1:
+            raise ValueError('Parameter "snapshots" should be at least "delays" * ("modes" + 1) + 1')
+
+        self.order = 3  # polynomial extrapolation if the recurrence cannot be used
+        self.maximum_residual = 0.1  # fit residual relative to the change of the coefficients
+        self.maximum_growth = 1.2  # spectral radius of the recurrence, spurious eigenvalues of a noisy fit are larger
+        self.basis = None  # POD modes of the solutions of the last time steps as columns
+        self.coefficients = None  # POD coefficients of the solutions of the last time steps as rows, last one first
+        self.delta_t_snapshots = None  # time step size between the solutions in the basis, None if constant
+
+    def initialize(self, x):
+        super().initialize(x)
+
+        self.reset_snapshots([self.dataprev[0]])
+
+    def predict(self, x):
+        if self.updated:
+            raise Exception('Already updated')
+        prediction = self.extrapolate_coefficients() if self.delta_t == self.delta_t_snapshots else None
+        if prediction is None:
+            return self.polynomial(x)
+        x = x.copy()
+        x.set_interface_data(prediction)
+        return x
+
+    def polynomial(self, x):
+        # Lagrange extrapolation of the base class, which takes the time step sizes into account
+        if len(self.dataprev) < 3:
+            return self.linear(x)
+        elif len(self.dataprev) == 3:
+            return self.quadratic(x)
+        else:
+            return self.cubic(x)
+
+    def extrapolate_coefficients(self):
+        # coefficients of the most important modes as linear combination of those in the previous time steps,
+        # None if too few time steps are available or if the fit is inaccurate or unstable
+        number_of_modes = min(self.modes, self.basis.shape[1])
+        number_of_equations = self.coefficients.shape[0] - self.delays
+        if not number_of_modes or number_of_equations < self.delays * number_of_modes + 1:
+            return None
+        coefficients = self.coefficients[:, :number_of_modes]
+        delayed = np.hstack([coefficients[i + 1:i + 1 + number_of_equations] for i in range(self.delays)])
+        matrix = np.linalg.lstsq(delayed, coefficients[:number_of_equations], rcond=1e-6)[0]
+
+        residual = np.linalg.norm(delayed @ matrix - coefficients[:number_of_equations])
+        change = np.linalg.norm(coefficients[:number_of_equations] - coefficients[1:number_of_equations + 1])
+        if residual > self.maximum_residual * change:
+            return None
+        companion = np.eye(self.delays * number_of_modes, k=number_of_modes)
+        companion[:, :number_of_modes] = matrix
+        if np.max(np.abs(np.linalg.eigvals(companion))) > self.maximum_growth:
+            return None
+
+        current = coefficients[:self.delays].flatten()
+        return self.dataprev[0] + self.basis[:, :number_of_modes] @ (current @ matrix - coefficients[0])
+
+    def update(self, x):
+        super().update(x)
+
+        if self.delta_t != self.delta_t_snapshots:  # the solutions in the basis should be equidistant in time
+            self.reset_snapshots(self.dataprev[1:2])
+            self.delta_t_snapshots = self.delta_t
+        self.add_snapshot(self.dataprev[0])
+
+    def reset_snapshots(self, dataprev):
+        # basis of the given solutions, last one first
+        self.basis = np.zeros((self.dataprev[0].size, 0))
+        self.coefficients = np.zeros((0, 0))
+        for data in reversed(dataprev):
+            self.add_snapshot(data)
+
+    def add_snapshot(self, data):
+        # incremental update of the basis with an extra solution, such that it is the POD basis of the last solutions
+        coefficients = self.basis.T @ data
+        residual = data - self.basis @ coefficients
+        correction = self.basis.T @ residual  # second projection to maintain orthogonality of the basis
+        coefficients += correction
+        residual -= self.basis @ correction
+        norm = np.linalg.norm(residual)
+        if norm > self.tolerance * np.linalg.norm(data):
+            self.basis = np.hstack((self.basis, (residual / norm)[:, np.newaxis]))
+            coefficients = np.append(coefficients, norm)
+            self.coefficients = np.hstack((self.coefficients, np.zeros((self.coefficients.shape[0], 1))))
+        self.coefficients = np.vstack((coefficients, self.coefficients))[:self.snapshots]
+        if not self.basis.shape[1]:  # zero solutions
+            return
+
+        # singular value decomposition of the small matrix of coefficients, modes without contribution are removed
+        rotation, singular_values, _ = np.linalg.svd(self.coefficients.T, full_matrices=False)
+        number_of_modes = np.sum(singular_values > self.tolerance * singular_values[0])
+        rotation = rotation[:, :number_of_modes]
+        self.basis = self.basis @ rotation
+        self.coefficients = self.coefficients @ rotation
+
+    def restart(self, restart_data):
+        dataprev = list(restart_data['dataprev'])  # before it is shortened to the order of this predictor
+        super().restart(restart_data)
+
+        if 'basis' in restart_data:
+            self.basis = restart_data['basis']
+            self.coefficients = restart_data['coefficients'][:self.snapshots]
+            self.delta_t_snapshots = restart_data.get('delta_t_snapshots')
+        else:  # restart from a polynomial predictor, the basis is constructed from its equidistant previous solutions
+            delta_tprev = restart_data.get('delta_tprev', [])
+            self.delta_t_snapshots = delta_tprev[0] if delta_tprev else None
+            number_of_solutions = 1
+            while number_of_solutions < len(dataprev) and (len(delta_tprev) < number_of_solutions or
+                                                           delta_tprev[number_of_solutions - 1] ==
+                                                           self.delta_t_snapshots):
+                number_of_solutions += 1
+            self.reset_snapshots(dataprev[:number_of_solutions])
+
+    def save_restart_data(self):
+        restart_data = super().save_restart_data()
+        restart_data.update({'basis': self.basis, 'coefficients': self.coefficients,
+                             'delta_t_snapshots': self.delta_t_snapshots})
+        return restart_data
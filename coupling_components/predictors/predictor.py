@@ -1,12 +1,14 @@
 from coconut.coupling_components.component import Component
 
+import numpy as np
+
 
 def create(parameters):
     return Predictor(parameters)
 
 
 # base class for extrapolation based on the last two (linear), three (quadratic) or four (cubic) time steps,
-# assuming constant time step size
+# assuming constant time step size unless the time step size is set
 class Predictor(Component):
     def __init__(self, _unused):
         super().__init__()
@@ -14,6 +16,8 @@ class Predictor(Component):
         self.updated = False
         self.dataprev = None
         self.order = None
+        self.delta_t = None  # size of current time step, only set if the time step size is variable
+        self.delta_tprev = []  # sizes of the time steps between the solutions in dataprev
 
     def initialize(self, x):
         super().initialize()
@@ -45,7 +49,7 @@ class Predictor(Component):
             if len(self.dataprev) == 1:
                 y = self.dataprev[0]
             else:
-                y = 2 * self.dataprev[0] - self.dataprev[1]
+                y = self.extrapolate(self.get_coefficients(2))
             x.set_interface_data(y)
             return x
         else:
@@ -56,7 +60,7 @@ class Predictor(Component):
         if not self.updated:
             if len(self.dataprev) < 3:
                 raise Exception('Not sufficient information for quadratic extrapolation')
-            y = 3.0 * self.dataprev[0] - 3.0 * self.dataprev[1] + 1.0 * self.dataprev[2]
+            y = self.extrapolate(self.get_coefficients(3))
             x.set_interface_data(y)
             return x
         else:
@@ -67,7 +71,10 @@ class Predictor(Component):
         if not self.updated:
             if len(self.dataprev) < 3:
                 raise Exception('Not sufficient information for quadratic extrapolation')
-            y = 2.5 * self.dataprev[0] - 2.0 * self.dataprev[1] + 0.5 * self.dataprev[2]
+            # linear extrapolation with the derivative of the quadratic interpolation in the last time step
+            coefficients = self.get_coefficients(3, derivative=True)
+            coefficients[0] += 1.
+            y = self.extrapolate(coefficients)
             x.set_interface_data(y)
             return x
         else:
@@ -78,31 +85,65 @@ class Predictor(Component):
         if not self.updated:
             if len(self.dataprev) < 4:
                 raise Exception('Not sufficient information for cubic extrapolation')
-            y = 4.0 * self.dataprev[0] - 6.0 * self.dataprev[1] + 4.0 * self.dataprev[2] - 1.0 * self.dataprev[3]
+            y = self.extrapolate(self.get_coefficients(4))
             x.set_interface_data(y)
             return x
         else:
             raise Exception('Already updated')
 
+    def get_times(self, n):
+        # times of the last n solutions relative to the last one, scaled with the size of the current time step
+        ratios = np.ones(n - 1)
+        if self.delta_t is not None:
+            for i, delta_t in enumerate(self.delta_tprev[:n - 1]):
+                if delta_t is not None:
+                    ratios[i] = delta_t / self.delta_t
+        return np.concatenate(([0.], -np.cumsum(ratios)))
+
+    def get_coefficients(self, n, derivative=False):
+        # coefficients of the last n solutions in the Lagrange polynomial at the end of the current time step,
+        # or in its derivative in the last time step, for constant time step size these are integers or halves
+        times = self.get_times(n)
+        coefficients = np.zeros(n)
+        for i in range(n):
+            others = np.delete(times, i)
+            if derivative:
+                numerator = sum(np.prod(-np.delete(others, k)) for k in range(n - 1))
+            else:
+                numerator = np.prod(1. - others)
+            coefficients[i] = numerator / np.prod(times[i] - others)
+        return coefficients
+
+    def extrapolate(self, coefficients):
+        return sum(coefficient * data for coefficient, data in zip(coefficients, self.dataprev))
+
     def predict(self, x):
         pass
 
+    def set_delta_t(self, delta_t):
+        self.delta_t = delta_t
+
     def update(self, x):
         if not self.updated:
             self.dataprev = [x.get_interface_data()] + self.dataprev
+            self.delta_tprev = [self.delta_t] + self.delta_tprev
             if len(self.dataprev) > self.order + 1:
                 self.dataprev.pop()
+            if len(self.delta_tprev) > self.order:
+                self.delta_tprev.pop()
             self.updated = True
         else:
             raise Exception('Already updated')
 
     def restart(self, restart_data):
         self.dataprev = restart_data['dataprev']
+        self.delta_tprev = restart_data.get('delta_tprev', [])
         while len(self.dataprev) > self.order + 1:
             self.dataprev.pop()
+        del self.delta_tprev[self.order:]
 
     def check_restart_data(self, restart_data):
         pass
 
     def save_restart_data(self):
-        return {'dataprev': self.dataprev}
+        return {'dataprev': self.dataprev, 'delta_tprev': self.delta_tprev}
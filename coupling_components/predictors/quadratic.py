@@ -5,7 +5,7 @@ def create(parameters):
     return PredictorQuadratic(parameters)
 
 
-# quadratic extrapolation based on the last three time steps, assuming constant time step size
+# quadratic extrapolation based on the last three time steps
 class PredictorQuadratic(Predictor):
     def __init__(self, _unused):
         super().__init__(_unused)
@@ -22,6 +22,7 @@ def create(parameters):
 class SolverWrapperAbaqus(SolverWrapper):
     version = None  # Abaqus version, e.g. 2022, set in subclass
     check_coupling_convergence_possible = False  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     # define input and output variables
     accepted_in_var = ['pressure', 'traction']
@@ -291,7 +292,7 @@ class SolverWrapperAbaqus(SolverWrapper):
         self.iteration += 1
 
         # store incoming loads
-        self.interface_input.set_interface_data(interface_input.get_interface_data())
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
 
         # write loads (from interface data to a file that will be read by USR.f)
         self.write_loads()
@@ -24,6 +24,8 @@ def create(parameters):
 class SolverWrapperAbaqusCSE(SolverWrapper):
     version = None  # Abaqus version, e.g. 2024, set in subclass
     check_coupling_convergence_possible = False  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
+    split_solution_step = True  # is solve_solution_step split in submit and collect?
 
     # define input and output variables
     accepted_in_var = ['pressure', 'traction']
@@ -203,12 +205,11 @@ class SolverWrapperAbaqusCSE(SolverWrapper):
         self.coco_messages.send_message('next')
         self.coco_messages.wait_message('next_ready')
 
-    @tools.time_solve_solution_step
-    def solve_solution_step(self, interface_input):
+    def submit_solution_step(self, interface_input):
         self.iteration += 1
 
         # store incoming loads
-        self.interface_input = interface_input.copy()
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
 
         # write loads to a file read by AbaqusWrapper
         comps = {1: '', 2: 'x y', 3: 'x y z'}
@@ -228,8 +229,11 @@ class SolverWrapperAbaqusCSE(SolverWrapper):
                 self.copy_for_debugging(join(self.dir_csm, f'pressure_mp{mp_id}.txt'))
                 self.copy_for_debugging(join(self.dir_csm, f'traction_mp{mp_id}.txt'))
 
-        # let AbaqusWrapper run, wait for data
+        # let AbaqusWrapper run
         self.coco_messages.send_message('continue')
+
+    def collect_solution_step(self):
+        # wait for data
         self.coco_messages.wait_message('continue_ready')
 
         # TODO: implement check to see if Abaqus converged after one iteration
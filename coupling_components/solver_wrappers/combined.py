@@ -2,6 +2,9 @@ from coconut.tools import create_instance
 from coconut.coupling_components.solver_wrappers.solver_wrapper import SolverWrapper
 from coconut import tools
 
+import time
+from concurrent.futures import wait
+
 
 def create(parameters):
     return SolverWrapperCombined(parameters)
@@ -9,6 +12,7 @@ def create(parameters):
 
 class SolverWrapperCombined(SolverWrapper):
     check_coupling_convergence_possible = False  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     @tools.time_initialize
     def __init__(self, parameters):
@@ -44,6 +48,8 @@ class SolverWrapperCombined(SolverWrapper):
                 self.mapped_solver_wrappers.append(sol_wrapper)
 
         self.master_solver_wrapper = self.solver_wrappers[self.master_sol_index]
+        self.concurrent = self.settings.get('concurrent', True)  # solve the solver wrappers at the same time
+        self.solve_time = 0.0  # wall time of the solver wrapper calls
 
     @tools.time_initialize
     def initialize(self):
@@ -64,12 +70,38 @@ class SolverWrapperCombined(SolverWrapper):
 
     @tools.time_solve_solution_step
     def solve_solution_step(self, interface_input):
-        self.interface_output = self.master_solver_wrapper.solve_solution_step(interface_input.copy()).copy()
-        for sol_wrapper in self.mapped_solver_wrappers:
-            other_interface_output = sol_wrapper.solve_solution_step(interface_input.copy()).copy()
-            self.interface_output += other_interface_output
+        start_time = time.time()
+        if self.concurrent:
+            # all solver wrappers run at the same time, the outputs are summed in a fixed order once all are done
+            futures = [self.master_solver_wrapper.solve_solution_step_async(
+                tools.get_solver_input(self.master_solver_wrapper, interface_input))]
+            for sol_wrapper in self.mapped_solver_wrappers:
+                futures.append(sol_wrapper.solve_solution_step_async(tools.get_solver_input(sol_wrapper,
+                                                                                            interface_input)))
+            wait(futures)
+            self.interface_output = futures[0].result().copy()
+            for future in futures[1:]:
+                self.interface_output += future.result()
+        else:
+            self.interface_output = self.master_solver_wrapper.solve_solution_step(
+                tools.get_solver_input(self.master_solver_wrapper, interface_input)).copy()
+            for sol_wrapper in self.mapped_solver_wrappers:
+                interface_input_sol_wrapper = tools.get_solver_input(sol_wrapper, interface_input)
+                self.interface_output += sol_wrapper.solve_solution_step(interface_input_sol_wrapper)
+        self.solve_time += time.time() - start_time
         return self.interface_output
 
+    def set_delta_t(self, delta_t):
+        for sol_wrapper in self.solver_wrappers:
+            sol_wrapper.set_delta_t(delta_t)
+
+    def save_state(self):
+        return [sol_wrapper.save_state() for sol_wrapper in self.solver_wrappers]
+
+    def restore_state(self, state):
+        for sol_wrapper, sol_wrapper_state in zip(self.solver_wrappers, state):
+            sol_wrapper.restore_state(sol_wrapper_state)
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -106,8 +138,12 @@ class SolverWrapperCombined(SolverWrapper):
             time_allocation_sub['total'] = self.__getattribute__(time_type)
             for i, solver_wrapper in enumerate(self.solver_wrappers):
                 time_allocation_sub[f'solver_wrapper_{i}'] = solver_wrapper.get_time_allocation()[time_type]
-            time_allocation_sub['coupling'] = self.__getattribute__(time_type) - sum(
-                [s.__getattribute__(time_type) for s in self.solver_wrappers])
+            if time_type == 'run_time':
+                # solver wrappers can run at the same time, so their wall time is subtracted instead of their sum
+                time_allocation_sub['coupling'] = self.run_time - self.solve_time
+            else:
+                time_allocation_sub['coupling'] = self.__getattribute__(time_type) - sum(
+                    [s.__getattribute__(time_type) for s in self.solver_wrappers])
         return time_allocation
 
     def print_components_info(self, pre):
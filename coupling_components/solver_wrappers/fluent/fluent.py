@@ -22,6 +22,8 @@ class SolverWrapperFluent(SolverWrapper):
     version = None  # Fluent product version, as from 2023R1 typically of the form 'xxxRx', set in subclass
     version_bis = None  # Fluent internal version, typically of the form 'x.x.0', set in subclass
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
+    split_solution_step = True  # is solve_solution_step split in submit and collect?
 
     # define input and output variables
     accepted_in_var = ['displacement']
@@ -57,6 +59,7 @@ class SolverWrapperFluent(SolverWrapper):
         self.dimensions = self.settings['dimensions']
         self.unsteady = self.settings['unsteady']
         self.multiphase = self.settings.get('multiphase', False)
+        self.reorder_nodes = self.settings.get('reorder_nodes', False)  # sort points of ModelParts along Morton curve
         self.flow_iterations = self.settings['flow_iterations']
         self.delta_t = self.settings['delta_t']
         self.timestep_start = self.settings['timestep_start']
@@ -257,7 +260,7 @@ class SolverWrapperFluent(SolverWrapper):
             ids = ids_tmp[args]
 
             # create ModelPart
-            self.model.create_model_part(mp_name, x0, y0, z0, ids)
+            self.model.create_model_part(mp_name, x0, y0, z0, ids, reorder=self.reorder_nodes)
 
         # create output ModelParts (faces)
         for item in (self.settings['interface_output']):
@@ -290,7 +293,7 @@ class SolverWrapperFluent(SolverWrapper):
             ids = ids_tmp[args]
 
             # create ModelPart
-            self.model.create_model_part(mp_name, x0, y0, z0, ids)
+            self.model.create_model_part(mp_name, x0, y0, z0, ids, reorder=self.reorder_nodes)
 
         # create Interfaces
         self.interface_input = data_structure.Interface(self.settings['interface_input'], self.model)
@@ -305,12 +308,11 @@ class SolverWrapperFluent(SolverWrapper):
         self.coco_messages.send_message('next')
         self.coco_messages.wait_message('next_ready')
 
-    @tools.time_solve_solution_step
-    def solve_solution_step(self, interface_input):
+    def submit_solution_step(self, interface_input):
         self.iteration += 1
 
         # store incoming displacements
-        self.interface_input.set_interface_data(interface_input.get_interface_data())
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
 
         # write interface data
         self.write_node_positions()
@@ -325,8 +327,11 @@ class SolverWrapperFluent(SolverWrapper):
                 cmd = f'cp {join(self.dir_cfd, src)} {join(self.dir_cfd, dst)}'
                 os.system(cmd)
 
-        # let Fluent run, wait for data
+        # let Fluent run
         self.coco_messages.send_message('continue')
+
+    def collect_solution_step(self):
+        # wait for data
         self.coco_messages.wait_message('continue_ready')
 
         if self.check_coupling_convergence:
@@ -369,11 +374,11 @@ class SolverWrapperFluent(SolverWrapper):
             model_part = self.model.get_model_part(mp_name)
             if ids.size != model_part.size:
                 raise ValueError('Size of data does not match size of ModelPart')
-            if not np.all(ids == model_part.id):
+            if not np.all(model_part.from_original_order(ids) == model_part.id):
                 raise ValueError('IDs of data do not match ModelPart IDs')
 
-            self.interface_output.set_variable_data(mp_name, 'traction', traction)
-            self.interface_output.set_variable_data(mp_name, 'pressure', pressure)
+            self.interface_output.set_variable_data(mp_name, 'traction', model_part.from_original_order(traction))
+            self.interface_output.set_variable_data(mp_name, 'pressure', model_part.from_original_order(pressure))
 
         # return interface_output object
         return self.interface_output
@@ -471,14 +476,13 @@ class SolverWrapperFluent(SolverWrapper):
             thread_id = self.model_part_thread_ids[mp_name]
             model_part = self.model.get_model_part(mp_name)
             displacement = self.interface_input.get_variable_data(mp_name, 'displacement')
-            x = model_part.x0 + displacement[:, 0]
-            y = model_part.y0 + displacement[:, 1]
-            z = model_part.z0 + displacement[:, 2]
+            x, y, z = model_part.to_original_order(model_part.coords + displacement).T
+            ids = model_part.to_original_order(model_part.id)
             if self.dimensions == 2:
-                data = np.rec.fromarrays([x, y, model_part.id])
+                data = np.rec.fromarrays([x, y, ids])
                 fmt = '%27.17e%27.17e%27d'
             else:
-                data = np.rec.fromarrays([x, y, z, model_part.id])
+                data = np.rec.fromarrays([x, y, z, ids])
                 fmt = '%27.17e%27.17e%27.17e%27d'
             tmp = f'nodes_update_timestep{self.timestep}_thread{thread_id}.dat'
             file_name = join(self.dir_cfd, tmp)
@@ -19,6 +19,8 @@ def create(parameters):
 class SolverWrapperKratosStructure(SolverWrapper):
     version = None  # KratosMultiphysics version, set in subclass, for version 9.1 f. ex.: '91'
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
+    split_solution_step = True  # is solve_solution_step split in submit and collect?
 
     # define input and output variables
     accepted_in_var = ['pressure', 'traction']
@@ -42,6 +44,7 @@ class SolverWrapperKratosStructure(SolverWrapper):
         self.timestep_start = self.settings['timestep_start']
         self.timestep = self.timestep_start
         self.save_restart = self.settings.get('save_restart', 0)
+        self.shared_memory = self.settings.get('shared_memory', False)  # exchange data in shared memory, not files
         self.iteration = None
 
         self.interface_sub_model_parts_list = self.settings['kratos_interface_sub_model_parts_list']
@@ -92,6 +95,13 @@ class SolverWrapperKratosStructure(SolverWrapper):
         self.interface_input = Interface(self.settings['interface_input'], self.model)
         self.interface_output = Interface(self.settings['interface_output'], self.model)
 
+        # shared memory: Kratos reads the input from and writes the output to the buffers of the interfaces
+        if self.shared_memory:
+            descriptors = {'input': self.interface_input.move_to_shared_memory(),
+                           'output': self.interface_output.move_to_shared_memory()}
+            with open(join(self.working_directory, 'shared_memory.json'), 'w') as file:
+                json.dump(descriptors, file, indent=2)
+
     def initialize_solution_step(self):
         super().initialize_solution_step()
 
@@ -101,13 +111,15 @@ class SolverWrapperKratosStructure(SolverWrapper):
         self.coco_messages.send_message('next')
         self.coco_messages.wait_message('next_ready')
 
-    @tools.time_solve_solution_step
-    def solve_solution_step(self, interface_input):
+    def submit_solution_step(self, interface_input):
         self.iteration += 1
 
-        self.interface_input.set_interface_data(interface_input.get_interface_data())
-        self.write_input_data()
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
+        if not self.shared_memory:
+            self.write_input_data()
         self.coco_messages.send_message('continue')
+
+    def collect_solution_step(self):
         self.coco_messages.wait_message('continue_ready')
 
         if self.check_coupling_convergence:
@@ -116,7 +128,8 @@ class SolverWrapperKratosStructure(SolverWrapper):
             if self.print_coupling_convergence and self.coupling_convergence:
                 tools.print_info(f'{self.__class__.__name__} converged')
 
-        self.update_interface_output()
+        if not self.shared_memory:
+            self.update_interface_output()
         return self.get_interface_output()
 
     def finalize_solution_step(self):
@@ -142,16 +155,24 @@ class SolverWrapperKratosStructure(SolverWrapper):
         # remove unnecessary files
         with tools.cd(self.working_directory):
             for mp_name in self.interface_sub_model_parts_list:
-                os.remove(f'{mp_name}_displacement.csv')
-                os.remove(f'{mp_name}_pressure.csv')
-                os.remove(f'{mp_name}_traction.csv')
+                if not self.shared_memory:
+                    os.remove(f'{mp_name}_displacement.csv')
+                    os.remove(f'{mp_name}_pressure.csv')
+                    os.remove(f'{mp_name}_traction.csv')
                 os.remove(f'{mp_name}_nodes.csv')
+            if self.shared_memory:
+                os.remove('shared_memory.json')
+
+        # move interface data back from shared memory, which is removed
+        if self.shared_memory:
+            self.interface_input.release_shared_memory()
+            self.interface_output.release_shared_memory()
 
     def write_input_data(self):
         for mp_name in self.interface_sub_model_parts_list:
             input_mp_name = f'{mp_name}_input'
             input_mp = self.model.get_model_part(input_mp_name)
-            node_ids = np.array([input_mp.id[i] for i in range(input_mp.size)])
+            node_ids = input_mp.id
 
             file_path_pr = os.path.join(self.working_directory, f'{mp_name}_pressure.csv')
             pressure_array = self.interface_input.get_variable_data(input_mp_name, 'pressure')
@@ -196,6 +217,7 @@ class SolverWrapperKratosStructure(SolverWrapper):
         kratos_parameters['interface_sub_model_parts_list'] = self.interface_sub_model_parts_list
         kratos_parameters['pressure_directions'] = self.check_pressure_directions()
         kratos_parameters['check_coupling_convergence'] = self.check_coupling_convergence
+        kratos_parameters['shared_memory'] = self.shared_memory
 
         if self.save_restart:
             restart_save_dict = {'restart_processes': [{'python_module': 'save_restart_process',
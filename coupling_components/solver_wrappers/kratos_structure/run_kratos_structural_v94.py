@@ -2,8 +2,10 @@ import KratosMultiphysics as KM
 from KratosMultiphysics import StructuralMechanicsApplication as SM
 from KratosMultiphysics.StructuralMechanicsApplication.structural_mechanics_analysis import StructuralMechanicsAnalysis
 
+from multiprocessing import shared_memory, resource_tracker
 import os
 import time
+import json
 import pandas as pd
 import numpy as np
 
@@ -18,6 +20,9 @@ class StructuralMechanicsWrapper94(StructuralMechanicsAnalysis):
         self.max_iteration_number = None
         self.pressure_directions = [direc.GetInt() for direc in project_parameters['pressure_directions'].values()]
         self.check_coupling_convergence = project_parameters['check_coupling_convergence'].GetBool()
+        self.shared_memory = project_parameters['shared_memory'].GetBool()
+        self.shared_memory_handles = []
+        self.shared_data = None  # views on the interface data in shared memory, per model part and variable
 
     def Initialize(self):
         super().Initialize()
@@ -35,7 +40,30 @@ class StructuralMechanicsWrapper94(StructuralMechanicsAnalysis):
                 {'node_id': node_ids, 'x0': node_coords[:, 0], 'y0': node_coords[:, 1], 'z0': node_coords[:, 2]})
             node_coords_df.to_csv(file_name_nodes, index=False)
 
+    def AttachSharedMemory(self):
+        # attach to the shared memory of the input and output interfaces of CoCoNuT, which owns this memory
+        with open('shared_memory.json', 'r') as file:
+            descriptors = json.load(file)
+        self.shared_data = {}
+        for descriptor in descriptors.values():
+            shm = shared_memory.SharedMemory(name=descriptor['name'])
+            resource_tracker.unregister(shm._name, 'shared_memory')  # do not remove shared memory at exit
+            self.shared_memory_handles.append(shm)
+            data = np.ndarray((descriptor['size'],), dtype=descriptor['dtype'], buffer=shm.buf)
+            for model_part_name, variable, start, stop, n_points, n_components in descriptor['variables']:
+                sub_model_part_name = model_part_name.rsplit('_', 1)[0]  # remove suffix _input or _output
+                self.shared_data.setdefault(sub_model_part_name, {})[variable] = \
+                    data[start:stop].reshape(n_points, n_components)
+
+    def DetachSharedMemory(self):
+        self.shared_data = None
+        for shm in self.shared_memory_handles:
+            shm.close()
+        self.shared_memory_handles = []
+
     def InitializeSolutionStep(self):
+        if self.shared_memory and self.shared_data is None:
+            self.AttachSharedMemory()
         self.time = self._GetSolver().AdvanceInTime(self.time)
         super().InitializeSolutionStep()
         self._GetSolver().Predict()
@@ -67,6 +95,11 @@ class StructuralMechanicsWrapper94(StructuralMechanicsAnalysis):
             full_sub_model_part_name = 'Structure.' + sub_model_part_name
             if self.model['Structure'].HasSubModelPart(sub_model_part_name):
                 sub_model_part = self.model[full_sub_model_part_name]
+                if self.shared_memory:
+                    # nodes are in the same order as in the nodes file, from which the model part was created
+                    self.shared_data[sub_model_part_name]['displacement'][:] = np.array(
+                        [list(node.GetSolutionStepValue(KM.DISPLACEMENT)) for node in sub_model_part.Nodes])
+                    continue
                 file_name = f'{sub_model_part_name}_displacement.csv'
                 node_ids = np.array([node.Id for node in sub_model_part.Nodes])
                 displacement = np.array(
@@ -83,6 +116,9 @@ class StructuralMechanicsWrapper94(StructuralMechanicsAnalysis):
             full_sub_model_part_name = 'Structure.' + sub_model_part_name
             if self.model['Structure'].HasSubModelPart(sub_model_part_name):
                 sub_model_part = self.model[full_sub_model_part_name]
+                if self.shared_memory:
+                    self.InputSharedData(sub_model_part, sub_model_part_name, pressure_direction)
+                    continue
                 file_name_pr = f'{sub_model_part_name}_pressure.csv'
                 if os.path.isfile(file_name_pr):
                     pressure_data = pd.read_csv(file_name_pr, skipinitialspace=True)
@@ -107,6 +143,17 @@ class StructuralMechanicsWrapper94(StructuralMechanicsAnalysis):
             else:
                 raise Exception(f'{sub_model_part_name} not present in the Kratos model.')
 
+    def InputSharedData(self, sub_model_part, sub_model_part_name, pressure_direction):
+        # nodes are in the same order as in the nodes file, from which the model part was created
+        shared_data = self.shared_data[sub_model_part_name]
+        if 'pressure' in shared_data:
+            for node, pressure in zip(sub_model_part.Nodes, shared_data['pressure'][:, 0]):
+                node.SetSolutionStepValue(KM.NEGATIVE_FACE_PRESSURE, 0, pressure_direction * pressure)
+        if 'traction' in shared_data:
+            kratos_variable = SM.SURFACE_LOAD if self.dimensions == 3 else SM.LINE_LOAD
+            for node, traction in zip(sub_model_part.Nodes, shared_data['traction']):
+                node.SetSolutionStepValue(kratos_variable, 0, list(traction))
+
     def GetSubModelPart(self, sub_model_part_name):
         full_sub_model_part_name = 'Structure.' + sub_model_part_name
         return self.model[full_sub_model_part_name]
@@ -153,6 +200,7 @@ if __name__ == '__main__':
 
         if os.path.isfile('stop.coco'):
             str_wrapper.Finalize()
+            str_wrapper.DetachSharedMemory()
             os.remove('stop.coco')
             open('stop_ready.coco', 'w').close()
             break
@@ -2,6 +2,9 @@ from coconut.tools import create_instance
 from coconut.coupling_components.solver_wrappers.solver_wrapper import SolverWrapper
 from coconut import tools
 
+import time
+from concurrent.futures import Future
+
 
 def create(parameters):
     return SolverWrapperMapped(parameters)
@@ -9,6 +12,7 @@ def create(parameters):
 
 class SolverWrapperMapped(SolverWrapper):
     mapped = True
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     @tools.time_initialize
     def __init__(self, parameters):
@@ -61,12 +65,39 @@ class SolverWrapperMapped(SolverWrapper):
 
     @tools.time_solve_solution_step
     def solve_solution_step(self, interface_input_from):
-        self.interface_input_from = interface_input_from.copy()
+        self.interface_input_from.set_interface_data(interface_input_from.get_interface_data(copy=False))
         self.mapper_interface_input(self.interface_input_from, self.interface_input_to)
         interface_output_from = self.solver_wrapper.solve_solution_step(self.interface_input_to)
         self.mapper_interface_output(interface_output_from, self.interface_output_to)
         return self.interface_output_to
 
+    def solve_solution_step_async(self, interface_input_from):
+        # input is mapped before returning, output is mapped as soon as the solver wrapper is done
+        start_time = time.time()
+        self.interface_input_from.set_interface_data(interface_input_from.get_interface_data(copy=False))
+        self.mapper_interface_input(self.interface_input_from, self.interface_input_to)
+        future = Future()
+
+        def map_output(future_from):
+            try:
+                self.mapper_interface_output(future_from.result(), self.interface_output_to)
+                self.run_time += time.time() - start_time
+                future.set_result(self.interface_output_to)
+            except BaseException as exception:
+                future.set_exception(exception)
+
+        self.solver_wrapper.solve_solution_step_async(self.interface_input_to).add_done_callback(map_output)
+        return future
+
+    def set_delta_t(self, delta_t):
+        self.solver_wrapper.set_delta_t(delta_t)
+
+    def save_state(self):
+        return self.solver_wrapper.save_state()
+
+    def restore_state(self, state):
+        self.solver_wrapper.restore_state(state)
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
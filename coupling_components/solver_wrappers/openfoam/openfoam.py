@@ -21,6 +21,8 @@ def create(parameters):
 class SolverWrapperOpenFOAM(SolverWrapper):
     version = None  # OpenFOAM version with dot, e.g. 8 , set in subclass
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
+    split_solution_step = True  # is solve_solution_step split in submit and collect?
 
     # define input and output variables
     accepted_in_var = ['displacement']
@@ -60,6 +62,9 @@ class SolverWrapperOpenFOAM(SolverWrapper):
         # set on True if you want to clean the adapted application and compile.
         self.compile_clean = self.settings.get('compile_clean', False)
 
+        # set on True to sort the points of the ModelParts along a Morton curve, for better memory locality
+        self.reorder_nodes = self.settings.get('reorder_nodes', False)
+
         # remove possible CoCoNuT-message from previous interrupt
         self.coco_messages = tools.CocoMessages(self.working_directory, max_wait_time=600,
                                                 timed_out_action=self.timed_out)
@@ -131,13 +136,13 @@ class SolverWrapperOpenFOAM(SolverWrapper):
 
             # create input model part
             self.model.create_model_part(f'{boundary}_input', node_coords[:, 0], node_coords[:, 1], node_coords[:, 2],
-                                         node_ids)
+                                         node_ids, reorder=self.reorder_nodes)
 
             x0, y0, z0 = self.read_face_centres(boundary, nfaces)
             ids = np.arange(start_face, start_face + nfaces)
 
             # create output model part
-            self.model.create_model_part(f'{boundary}_output', x0, y0, z0, ids)
+            self.model.create_model_part(f'{boundary}_output', x0, y0, z0, ids, reorder=self.reorder_nodes)
 
         # create interfaces
         self.interface_input = Interface(self.settings['interface_input'], self.model)
@@ -166,7 +171,7 @@ class SolverWrapperOpenFOAM(SolverWrapper):
                 mp_out_name = f'{boundary}_output'
                 mp_output = self.model.get_model_part(f'{boundary}_output')
                 nfaces = mp_output.size
-                start_face = mp_output.id[0]
+                start_face = mp_output.id.min()
                 self.mp_out_reconstruct_seq_dict[mp_out_name] = []
                 for p in range(self.cores):
                     path = os.path.join(self.working_directory, f'processor{p}/constant/polyMesh/faceProcAddressing')
@@ -193,9 +198,8 @@ class SolverWrapperOpenFOAM(SolverWrapper):
                     if point_ids.size:
                         with open(os.path.join(proc_dir, 'constant/polyMesh/pointProcAddressing'), 'r') as f:
                             point_proc_add = np.abs(of_io.get_scalar_array(input_string=f.read(), is_int=True))
-                        sorter = np.argsort(mp_input.id)
-                        self.mp_in_decompose_seq_dict[mp_in_name][p] = sorter[
-                            np.searchsorted(mp_input.id, point_proc_add[point_ids], sorter=sorter)]
+                        self.mp_in_decompose_seq_dict[mp_in_name][p] = mp_input.get_indices(
+                            point_proc_add[point_ids])
                     else:
                         self.mp_in_decompose_seq_dict[mp_in_name][p] = None
 
@@ -239,12 +243,11 @@ class SolverWrapperOpenFOAM(SolverWrapper):
         self.coco_messages.send_message('next')
         self.coco_messages.wait_message('next_ready')
 
-    @tools.time_solve_solution_step
-    def solve_solution_step(self, interface_input):
+    def submit_solution_step(self, interface_input):
         self.iteration += 1
 
         # store incoming displacements
-        self.interface_input.set_interface_data(interface_input.get_interface_data())
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
 
         # write interface data to OpenFOAM-file
         self.write_node_input()
@@ -267,6 +270,8 @@ class SolverWrapperOpenFOAM(SolverWrapper):
         self.delete_prev_iter_output()
 
         self.coco_messages.send_message('continue')
+
+    def collect_solution_step(self):
         self.coco_messages.wait_message('continue_ready')
 
         if self.check_coupling_convergence:
@@ -400,6 +405,9 @@ class SolverWrapperOpenFOAM(SolverWrapper):
             wall_shear_stress[pos_list] = wss_tmp[:, ]
             pressure[pos_list, 0] = pres_tmp
 
+            wall_shear_stress = mp.from_original_order(wall_shear_stress)
+            pressure = mp.from_original_order(pressure)
+
             self.interface_output.set_variable_data(mp_name, 'traction', -wall_shear_stress * self.density_for_traction)
             self.interface_output.set_variable_data(mp_name, 'pressure', pressure * self.density_for_pressure)
 
@@ -426,7 +434,8 @@ class SolverWrapperOpenFOAM(SolverWrapper):
 
             for boundary in self.boundary_names:
                 mp_name = f'{boundary}_input'
-                displacement = self.interface_input.get_variable_data(mp_name, 'displacement')
+                displacement = self.model.get_model_part(mp_name).to_original_order(
+                    self.interface_input.get_variable_data(mp_name, 'displacement'))
                 boundary_dict = of_io.get_dict(input_string=pointdisp_string, keyword=boundary)
                 boundary_dict_new = of_io.update_vector_array_dict(dict_string=boundary_dict, vector_array=displacement)
                 pointdisp_string = pointdisp_string.replace(boundary_dict, boundary_dict_new)
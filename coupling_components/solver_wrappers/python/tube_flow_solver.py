@@ -19,6 +19,7 @@ class SolverWrapperTubeFlow(SolverWrapper):
     al = 4  # number of terms below diagonal in matrix
     au = 4  # number of terms above diagonal in matrix
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     # define input and output variables
     accepted_in_var = ['displacement']
@@ -97,6 +98,8 @@ class SolverWrapperTubeFlow(SolverWrapper):
 
         self.k = 0  # iteration
         self.n = self.timestep_start  # time step
+        self.n_reference = 0  # time step since which the time step size is constant
+        self.time_reference = 0  # time at time step n_reference
         if self.unsteady:
             self.dt = self.settings['delta_t']  # time step size
             self.alpha = np.pi * self.d ** 2 / 4 / (self.ureference + self.dz / self.dt)  # Numerical damping
@@ -123,6 +126,11 @@ class SolverWrapperTubeFlow(SolverWrapper):
             self.u = data['u']  # velocity
             self.p = data['p']  # kinematic pressure
             self.a = data['a']  # area of cross section
+            self.n_reference = data.get('n_reference', 0)
+            self.time_reference = data.get('time_reference', 0)
+            if self.unsteady and data.get('delta_t', self.dt) != self.dt:  # time step size changed
+                self.time_reference += (self.timestep_start - self.n_reference) * data['delta_t']
+                self.n_reference = self.timestep_start
 
         self.un = np.array(self.u)  # previous velocity
         self.pn = np.array(self.p)  # previous kinematic pressure (only value at outlet is used)
@@ -172,7 +180,7 @@ class SolverWrapperTubeFlow(SolverWrapper):
     @tools.time_solve_solution_step
     def solve_solution_step(self, interface_input):
         # input
-        self.interface_input = interface_input.copy()
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
         self.disp = interface_input.get_variable_data(self.input_model_part_name, 'displacement')
         a = np.pi * (self.d + 2 * self.disp[:, 1]) ** 2 / 4
 
@@ -238,6 +246,32 @@ class SolverWrapperTubeFlow(SolverWrapper):
         self.interface_output.set_variable_data(self.output_model_part_name, 'traction', self.trac)
         return self.interface_output
 
+    def set_delta_t(self, delta_t):
+        if self.unsteady and delta_t != self.dt:
+            # the end time of the current time step is the reference for the time step size from now on
+            self.time_reference = self.get_time()
+            self.n_reference = self.n
+            self.dt = delta_t
+            self.alpha = np.pi * self.d ** 2 / 4 / (self.ureference + self.dz / self.dt)
+            self.conditioning = self.alpha
+
+    def save_state(self):
+        return {'n': self.n, 'u': np.array(self.u), 'p': np.array(self.p), 'a': np.array(self.a),
+                'n_reference': self.n_reference, 'time_reference': self.time_reference, 'delta_t': self.dt,
+                'time': self.get_time()}
+
+    def restore_state(self, state):
+        self.n = state['n']
+        self.u = np.array(state['u'])
+        self.p = np.array(state['p'])
+        self.a = np.array(state['a'])
+        if state['delta_t'] == self.dt:
+            self.n_reference = state['n_reference']
+            self.time_reference = state['time_reference']
+        else:  # state of a solver with another time step size
+            self.n_reference = self.n
+            self.time_reference = state['time']
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -248,7 +282,8 @@ class SolverWrapperTubeFlow(SolverWrapper):
         if self.n > 0 and self.save_restart != 0 and self.n % self.save_restart == 0:
             file_name = join(self.working_directory, f'case_timestep{self.n}.pickle')
             with open(file_name, 'wb') as file:
-                pickle.dump({'a': self.a, 'p': self.p, 'u': self.u}, file)
+                pickle.dump({'a': self.a, 'p': self.p, 'u': self.u, 'n_reference': self.n_reference,
+                             'time_reference': self.time_reference, 'delta_t': self.dt}, file)
             if self.save_restart < 0 and self.n + self.save_restart > self.timestep_start:
                 try:
                     os.remove(join(self.working_directory, f'case_timestep{self.n + self.save_restart}.pickle'))
@@ -266,19 +301,23 @@ class SolverWrapperTubeFlow(SolverWrapper):
     def finalize(self):
         super().finalize()
 
+    def get_time(self):
+        return self.time_reference + (self.n - self.n_reference) * self.dt
+
     def get_inlet_boundary(self):
         if self.inlet_type == 1:
             x = self.inlet_reference \
-                + self.inlet_amplitude * np.sin(2 * np.pi * (self.n * self.dt) / self.inlet_period)
+                + self.inlet_amplitude * np.sin(2 * np.pi * self.get_time() / self.inlet_period)
         elif self.inlet_type == 2:
-            x = self.inlet_reference + (self.inlet_amplitude if self.n <= self.inlet_period / self.dt else 0)
+            x = self.inlet_reference + (self.inlet_amplitude if self.n - self.n_reference
+                                        <= (self.inlet_period - self.time_reference) / self.dt else 0)
         elif self.inlet_type == 3:
             x = self.inlet_reference \
-                + self.inlet_amplitude * (np.sin(np.pi * (self.n * self.dt) / self.inlet_period)) ** 2
+                + self.inlet_amplitude * (np.sin(np.pi * self.get_time() / self.inlet_period)) ** 2
         elif self.inlet_type == 4:
             x = self.inlet_reference + self.inlet_amplitude
         else:
-            x = self.inlet_reference + self.inlet_amplitude * (self.n * self.dt) / self.inlet_period
+            x = self.inlet_reference + self.inlet_amplitude * self.get_time() / self.inlet_period
         return x
 
     def get_residual(self):
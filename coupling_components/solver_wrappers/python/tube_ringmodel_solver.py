@@ -13,6 +13,7 @@ def create(parameters):
 
 class SolverWrapperTubeRingmodel(SolverWrapper):
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     # define input and output variables
     accepted_in_var = ['pressure', 'traction']
@@ -103,7 +104,7 @@ class SolverWrapperTubeRingmodel(SolverWrapper):
     @tools.time_solve_solution_step
     def solve_solution_step(self, interface_input):
         # input
-        self.interface_input = interface_input.copy()
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
         self.p = interface_input.get_variable_data(self.input_model_part_name,
                                                    'pressure').flatten() / self.rhof  # kinematic pressure
 
@@ -142,6 +143,16 @@ class SolverWrapperTubeRingmodel(SolverWrapper):
         self.interface_output.set_variable_data(self.output_model_part_name, 'displacement', self.disp)
         return self.interface_output
 
+    def set_delta_t(self, delta_t):
+        pass  # no time derivatives
+
+    def save_state(self):
+        return {'n': self.n, 'a': np.array(self.a)}
+
+    def restore_state(self, state):
+        self.n = state['n']
+        self.a = np.array(state['a'])
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
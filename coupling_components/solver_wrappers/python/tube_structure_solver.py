@@ -19,6 +19,7 @@ class SolverWrapperTubeStructure(SolverWrapper):
     al = 2  # number of terms below diagonal in matrix
     au = 2  # number of terms above diagonal in matrix
     check_coupling_convergence_possible = True  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
 
     # define input and output variables
     accepted_in_var = ['pressure', 'traction']
@@ -119,9 +120,7 @@ class SolverWrapperTubeStructure(SolverWrapper):
         self.disp = np.zeros((self.m, 3))  # displacement
         self.trac = np.zeros((self.m, 3))  # traction (always zero)
 
-        self.conditioning = ((self.rhos * self.h) / (self.beta * self.dt ** 2) * self.unsteady
-                             + 6.0 * self.b1 / self.dz ** 4
-                             + 2.0 * self.b2 / self.dz ** 2 + self.b3)  # factor for conditioning Jacobian
+        self.conditioning = self.get_conditioning()  # factor for conditioning Jacobian
 
         # create ModelParts
         self.model = Model()
@@ -168,7 +167,7 @@ class SolverWrapperTubeStructure(SolverWrapper):
     @tools.time_solve_solution_step
     def solve_solution_step(self, interface_input):
         # input
-        self.interface_input = interface_input.copy()
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
         self.p = interface_input.get_variable_data(self.input_model_part_name, 'pressure').flatten()
 
         # coupling convergence
@@ -209,6 +208,27 @@ class SolverWrapperTubeStructure(SolverWrapper):
         self.interface_output.set_variable_data(self.output_model_part_name, 'displacement', self.disp)
         return self.interface_output
 
+    def set_delta_t(self, delta_t):
+        if self.unsteady and delta_t != self.dt:
+            self.dt = delta_t
+            self.conditioning = self.get_conditioning()
+            if self.solver == 'direct':
+                j = bnd.to_dense(self.get_jacobian())
+                self.ji = np.linalg.inv(j)
+
+    def save_state(self):
+        state = {'n': self.n, 'r': np.array(self.r)}
+        if self.unsteady:
+            state.update({'rdot': self.rdot, 'rddot': self.rddot})
+        return state
+
+    def restore_state(self, state):
+        self.n = state['n']
+        self.r = np.array(state['r'])
+        if self.unsteady:
+            self.rdot = state['rdot']
+            self.rddot = state['rddot']
+
     def finalize_solution_step(self):
         super().finalize_solution_step()
 
@@ -274,6 +294,11 @@ class SolverWrapperTubeStructure(SolverWrapper):
         f[self.m + 3] = self.rreference
         return f
 
+    def get_conditioning(self):
+        return ((self.rhos * self.h) / (self.beta * self.dt ** 2) * self.unsteady
+                + 6.0 * self.b1 / self.dz ** 4
+                + 2.0 * self.b2 / self.dz ** 2 + self.b3)
+
     def get_jacobian(self):
         j = np.zeros((self.al + self.au + 1, self.m + 4))
         j[self.au + 0 - 0, 0] = 1.0  # [0, 0]
@@ -1,11 +1,20 @@
 from coconut.coupling_components.component import Component
 from coconut import tools
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 
 class SolverWrapper(Component):
     # solver variable check, should be set in subclass
     accepted_in_var = None
     accepted_out_var = None
+    # False if solve_solution_step does not modify interface_input and keeps no reference to it after returning,
+    # in that case the caller may give a read-only view of its own data instead of a copy
+    mutates_input = True
+    # True if solve_solution_step is split in submit_solution_step, which passes the input to the solver and lets it
+    # run, and collect_solution_step, which waits for the solver and reads the output
+    split_solution_step = False
 
     def __init__(self, parameters):
         super().__init__()
@@ -46,12 +55,63 @@ class SolverWrapper(Component):
         # debug
         self.debug = self.settings.get('debug', False)  # save copy of input and output files in every iteration
 
+        self.executor = None  # thread in which asynchronous solution steps are run, created upon first use
+
     def initialize_solution_step(self):
         super().initialize_solution_step()
 
         if not self.mapped:
             self.coupling_convergence = False
 
+    def solve_solution_step_async(self, interface_input):
+        # returns a Future of the output of solve_solution_step, only one solution step can be running at a time
+        # by default, the complete solution step runs in a separate thread, interface_input should not be changed
+        # until the Future is done, for a split solution step the input is passed on to the solver before returning
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        if self.split_solution_step:
+            start_time = time.time()
+            self.submit_solution_step(interface_input)
+            return self.executor.submit(self.collect_solution_step_timed, start_time)
+        return self.executor.submit(self.solve_solution_step, interface_input)
+
+    def collect_solution_step_timed(self, start_time):
+        interface_output = self.collect_solution_step()
+        self.run_time += time.time() - start_time
+        return interface_output
+
+    @tools.time_solve_solution_step
+    def solve_solution_step(self, interface_input):
+        if not self.split_solution_step:
+            raise NotImplementedError(f'{self.__class__.__name__} does not implement solve_solution_step')
+        self.submit_solution_step(interface_input)
+        return self.collect_solution_step()
+
+    def submit_solution_step(self, interface_input):
+        raise NotImplementedError(f'{self.__class__.__name__} does not split solve_solution_step')
+
+    def collect_solution_step(self):
+        raise NotImplementedError(f'{self.__class__.__name__} does not split solve_solution_step')
+
+    def set_delta_t(self, delta_t):
+        # change the time step size, called before initialize_solution_step of the time step with the new size
+        raise NotImplementedError(f'{self.__class__.__name__} does not support a variable time step size')
+
+    def save_state(self):
+        # state of the solver at the end of the last finalized time step, called between time steps
+        raise NotImplementedError(f'{self.__class__.__name__} does not support restoring a previous state')
+
+    def restore_state(self, state):
+        # return to a state obtained with save_state, called between time steps
+        raise NotImplementedError(f'{self.__class__.__name__} does not support restoring a previous state')
+
+    def finalize(self):
+        super().finalize()
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
     def get_interface_input(self):
         return self.interface_input.copy()
 
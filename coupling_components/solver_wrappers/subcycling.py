@@ -0,0 +1,158 @@
+from coconut.tools import create_instance
+from coconut.coupling_components.solver_wrappers.solver_wrapper import SolverWrapper
+from coconut import tools
+
+import os
+import copy
+from os.path import join
+import pickle
+
+
+def create(parameters):
+    return SolverWrapperSubcycling(parameters)
+
+
+# solver wrapper which performs multiple time steps of the solver wrapper it contains per time step of the coupling,
+# the input of these time steps is interpolated linearly in time between the inputs at the start and end of the
+# time step of the coupling, the output is averaged over these time steps or taken from the last one
+class SolverWrapperSubcycling(SolverWrapper):
+    check_coupling_convergence_possible = False  # can solver check convergence after 1 iteration?
+    mutates_input = False  # does solver modify or keep interface_input given to solve_solution_step?
+
+    @tools.time_initialize
+    def __init__(self, parameters):
+        super().__init__(parameters)
+
+        # read parameters
+        self.parameters = parameters
+        self.settings = parameters['settings']
+        self.number_of_substeps = self.settings['number_of_substeps']  # time steps of solver per time step
+        if not isinstance(self.number_of_substeps, int) or self.number_of_substeps < 1:
+            raise ValueError('Parameter "number_of_substeps" should be a positive integer')
+        self.average_output = self.settings.get('average_output', True)  # if false, output of last time step
+        self.working_directory = self.settings.get('working_directory', '.')  # directory for restart files
+        self.timestep_start = self.settings['timestep_start']
+        self.save_restart = self.settings['save_restart']
+
+        # create solver with time step size delta_t / number_of_substeps
+        solver_wrapper_parameters = copy.deepcopy(self.settings['solver_wrapper'])  # settings are not modified
+        solver_wrapper_settings = solver_wrapper_parameters['settings']
+        tools.pass_on_parameters(self.settings, solver_wrapper_settings,
+                                 ['timestep_start', 'number_of_timesteps', 'delta_t', 'save_restart'])
+        for key in ('timestep_start', 'number_of_timesteps', 'save_restart'):
+            if key in solver_wrapper_settings:
+                solver_wrapper_settings[key] *= self.number_of_substeps
+        solver_wrapper_settings['delta_t'] /= self.number_of_substeps
+        self.solver_wrapper = create_instance(solver_wrapper_parameters)
+
+        self.n = self.timestep_start  # time step
+        self.iteration = None  # number of solved solution steps in current time step
+        self.state = None  # state of solver at start of current time step
+        self.interface_input_previous = None  # input at end of previous time step
+        self.interface_input_substep = None
+
+    @tools.time_initialize
+    def initialize(self):
+        super().initialize()
+
+        self.solver_wrapper.initialize()
+
+        self.interface_input = self.solver_wrapper.get_interface_input()
+        self.interface_output = self.solver_wrapper.get_interface_output()
+        if self.timestep_start > 0:  # restart
+            file_name = join(self.working_directory, f'subcycling_timestep{self.timestep_start}.pickle')
+            with open(file_name, 'rb') as file:
+                data = pickle.load(file)
+            self.interface_input.set_interface_data(data['interface_input'])
+        self.interface_input_previous = self.interface_input.copy()
+        self.interface_input_substep = self.interface_input.copy()
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.n += 1
+        self.iteration = 0
+        try:
+            self.state = self.solver_wrapper.save_state()
+        except NotImplementedError:
+            self.state = None  # only one coupling iteration possible
+
+    @tools.time_solve_solution_step
+    def solve_solution_step(self, interface_input):
+        self.interface_input.set_interface_data(interface_input.get_interface_data(copy=False))
+        if self.iteration > 0:
+            # the time steps of the solver are performed again, starting from the state at the start of the time step
+            if self.state is None:
+                raise NotImplementedError(f'{self.solver_wrapper.__class__.__name__} does not support restoring a '
+                                          f'previous state, which is required for multiple coupling iterations')
+            self.solver_wrapper.finalize_solution_step()
+            self.solver_wrapper.restore_state(self.state)
+        self.iteration += 1
+
+        data_previous = self.interface_input_previous.get_interface_data(copy=False)
+        data = self.interface_input.get_interface_data(copy=False)
+        data_output = self.interface_output.get_interface_data(copy=False)
+        for i in range(1, self.number_of_substeps + 1):
+            self.solver_wrapper.initialize_solution_step()
+            if i < self.number_of_substeps:
+                self.interface_input_substep.set_interface_data(
+                    data_previous + i / self.number_of_substeps * (data - data_previous))
+            else:
+                self.interface_input_substep.set_interface_data(data)
+            data_output_substep = self.solver_wrapper.solve_solution_step(
+                self.interface_input_substep).get_interface_data(copy=False)
+            if not self.average_output:
+                data_output[:] = data_output_substep
+            elif i == 1:
+                data_output[:] = data_output_substep / self.number_of_substeps
+            else:
+                data_output += data_output_substep / self.number_of_substeps
+            if i < self.number_of_substeps:
+                self.solver_wrapper.finalize_solution_step()
+        return self.interface_output
+
+    def set_delta_t(self, delta_t):
+        self.solver_wrapper.set_delta_t(delta_t / self.number_of_substeps)
+
+    def finalize_solution_step(self):
+        super().finalize_solution_step()
+
+        self.solver_wrapper.finalize_solution_step()
+        self.interface_input_previous.set_interface_data(self.interface_input.get_interface_data(copy=False))
+
+    @tools.time_save
+    def output_solution_step(self):
+        super().output_solution_step()
+
+        self.solver_wrapper.output_solution_step()
+        if self.n > 0 and self.save_restart != 0 and self.n % self.save_restart == 0:
+            file_name = join(self.working_directory, f'subcycling_timestep{self.n}.pickle')
+            with open(file_name, 'wb') as file:
+                pickle.dump({'interface_input': self.interface_input_previous.get_interface_data()}, file)
+            if self.save_restart < 0 and self.n + self.save_restart > self.timestep_start:
+                try:
+                    os.remove(join(self.working_directory, f'subcycling_timestep{self.n + self.save_restart}.pickle'))
+                except OSError:
+                    pass
+
+    def finalize(self):
+        super().finalize()
+
+        self.solver_wrapper.finalize()
+
+    def get_time_allocation(self):
+        time_allocation = {}
+        for time_type in ('init_time', 'run_time', 'save_time'):
+            total_time = self.__getattribute__(time_type)
+            solver_wrapper_time = self.solver_wrapper.get_time_allocation()[time_type]
+            subcycling_time = total_time - (
+                solver_wrapper_time['total'] if isinstance(solver_wrapper_time, dict) else solver_wrapper_time)
+            time_allocation[time_type] = {'total': total_time, 'subcycling': subcycling_time,
+                                          'solver_wrapper': solver_wrapper_time}
+        return time_allocation
+
+    def print_components_info(self, pre):
+        tools.print_info(pre, 'The component ', self.__class__.__name__, ' subcycles the following solver wrapper ',
+                         f'({self.number_of_substeps} time steps per time step):')
+        pre = tools.update_pre(pre)
+        self.solver_wrapper.print_components_info(pre + '└─')
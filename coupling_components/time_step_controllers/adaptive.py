@@ -0,0 +1,72 @@
+from coconut import tools
+from coconut.coupling_components.component import Component
+
+
+def create(parameters):
+    return TimeStepControllerAdaptive(parameters)
+
+
+# time step size adapted to the coupling effort of the previous time step: number of iterations and residual reduction
+class TimeStepControllerAdaptive(Component):
+    def __init__(self, parameters):
+        super().__init__()
+
+        settings = parameters['settings']
+        self.delta_t_min = settings['delta_t_min']  # lower bound of time step size
+        self.delta_t_max = settings['delta_t_max']  # upper bound of time step size
+        self.target_iterations = settings.get('target_iterations', 5)  # number of iterations aimed for
+        self.increase_factor = settings.get('increase_factor', 1.5)  # maximal factor to increase time step size
+        self.decrease_factor = settings.get('decrease_factor', 0.5)  # minimal factor to decrease time step size
+        self.maximum_rate = settings.get('maximum_rate', 0.5)  # reduction rate above which time step size decreases
+        if not 0 < self.delta_t_min <= self.delta_t_max:
+            raise ValueError('Bounds of time step size should satisfy 0 < delta_t_min <= delta_t_max')
+        if not self.decrease_factor < 1 < self.increase_factor:
+            raise ValueError('Factors should satisfy decrease_factor < 1 < increase_factor')
+
+        self.delta_t = None  # time step size of next time step
+        self.norms = []  # residual norms of current time step
+
+    def initialize(self, delta_t):
+        super().initialize()
+
+        if not self.delta_t_min <= delta_t <= self.delta_t_max:
+            raise ValueError(f'Time step size {delta_t}s outside of bounds [{self.delta_t_min}s, {self.delta_t_max}s]')
+        self.delta_t = delta_t
+
+    def initialize_solution_step(self):
+        super().initialize_solution_step()
+
+        self.norms = []
+
+    def update(self, r):
+        self.norms.append(r.norm())
+
+    def finalize_solution_step(self):
+        super().finalize_solution_step()
+
+        iterations = len(self.norms)
+        rate = self.get_rate()
+        if rate > self.maximum_rate:
+            factor = self.decrease_factor
+        else:
+            factor = min(max(self.target_iterations / iterations, self.decrease_factor), self.increase_factor)
+        delta_t = min(max(self.delta_t * factor, self.delta_t_min), self.delta_t_max)
+        if delta_t != self.delta_t:
+            tools.print_info(f'Time step size changed from {self.delta_t:g}s to {delta_t:g}s '
+                             f'({iterations} iterations, reduction rate {rate:.2g})', layout='info')
+            self.delta_t = delta_t
+
+    def get_rate(self):
+        # average reduction of the residual norm per coupling iteration
+        if len(self.norms) < 2 or self.norms[0] == 0:
+            return 0.
+        return (self.norms[-1] / self.norms[0]) ** (1 / (len(self.norms) - 1))
+
+    def get_delta_t(self):
+        return self.delta_t
+
+    def restart(self, restart_data):
+        self.delta_t = restart_data['delta_t']
+
+    def save_restart_data(self):
+        return {'delta_t': self.delta_t}
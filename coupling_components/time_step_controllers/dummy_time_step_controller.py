@@ -0,0 +1,16 @@
+from coconut.coupling_components.component import Component
+
+
+def create(parameters):
+    return TimeStepControllerDummy(parameters)
+
+
+# fixed time step size
+class TimeStepControllerDummy(Component):
+    dummy = True
+
+    def __init__(self, _):
+        super().__init__()
+
+    def update(self, r):
+        pass
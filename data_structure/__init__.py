@@ -1,4 +1,6 @@
 from coconut.data_structure.model import Model
 from coconut.data_structure.model_part import ModelPart
 from coconut.data_structure.interface import Interface
+from coconut.data_structure.interface_pool import InterfacePool
+from coconut.data_structure.interface_block import InterfaceBlock
 from coconut.data_structure.variables import variables_dimensions
\ No newline at end of file
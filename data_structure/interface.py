@@ -1,16 +1,21 @@
 from coconut.data_structure.variables import variables_dimensions
 from coconut.data_structure.model import Model
+from coconut.data_structure.model_part import ModelPart
 
 import numpy as np
+from scipy.linalg import get_blas_funcs
+from multiprocessing import shared_memory
 import copy
+import json
+import os
 
 
 class Interface:
+    __shared_memory = None  # SharedMemory instance if the buffer is located in shared memory
 
     def __init__(self, parameters, model):
         self.__model = model
         self.__parameters = parameters
-        self.__data = {}
 
         if not type(model) == Model:
             raise TypeError('model should be an instance of the class Model')
@@ -28,22 +33,138 @@ class Interface:
                 raise TypeError(f'variables of {name} must be a list')
 
         for model_part_dict in parameters:
-            model_part_name = model_part_dict['model_part']
-            variables = model_part_dict['variables']
-            model_part = model.get_model_part(model_part_name)
-            self.__data[model_part_name] = {}
-            for variable in variables:
+            for variable in model_part_dict['variables']:
                 if variable not in variables_dimensions:
                     raise ValueError(f'invalid variable name "{variable}"')
-                shape = (model_part.size, variables_dimensions[variable])
-                self.__data[model_part_name][variable] = np.zeros(shape)
+        size = self.__create_layout()
 
+        # all data is stored in one contiguous 1D buffer, __data contains reshaped views on this buffer
+        self.__buffer = np.zeros(size)
+        self.__create_views()
+
+    def __create_layout(self):
+        # determine layout: position of each (model part, variable) block in the contiguous buffer
         tmp = []
-        for model_part_dict in parameters:
+        self.__offsets = {}
+        index = 0
+        for model_part_dict in self.__parameters:
             model_part_name = model_part_dict['model_part']
+            model_part = self.__model.get_model_part(model_part_name)
             for variable in model_part_dict['variables']:
+                shape = (model_part.size, variables_dimensions[variable])
+                self.__offsets[(model_part_name, variable)] = (index, index + shape[0] * shape[1], shape)
+                index += shape[0] * shape[1]
                 tmp.append((model_part_name, variable))
         self.__model_part_variable_pairs = tmp
+        return index
+
+    def __create_views(self):
+        self.__data = {}
+        for (model_part_name, variable), (start, stop, shape) in self.__offsets.items():
+            self.__data.setdefault(model_part_name, {})[variable] = self.__buffer[start:stop].reshape(shape)
+
+    def __getstate__(self):
+        # only the parameters, the ModelParts referred to and the buffer are pickled, the layout is recreated
+        return {'parameters': self.__parameters, 'model_parts': self.__get_model_parts(), 'buffer': self.__buffer}
+
+    def __setstate__(self, state):
+        if 'buffer' in state:
+            self.__parameters = state['parameters']
+            self.__model = Model()
+            for model_part in state['model_parts']:
+                self.__model.add_model_part(model_part)
+            self.__create_layout()
+            self.__buffer = state['buffer']
+            self.__create_views()
+            return
+        self.__dict__.update(state)  # Interface pickled with all its attributes
+        if '_Interface__buffer' not in state:  # pickled with separate array per model part and variable
+            self.__offsets = {}
+            index = 0
+            for model_part_name, variable in self.__model_part_variable_pairs:
+                shape = self.__data[model_part_name][variable].shape
+                self.__offsets[(model_part_name, variable)] = (index, index + shape[0] * shape[1], shape)
+                index += shape[0] * shape[1]
+            self.__buffer = np.concatenate([self.__data[model_part_name][variable].flatten()
+                                            for model_part_name, variable in self.__model_part_variable_pairs]
+                                           + [np.empty(0)]).astype(float)
+        self.__create_views()
+
+    def move_to_shared_memory(self):
+        # *** data is moved to newly created POSIX shared memory, to which another process can attach with the
+        # descriptor that is returned; copies and views created later on are not in shared memory
+        if self.__shared_memory is not None:
+            raise ValueError('Interface is already located in shared memory')
+        self.__check_writeable()
+        shm = shared_memory.SharedMemory(create=True, size=max(self.__buffer.nbytes, 1))
+        buffer = np.ndarray(self.__buffer.shape, dtype=self.__buffer.dtype, buffer=shm.buf)
+        buffer[:] = self.__buffer
+        self.__shared_memory = shm
+        self.__buffer = buffer
+        self.__create_views()
+        return self.shared_memory_descriptor
+
+    @property
+    def shared_memory_descriptor(self):
+        # json serializable dictionary with the name of the shared memory and the position of every variable
+        if self.__shared_memory is None:
+            return None
+        return {'name': self.__shared_memory.name, 'size': self.size, 'dtype': self.__buffer.dtype.str,
+                'variables': [[model_part_name, variable, start, stop, *shape] for (model_part_name, variable),
+                              (start, stop, shape) in self.__offsets.items()]}
+
+    def release_shared_memory(self):
+        # data is moved back to private memory, after which the shared memory is removed
+        if self.__shared_memory is None:
+            return
+        shm = self.__shared_memory
+        self.__shared_memory = None
+        self.__buffer = self.__buffer.copy()
+        self.__create_views()
+        shm.unlink()
+        try:
+            shm.close()
+        except BufferError:
+            raise BufferError('shared memory cannot be closed while views on its data exist') from None
+
+    def __get_model_parts(self):
+        # ModelParts referred to by the parameters, without duplicates
+        names = dict.fromkeys(model_part_dict['model_part'] for model_part_dict in self.__parameters)
+        return [self.__model.get_model_part(model_part_name) for model_part_name in names]
+
+    def save(self, directory):
+        # write layout to json file and buffer and coordinates to npy files, which can be memory-mapped by load
+        os.makedirs(directory, exist_ok=True)
+        model_part_names = []
+        for i, model_part in enumerate(self.__get_model_parts()):
+            np.save(os.path.join(directory, f'model_part_{i}_coords.npy'), model_part.coords)
+            np.save(os.path.join(directory, f'model_part_{i}_id.npy'), model_part.id)
+            if model_part.permutation is not None:
+                np.save(os.path.join(directory, f'model_part_{i}_permutation.npy'), model_part.permutation)
+            model_part_names.append(model_part.name)
+        np.save(os.path.join(directory, 'data.npy'), self.__buffer)
+        with open(os.path.join(directory, 'interface.json'), 'w') as file:
+            json.dump({'parameters': self.__parameters, 'model_parts': model_part_names}, file, indent=2)
+
+    @staticmethod
+    def load(directory, mmap_mode=None):
+        # *** with mmap_mode='r' the data is read-only and only read from disk when accessed, see numpy.load
+        with open(os.path.join(directory, 'interface.json'), 'r') as file:
+            layout = json.load(file)
+        model_parts = []
+        for i, model_part_name in enumerate(layout['model_parts']):
+            permutation_file = os.path.join(directory, f'model_part_{i}_permutation.npy')
+            model_part = ModelPart.__new__(ModelPart)
+            model_part.__setstate__({
+                'name': model_part_name,
+                'coords': np.load(os.path.join(directory, f'model_part_{i}_coords.npy'), mmap_mode=mmap_mode),
+                'id': np.load(os.path.join(directory, f'model_part_{i}_id.npy'), mmap_mode=mmap_mode),
+                'permutation': np.load(permutation_file) if os.path.isfile(permutation_file) else None})
+            model_parts.append(model_part)
+        interface = Interface.__new__(Interface)
+        interface.__setstate__({'parameters': layout['parameters'], 'model_parts': model_parts,
+                                'buffer': np.load(os.path.join(directory, 'data.npy'), mmap_mode=mmap_mode)})
+        return interface
 
     @property
     def model_part_variable_pairs(self):
@@ -59,20 +180,50 @@ class Interface:
 
     @property
     def size(self):
-        s = 0
-        for model_part_name, variable in self.model_part_variable_pairs:
-            s += self.__data[model_part_name][variable].size
-        return s
+        return self.__buffer.size
 
     def copy(self):
-        # create new Interface
-        interface = Interface(self.parameters, self.__model)
+        # create new Interface with the same layout, without going through the constructor
+        interface = self.__empty_like()
 
         # copy data
-        interface += self  # uses fast __iadd__ method to transfer data
+        np.copyto(interface.__buffer, self.__buffer)
 
         return interface
 
+    def __empty_like(self):
+        # layout is shared with the new Interface, as it is never modified; the data is not initialized
+        interface = Interface.__new__(Interface)
+        interface.__model = self.__model
+        interface.__parameters = self.__parameters
+        interface.__offsets = self.__offsets
+        interface.__model_part_variable_pairs = self.__model_part_variable_pairs
+        interface.__buffer = np.empty_like(self.__buffer)
+        interface.__create_views()
+        return interface
+
+    def get_read_only_view(self):
+        # *** returns Interface that shares memory with this Interface, but whose data cannot be changed
+        interface = Interface.__new__(Interface)
+        interface.__model = self.__model
+        interface.__parameters = self.__parameters
+        interface.__offsets = self.__offsets
+        interface.__model_part_variable_pairs = self.__model_part_variable_pairs
+        interface.__buffer = self.__buffer.view()
+        interface.__buffer.flags.writeable = False
+        interface.__create_views()
+        return interface
+
+    @property
+    def read_only(self):
+        return not self.__buffer.flags.writeable
+
+    def has_same_layout(self, other):
+        # same model parts, variables and sizes in the same order, i.e. the data can be combined element-wise
+        if type(other) is Interface:
+            return self.__offsets is other.__offsets or self.__offsets == other.__offsets
+        return NotImplemented
+
     def __repr__(self):
         repr = 'Interface that refers to ModelParts'
         for model_part_dict in self.parameters:
@@ -86,42 +237,46 @@ class Interface:
     def get_model_part(self, model_part_name):  # *** newly added
         return self.__model.get_model_part(model_part_name)
 
-    def get_variable_data(self, model_part_name, variable):
-        # *** always returns copies! this data is 2D ndarray always
-        if (model_part_name, variable) not in self.model_part_variable_pairs:
+    def get_variable_data(self, model_part_name, variable, copy=True):
+        # *** returns copy by default, with copy=False a view is returned which shares memory with the Interface!
+        # this data is 2D ndarray always
+        if (model_part_name, variable) not in self.__offsets:
+            raise KeyError
+        data = self.__data[model_part_name][variable]
+        return data.copy() if copy else data
+
+    def get_variable_slice(self, model_part_name, variable):
+        # position of the variable data in the 1D interface data and the 2D shape of the variable data
+        if (model_part_name, variable) not in self.__offsets:
             raise KeyError
-        return self.__data[model_part_name][variable].copy()
+        start, stop, shape = self.__offsets[(model_part_name, variable)]
+        return slice(start, stop), shape
 
     def set_variable_data(self, model_part_name, variable, data):
         # *** this changes the original data!
+        self.__check_writeable()
         if type(data) is not np.ndarray:
             raise ValueError(f'data is of type {type(data)}, but must be ndarray')
         shape = self.__data[model_part_name][variable].shape
         if data.shape != shape:
             raise ValueError(f'ndarray has shape {data.shape} instead of shape {shape}')
-        self.__data[model_part_name][variable] = data.copy()
+        self.__data[model_part_name][variable][:] = data
 
-    def get_interface_data(self):
-        # *** this data is 1D ndarray always
-        data = np.empty(0)
-        for model_part_name, variable in self.model_part_variable_pairs:
-            data = np.concatenate((data, self.get_variable_data(model_part_name, variable).flatten()))
-        return data
+    def get_interface_data(self, copy=True):
+        # *** returns copy by default, with copy=False a view is returned which shares memory with the Interface!
+        # this data is 1D ndarray always
+        return self.__buffer.copy() if copy else self.__buffer
 
     def set_interface_data(self, data):
+        self.__check_writeable()
         if type(data) is not np.ndarray:
             raise ValueError(f'data is of type {type(data)}, but must be ndarray')
         if data.shape != (self.size,):
             raise ValueError(f'ndarray has shape {data.shape} instead of shape {(self.size,)}')
-        index = 0
-        for model_part_name, variable in self.model_part_variable_pairs:
-            tmp = self.get_variable_data(model_part_name, variable)
-            self.set_variable_data(model_part_name, variable,
-                                   data[index:index + tmp.size].reshape(tmp.shape))
-            index += tmp.size
+        self.__buffer[:] = data
 
     def norm(self, order=2):
-        return np.linalg.norm(self.get_interface_data(), order)
+        return np.linalg.norm(self.__buffer, order)
 
     def has_same_model_parts(self, other):
         if type(other) is Interface:
@@ -136,91 +291,101 @@ class Interface:
     def __eq__(self, other):
         if type(other) is Interface:
             return self.model_part_variable_pairs == other.model_part_variable_pairs and \
-                   all(self.get_interface_data() == other.get_interface_data()) and self.has_same_model_parts(other)
+                   np.array_equal(self.__buffer, other.__buffer) and self.has_same_model_parts(other)
         return NotImplemented
 
-    def __add__(self, other):
-        result = self.copy()
-        if type(other) is Interface:
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] += other.__data[model_part_name][variable]
-        elif type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] += other
+    def add(self, other, out=None):
+        # out = self + other, with other an Interface or a number; out=self results in an in-place operation
+        return self.__check_operation(self.__operation(np.add, other, out, True), other)
+
+    def subtract(self, other, out=None):
+        # out = self - other, with other an Interface or a number; out=self results in an in-place operation
+        return self.__check_operation(self.__operation(np.subtract, other, out, True), other)
+
+    def multiply(self, other, out=None):
+        # out = self * other, with other a number; out=self results in an in-place operation
+        return self.__check_operation(self.__operation(np.multiply, other, out, False), other)
+
+    def add_scaled(self, other, alpha):
+        # *** this changes the original data! self += alpha * other, without creating temporary arrays
+        if type(other) is not Interface:
+            raise TypeError(f'other is of type {type(other)}, but must be Interface')
+        if not self.__is_number(alpha):
+            raise TypeError(f'alpha is of type {type(alpha)}, but must be a number')
+        self.__check_writeable()
+        if self.has_same_layout(other):
+            axpy = get_blas_funcs('axpy', (other.__buffer, self.__buffer))
+            axpy(other.__buffer, self.__buffer, a=alpha)
         else:
-            return NotImplemented
-        return result
+            for model_part_name, variable in self.__model_part_variable_pairs:
+                self.__data[model_part_name][variable] += alpha * other.__data[model_part_name][variable]
+        return self
+
+    def __add__(self, other):
+        return self.__operation(np.add, other, None, True)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __iadd__(self, other):
-        if type(other) is Interface:
-            for model_part_name, variable in self.model_part_variable_pairs:
-                self.__data[model_part_name][variable] += other.__data[model_part_name][variable]
-        else:
-            return NotImplemented
-        return self
+        return self.__operation(np.add, other, self, True)
 
     def __sub__(self, other):
-        result = self.copy()
-        if type(other) is Interface:
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] -= other.__data[model_part_name][variable]
-        elif type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] -= other
-        else:
-            return NotImplemented
-        return result
+        return self.__operation(np.subtract, other, None, True)
 
     def __rsub__(self, other):
         return self.__sub__(other)
 
     def __isub__(self, other):
-        if type(other) is Interface:
-            for model_part_name, variable in self.model_part_variable_pairs:
-                self.__data[model_part_name][variable] -= other.__data[model_part_name][variable]
-        elif type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                self.__data[model_part_name][variable] -= other
-        else:
-            return NotImplemented
-        return self
+        return self.__operation(np.subtract, other, self, True)
 
     def __mul__(self, other):
-        result = self.copy()
-        if type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] *= other
-        else:
-            return NotImplemented
-        return result
+        return self.__operation(np.multiply, other, None, False)
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __imul__(self, other):
-        if type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                self.__data[model_part_name][variable] *= other
-        else:
-            return NotImplemented
-        return self
+        return self.__operation(np.multiply, other, self, False)
 
     def __truediv__(self, other):
-        result = self.copy()
-        if type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                result.__data[model_part_name][variable] /= other
-        else:
-            return NotImplemented
-        return result
+        return self.__operation(np.true_divide, other, None, False)
 
     def __itruediv__(self, other):
-        if type(other) in (int, float, np.integer, np.floating):
-            for model_part_name, variable in self.model_part_variable_pairs:
-                self.__data[model_part_name][variable] /= other
+        return self.__operation(np.true_divide, other, self, False)
+
+    def __operation(self, ufunc, other, out, accept_interface):
+        # element-wise operation on the whole buffer, the result is written to out (new Interface if None)
+        if type(other) is Interface and accept_interface:
+            same_layout = self.has_same_layout(other)
+        elif self.__is_number(other):
+            same_layout = True
         else:
             return NotImplemented
-        return self
+        if out is None:
+            out = self.__empty_like()
+        elif type(out) is not Interface or not self.has_same_layout(out):
+            raise ValueError('out must be an Interface with the same layout')
+        out.__check_writeable()
+        if same_layout:
+            ufunc(self.__buffer, other.__buffer if type(other) is Interface else other, out=out.__buffer)
+        else:
+            for model_part_name, variable in self.__model_part_variable_pairs:
+                ufunc(self.__data[model_part_name][variable], other.__data[model_part_name][variable],
+                      out=out.__data[model_part_name][variable])
+        return out
+
+    def __check_writeable(self):
+        if self.read_only:
+            raise ValueError('Interface is read-only, use copy() to obtain an Interface that can be changed')
+
+    @staticmethod
+    def __is_number(value):
+        # numpy scalars such as np.float64 are accepted, booleans are not
+        return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+    @staticmethod
+    def __check_operation(result, other):
+        if result is NotImplemented:
+            raise TypeError(f'operation not supported for type {type(other)}')
+        return result
@@ -0,0 +1,135 @@
+from coconut.data_structure.interface import Interface
+
+import numpy as np
+
+
+class InterfaceBlock:
+    def __init__(self, interface, capacity=0, dtype=float):
+        # k data vectors with the layout of interface, stored as the columns of one preallocated column-major array
+        if type(interface) is not Interface:
+            raise TypeError(f'interface is of type {type(interface)}, but must be Interface')
+        self.__template = interface.get_read_only_view()  # only used for its layout
+        self.__dtype = np.dtype(dtype)
+        self.__array = np.empty((interface.size, capacity), dtype=self.__dtype, order='F')
+        self.__start = 0  # columns start:stop of __array are in use
+        self.__stop = 0
+
+    def __getstate__(self):
+        # unused columns are not pickled
+        return {'interface': self.__template, 'dtype': self.__dtype, 'array': self.array}
+
+    def __setstate__(self, state):
+        self.__template = state['interface']
+        self.__dtype = state['dtype']
+        self.__array = np.asfortranarray(state['array'])
+        self.__start = 0
+        self.__stop = self.__array.shape[1]
+
+    def __repr__(self):
+        return f'InterfaceBlock of {len(self)} vectors of size {self.__array.shape[0]}'
+
+    def __len__(self):
+        return self.__stop - self.__start
+
+    @property
+    def shape(self):
+        return self.__array.shape[0], len(self)
+
+    @property
+    def dtype(self):
+        return self.__dtype
+
+    @property
+    def capacity(self):
+        return self.__array.shape[1]
+
+    @property
+    def array(self):
+        # *** 2D view with the vectors as columns, no copy: changing it changes the data in the InterfaceBlock!
+        return self.__array[:, self.__start:self.__stop]
+
+    def __array__(self, dtype=None, copy=None):
+        # allows to use InterfaceBlock directly in numpy functions, e.g. np.hstack
+        array = self.array if dtype is None else self.array.astype(dtype, copy=False)
+        return array.copy() if copy else array
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+    def append(self, data):
+        # add data at the end: an Interface, 1D ndarray or 2D ndarray with one vector per column
+        columns = self.__get_columns(data)
+        if self.__stop + columns.shape[1] > self.capacity:
+            self.__grow(columns.shape[1], at_start=False)
+        self.__array[:, self.__stop:self.__stop + columns.shape[1]] = columns
+        self.__stop += columns.shape[1]
+
+    def prepend(self, data):
+        # add data at the start: an Interface, 1D ndarray or 2D ndarray with one vector per column
+        columns = self.__get_columns(data)
+        if not len(self):  # all free columns are available at the start
+            self.__start = self.__stop = self.capacity
+        if self.__start < columns.shape[1]:
+            self.__grow(columns.shape[1], at_start=True)
+        self.__array[:, self.__start - columns.shape[1]:self.__start] = columns
+        self.__start -= columns.shape[1]
+
+    def delete(self, index):
+        # remove vector at index, the shortest part of the remaining vectors is shifted
+        index = range(len(self))[index]
+        column = self.__start + index
+        if index < len(self) // 2:
+            self.__array[:, self.__start + 1:column + 1] = self.__array[:, self.__start:column].copy()
+            self.__start += 1
+        else:
+            self.__array[:, column:self.__stop - 1] = self.__array[:, column + 1:self.__stop].copy()
+            self.__stop -= 1
+
+    def clear(self):
+        # remove all vectors, the allocated memory is kept
+        self.__start = self.__stop = 0
+
+    def get_interface(self, index):
+        # returns new Interface with the data of the vector at index
+        interface = self.__template.copy()
+        interface.set_interface_data(self.__array[:, self.__start:self.__stop][:, index].astype(float))
+        return interface
+
+    def get_variable_data(self, model_part_name, variable):
+        # *** 3D view with shape (number of points, number of components, number of vectors), no copy
+        rows, (n_points, n_components) = self.__template.get_variable_slice(model_part_name, variable)
+        return self.array[rows].reshape(n_points, n_components, len(self))
+
+    def get_model_part_data(self, model_part_name):
+        # *** 2D view on the rows of all variables of a ModelPart, in the order of the Interface parameters, no copy
+        slices = [self.__template.get_variable_slice(name, variable)[0]
+                  for name, variable in self.__template.model_part_variable_pairs if name == model_part_name]
+        if not slices:
+            raise KeyError
+        if any(s1.stop != s2.start for s1, s2 in zip(slices[:-1], slices[1:])):
+            raise ValueError(f'data of ModelPart "{model_part_name}" is not contiguous in the Interface')
+        return self.array[slices[0].start:slices[-1].stop]
+
+    def __get_columns(self, data):
+        if type(data) is Interface:
+            if not self.__template.has_same_layout(data):
+                raise ValueError('Interface does not have the same layout as the InterfaceBlock')
+            data = data.get_interface_data(copy=False)
+        if type(data) is not np.ndarray:
+            raise TypeError(f'data is of type {type(data)}, but must be Interface or ndarray')
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        if data.ndim != 2 or data.shape[0] != self.__array.shape[0]:
+            raise ValueError(f'ndarray has shape {data.shape}, but must have {self.__array.shape[0]} rows')
+        return data
+
+    def __grow(self, number, at_start):
+        # allocate at least double the capacity, free columns are placed at the side where they are needed
+        size = len(self)
+        capacity = max(2 * self.capacity, size + number, 4)
+        array = np.empty((self.__array.shape[0], capacity), dtype=self.__dtype, order='F')
+        start = capacity - size if at_start else 0
+        array[:, start:start + size] = self.array
+        self.__array = array
+        self.__start = start
+        self.__stop = start + size
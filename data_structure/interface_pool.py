@@ -0,0 +1,37 @@
+from coconut.data_structure.interface import Interface
+
+
+class InterfacePool:
+    def __init__(self, interface):
+        # pool of scratch Interfaces with the same layout as interface, to avoid allocations in iteration loops
+        if type(interface) is not Interface:
+            raise TypeError(f'interface is of type {type(interface)}, but must be Interface')
+        self.__template = interface
+        self.__free = []
+        self.__allocated = 0
+
+    @property
+    def allocated(self):
+        return self.__allocated
+
+    @property
+    def available(self):
+        return len(self.__free)
+
+    def get(self):
+        # *** the data in the returned Interface is not initialized
+        if self.__free:
+            return self.__free.pop()
+        self.__allocated += 1
+        return self.__template.copy()
+
+    def release(self, *interfaces):
+        for interface in interfaces:
+            if type(interface) is not Interface or not self.__template.has_same_layout(interface):
+                raise ValueError('only Interfaces with the same layout as the pool can be released')
+            if any(interface is free for free in self.__free):
+                raise ValueError('Interface has already been released to the pool')
+            self.__free.append(interface)
+
+    def __repr__(self):
+        return f'InterfacePool with {self.__allocated} allocated and {len(self.__free)} available Interfaces'
@@ -5,17 +5,36 @@ class Model:
     def __init__(self):
         self.__model_parts = {}
 
-    def create_model_part(self, name, x0, y0, z0, id):
+    def create_model_part(self, name, x0, y0, z0, id, reorder=False):
         if name in self.__model_parts:
             raise ValueError(f'model already has model part with name "{name}"')
-        self.__model_parts[name] = ModelPart(name, x0, y0, z0, id)
+        self.__model_parts[name] = ModelPart(name, x0, y0, z0, id, reorder=reorder)
         return self.__model_parts[name]
 
+    def add_model_part(self, model_part):
+        # *** the ModelPart is not copied, it is shared with other Models to which it has been added
+        if type(model_part) is not ModelPart:
+            raise TypeError(f'model_part is of type {type(model_part)}, but must be ModelPart')
+        if model_part.name in self.__model_parts:
+            raise ValueError(f'model already has model part with name "{model_part.name}"')
+        self.__model_parts[model_part.name] = model_part
+        return model_part
+
     def get_model_part(self, name):
         if name not in self.__model_parts:
             raise ValueError(f'no model part with name "{name}" in model')
         return self.__model_parts[name]
 
+    def __getstate__(self):
+        return {'model_parts': list(self.__model_parts.values())}
+
+    def __setstate__(self, state):
+        if '_Model__model_parts' in state:  # Model pickled with name-mangled attributes
+            state = {'model_parts': list(state['_Model__model_parts'].values())}
+        self.__model_parts = {}
+        for model_part in state['model_parts']:
+            self.add_model_part(model_part)
+
     def __iter__(self):  # iterate over names of ModelParts
         return iter(self.__model_parts)
 
@@ -3,11 +3,14 @@ import numpy as np
 
 class ModelPart:
 
-    def __init__(self, name, x0, y0, z0, id):
+    def __init__(self, name, x0, y0, z0, id, reorder=False):
         """
         - inputs should have same size and be 1D
         - ModelPart contains no data, only coordinates
         - ModelPart has no idea: we use index in array
+        - coordinates are stored in one read-only (N, 3) array, x0, y0 and z0 are views on its columns
+        - if reorder is True, the points are sorted along a Morton (Z-order) curve, such that points which are close
+          in space are also close in memory; the original order is kept in the permutation
         """
         if type(name) is not str:
             raise ValueError('name should be a string')
@@ -24,29 +27,129 @@ class ModelPart:
             raise ValueError(f'id array should be 1D array should have unique integer values')
 
         self.__name = name
-        self.__x0 = x0.copy()
-        self.__y0 = y0.copy()
-        self.__z0 = z0.copy()
+        self.__coords = np.column_stack((x0, y0, z0))
         self.__id = id.copy()
+        self.__permutation = None
+        if reorder:
+            self.__permutation = self.__get_morton_order(self.__coords)
+            self.__coords = self.__coords[self.__permutation]
+            self.__id = self.__id[self.__permutation]
+        self.__create_views()
+
+    def __create_views(self):
+        # data is never changed, so views and cached values remain valid
+        self.__coords.flags.writeable = False
+        self.__id.flags.writeable = False
+        self.__x0, self.__y0, self.__z0 = self.__coords.T
+        self.__bounding_box = None
+        self.__id_sorter = None
+        self.__inverse_permutation = None
+        if self.__permutation is not None:
+            self.__permutation.flags.writeable = False
+            self.__inverse_permutation = np.empty_like(self.__permutation)
+            self.__inverse_permutation[self.__permutation] = np.arange(self.__permutation.size)
+
+    @staticmethod
+    def __get_morton_order(coords, bits=21):
+        # indices which sort the points along a Morton curve: the coordinates are scaled to integers in the bounding box
+        # and the bits of the three integers are interleaved in one 64 bit key
+        if not coords.shape[0]:
+            return np.arange(0)
+        minimum = coords.min(axis=0)
+        extent = coords.max(axis=0) - minimum
+        extent[extent == 0.] = 1.  # e.g. z0 of a 2D case
+        integers = ((coords - minimum) / extent * (2 ** bits - 1)).astype(np.uint64)
+        key = np.zeros(coords.shape[0], dtype=np.uint64)
+        for dimension in range(3):
+            spread = integers[:, dimension]
+            for shift, mask in ((32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff), (8, 0x100f00f00f00f00f),
+                                (4, 0x10c30c30c30c30c3), (2, 0x1249249249249249)):
+                spread = (spread | (spread << np.uint64(shift))) & np.uint64(mask)
+            key |= spread << np.uint64(dimension)
+        return np.argsort(key, kind='stable')
+
+    def __getstate__(self):
+        # views and cached values are not pickled, but recreated
+        return {'name': self.__name, 'coords': self.__coords, 'id': self.__id, 'permutation': self.__permutation}
+
+    def __setstate__(self, state):
+        if '_ModelPart__name' in state:  # ModelPart pickled with name-mangled attributes
+            state = {key.replace('_ModelPart__', ''): value for key, value in state.items()}
+        if 'coords' not in state:  # ModelPart pickled with separate coordinate arrays
+            state['coords'] = np.column_stack((state.pop('x0'), state.pop('y0'), state.pop('z0')))
+        self.__name = state['name']
+        self.__coords = state['coords']
+        self.__id = state['id']
+        self.__permutation = state.get('permutation')
+        self.__create_views()
 
     def __repr__(self):
         return f'ModelPart "{self.name}" of size {self.size}'
 
     @property
     def x0(self):
-        return self.__x0.copy()
+        # *** read-only view, no copy
+        return self.__x0
 
     @property
     def y0(self):
-        return self.__y0.copy()
+        # *** read-only view, no copy
+        return self.__y0
 
     @property
     def z0(self):
-        return self.__z0.copy()
+        # *** read-only view, no copy
+        return self.__z0
+
+    @property
+    def coords(self):
+        # *** read-only (N, 3) array with columns x0, y0 and z0, no copy
+        return self.__coords
 
     @property
     def id(self):
-        return self.__id.copy()
+        # *** read-only array, no copy
+        return self.__id
+
+    @property
+    def bounding_box(self):
+        # read-only (2, 3) array with minimum and maximum of x0, y0 and z0, calculated upon first request
+        if self.__bounding_box is None:
+            if self.size:
+                bounding_box = np.vstack((self.__coords.min(axis=0), self.__coords.max(axis=0)))
+            else:
+                bounding_box = np.full((2, 3), np.nan)
+            bounding_box.flags.writeable = False
+            self.__bounding_box = bounding_box
+        return self.__bounding_box
+
+    @property
+    def permutation(self):
+        # *** read-only array with the original index of every point, None if the points have not been reordered
+        return self.__permutation
+
+    def from_original_order(self, data):
+        # data with one row per point in the order given upon instantiation, e.g. read from a file, in ModelPart order
+        if self.__permutation is None:
+            return data
+        return data[self.__permutation]
+
+    def to_original_order(self, data):
+        # data with one row per point in ModelPart order, in the order given upon instantiation, e.g. to write a file
+        if self.__permutation is None:
+            return data
+        return data[self.__inverse_permutation]
+
+    def get_indices(self, ids):
+        # indices of the points with the given ids, the lookup is constructed upon first request
+        if self.__id_sorter is None:
+            self.__id_sorter = np.argsort(self.__id, kind='stable')
+        ids = np.asarray(ids)
+        positions = np.searchsorted(self.__id, ids, sorter=self.__id_sorter)
+        indices = self.__id_sorter.take(positions, mode='clip') if self.size else positions
+        if (not self.size and ids.size) or np.any(self.__id[indices] != ids):
+            raise KeyError(f'not all ids are present in ModelPart "{self.__name}"')
+        return indices
 
     @property
     def name(self):
@@ -54,10 +157,10 @@ class ModelPart:
 
     @property
     def size(self):  # name is like numpy; or rename to number_of_points?
-        return self.__x0.size
+        return self.__id.size
 
     def __eq__(self, other):
         if type(other) is ModelPart:
-            return (self.__name == other.name and np.all(self.__x0 == other.x0) and np.all(self.__y0 == other.y0)
-                    and np.all(self.__z0 == other.z0) and np.all(self.__id == other.id))
+            return (self.__name == other.name and np.array_equal(self.__coords, other.coords)
+                    and np.array_equal(self.__id, other.id))
         return NotImplemented
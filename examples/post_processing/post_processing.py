@@ -192,6 +192,9 @@ class SubSet:
         self.complete_num_steps = self.solution_data.shape[0] - 1  # number of times steps
         self.steps = np.arange(self.run.time_step_start, (self.run.time_step_start + self.complete_num_steps + 1))
         self.times = self.steps * self.dt
+        time_step_sizes = self.run.data.get('time_step_sizes', [])
+        if not self.run.debug_run and len(set(time_step_sizes)) > 1:  # variable time step size
+            self.times = self.steps[0] * self.dt + np.concatenate(([0.], np.cumsum(time_step_sizes)))
 
         # get coordinates
         self.initial_coordinates = np.zeros((self.model_part.size, 3))
@@ -0,0 +1,79 @@
+from coconut import data_structure
+from coconut.data_structure.interface import Interface
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+import contextlib
+import io
+
+
+class TestConvergenceCriterionPredictive(unittest.TestCase):
+    def setUp(self):
+        m = 10
+        dz = 2
+        self.variable = 'area'
+        self.model_part_name = 'wall'
+        interface_settings = [{'model_part': self.model_part_name, 'variables': [self.variable]}]
+
+        # create model and model_part
+        model = data_structure.Model()
+        ids = np.arange(0, m)
+        x0 = np.zeros(m)
+        y0 = np.zeros(m)
+        z0 = np.arange(0, m * dz, dz)
+        model.create_model_part(self.model_part_name, x0, y0, z0, ids)
+
+        # create interface
+        self.interface = Interface(interface_settings, model)
+
+        self.parameters = {'type': 'convergence_criteria.predictive',
+                           'settings': {'tolerance': 5e-4, 'order': 2, 'maximum': 10, 'relative': True}}
+
+    def get_satisfied(self, rates):
+        # is_satisfied after each iteration with residuals reduced by the given rates
+        convergence_criterion = create_instance(self.parameters)
+        convergence_criterion.initialize()
+        convergence_criterion.initialize_solution_step()
+        self.assertFalse(convergence_criterion.is_satisfied())
+        satisfied = []
+        value = 10.
+        for rate in [1.] + rates:
+            value *= rate
+            self.interface.set_variable_data(self.model_part_name, self.variable, np.full((10, 1), value))
+            convergence_criterion.update(self.interface)
+            satisfied.append(convergence_criterion.is_satisfied())
+        convergence_criterion.finalize_solution_step()
+        return satisfied
+
+    def test_convergence_criterion_predictive(self):
+        # satisfied if the tolerance is reached, as the relative norm
+        self.assertEqual(self.get_satisfied(4 * [0.1]), 4 * [False] + [True])
+
+        # satisfied one iteration early if the next iteration will converge
+        self.parameters['settings']['anticipate'] = True
+        self.assertEqual(self.get_satisfied(3 * [0.1]), 3 * [False] + [True])
+        self.assertEqual(self.get_satisfied([0.1, 0.1, 0.5, 0.1]), 4 * [False] + [True])
+
+        # stagnation is signalled, the iterations only stop at the maximum, unless requested
+        self.parameters['settings']['anticipate'] = False
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(self.get_satisfied(9 * [0.9]), 9 * [False] + [True])
+        self.assertEqual(output.getvalue().count('Stagnation after 4 iterations'), 1)
+        self.parameters['settings']['stop_stagnation'] = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(self.get_satisfied(3 * [0.9]), 3 * [False] + [True])
+        # no stagnation for a rate sufficient to reach the tolerance within the maximum number of iterations
+        self.assertEqual(self.get_satisfied(5 * [0.2]), 5 * [False] + [True])
+
+    def test_absolute(self):
+        self.parameters['settings'].update({'relative': False, 'tolerance': 0.5})
+        self.assertEqual(self.get_satisfied(2 * [0.1]), 2 * [False] + [True])
+
+    def test_settings(self):
+        self.parameters['settings']['window'] = 0
+        self.assertRaises(ValueError, create_instance, self.parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()
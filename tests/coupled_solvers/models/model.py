@@ -170,6 +170,47 @@ class TestModel(unittest.TestCase):
         dr_sol = dr_in - qq @ (qq.T @ dr_in)
         np.testing.assert_allclose(dr.get_interface_data(), dr_sol, atol=1e-14)
 
+    def test_scale_input(self):
+        # after scaling the input, the secant equations hold for the scaled differences
+        parameters = copy.deepcopy(self.parameters)
+        parameters['settings']['min_significant'] = 1e-12
+        self.model = create_instance(parameters)
+        self.model.size_in = self.model.size_out = self.m
+        self.model.out = self.interface.copy()
+        self.model.initialize()
+        factors = np.array([1e-3, 2., 5., 1e2, 0.5])
+
+        r = self.interface.copy()
+        xt = self.interface.copy()
+
+        def add(r_array, xt_array):
+            r.set_interface_data(r_array)
+            xt.set_interface_data(xt_array)
+            self.model.add(r, xt)
+
+        def check_secant(r_arrays, xt_arrays, scaling):
+            r.set_interface_data(scaling * (r_arrays[1] - r_arrays[0]))
+            dxt = self.model.predict(r)
+            np.testing.assert_allclose(dxt.get_interface_data(), xt_arrays[1] - xt_arrays[0], atol=1e-12)
+
+        self.model.initialize_solution_step()
+        for r_array, xt_array in zip((self.r2, self.r4, self.r5), (self.xt2, self.xt4, self.xt5)):
+            add(r_array, xt_array)
+        self.model.finalize_solution_step()
+
+        self.model.initialize_solution_step()
+        for r_array, xt_array in zip((self.r6, self.r7, self.r8), (self.xt6, self.xt7, self.xt8)):
+            add(r_array, xt_array)
+        check_secant((self.r7, self.r8), (self.xt7, self.xt8), 1.)
+
+        self.model.scale_input(factors)
+        check_secant((self.r7, self.r8), (self.xt7, self.xt8), factors)
+        add(factors * self.r9, self.xt9)
+        check_secant((self.r8, self.r9), (self.xt8, self.xt9), factors)
+        check_secant((self.r7, self.r8), (self.xt7, self.xt8), factors)
+        self.model.finalize_solution_step()
+        self.model.finalize()
+
     def test_change_settings_on_restart(self):
         # test if changing settings upon restart works correctly
 
@@ -1,4 +1,7 @@
 from coconut.tests.coupled_solvers.models import model
+from coconut import data_structure
+from coconut.data_structure.interface import Interface
+from coconut.tools import create_instance
 
 import unittest
 import numpy as np
@@ -301,6 +304,79 @@ class TestModelLS(model.TestModel):
         np.testing.assert_allclose(np.hstack(self.model.vprev), np.hstack([self.vprev[0]]))
         np.testing.assert_allclose(np.hstack(self.model.wprev), np.hstack([self.wprev[0]]))
 
+    def test_incremental_qr(self):
+        # decomposition updated upon adding and removing columns corresponds to V, also with dependent columns
+        m = 30
+        model = data_structure.Model()
+        model.create_model_part('wall', np.zeros(m), np.zeros(m), np.arange(m, dtype=float), np.arange(m))
+        interface = Interface([{'model_part': 'wall', 'variables': ['area']}], model)
+        self.settings['q'] = 2
+        self.settings['min_significant'] = 1e-3
+        self.model = create_instance(self.parameters)
+        self.model.size_in = self.model.size_out = m
+        self.model.out = interface.copy()
+        self.model.initialize()
+
+        rng = np.random.default_rng(0)
+        r = interface.copy()
+        xt = interface.copy()
+        for time_step in range(4):
+            self.model.initialize_solution_step()
+            for iteration in range(12):
+                r_array = rng.random(m)
+                if iteration == 5:  # difference lies in span of V
+                    r_array = self.model.rref.flatten() + self.model.get_v() @ rng.random(self.model.n_columns)
+                r.set_interface_data(r_array)
+                xt.set_interface_data(rng.random(m))
+                self.model.add(r, xt)
+                if self.model.is_ready():
+                    r.set_interface_data(rng.random(m))
+                    dxt = self.model.predict(r).get_interface_data()
+                    v = self.model.get_v()
+                    w = np.hstack((self.model.wcurr, np.hstack(self.model.wprev)))
+                    qq, rr = self.model.qq, self.model.rr
+                    np.testing.assert_allclose(qq @ rr, v, atol=1e-12)
+                    np.testing.assert_allclose(qq.T @ qq, np.eye(v.shape[1]), atol=1e-12)
+                    np.testing.assert_array_equal(np.tril(rr, -1), 0.)
+                    np.testing.assert_allclose(dxt, w @ np.linalg.lstsq(v, r.get_interface_data(), rcond=None)[0])
+                    a, b = self.model.get_factors()  # low-rank factors used by IBQN
+                    np.testing.assert_allclose(a @ (b.T @ r.get_interface_data()), dxt)
+            self.model.finalize_solution_step()
+        self.model.initialize_solution_step()
+        self.assertLessEqual(self.model.n_columns, m)
+
+    def test_precision(self):
+        # history stored in float32, prediction calculated in float64
+        model_64 = self.model
+        self.settings['precision'] = 'float32'
+        super().setUp()
+        model_32 = self.model
+
+        r = self.interface.copy()
+        xt = self.interface.copy()
+        for model in (model_64, model_32):
+            for r_array, xt_array in zip((self.r1, self.r2, self.r4), (self.xt1, self.xt2, self.xt4)):
+                r.set_interface_data(r_array)
+                xt.set_interface_data(xt_array)
+                model.add(r, xt)
+            model.finalize_solution_step()
+            model.initialize_solution_step()
+            r.set_interface_data(self.r5)
+            xt.set_interface_data(self.xt5)
+            model.add(r, xt)
+
+        self.assertEqual(model_32.vprev[0].dtype, np.float32)
+        self.assertEqual(model_32.wprev[0].dtype, np.float32)
+        r.set_interface_data(self.r3)
+        dxt_64 = model_64.predict(-1 * r).get_interface_data()
+        dxt_32 = model_32.predict(-1 * r).get_interface_data()
+        self.assertEqual(dxt_32.dtype, np.float64)
+        np.testing.assert_allclose(dxt_32, dxt_64, rtol=1e-5)
+
+        self.settings['precision'] = 'float16'
+        with self.assertRaises(ValueError):
+            super().setUp()
+
 
 if __name__ == '__main__':
     unittest.main()
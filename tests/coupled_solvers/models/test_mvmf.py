@@ -1,4 +1,5 @@
 from coconut.tests.coupled_solvers.models import model
+from coconut.tools import create_instance
 
 import unittest
 import numpy as np
@@ -210,6 +211,66 @@ class TestModelMVMF(model.TestModel):
         np.testing.assert_array_equal(self.model.qqprev[0], np.empty((self.m, 0)))
         self.model.finalize_solution_step()
 
+    def test_compression(self):
+        def run(models, time_steps):
+            r = self.interface.copy()
+            xt = self.interface.copy()
+            for time_step in time_steps:
+                for model in models:
+                    model.initialize_solution_step()
+                    for r_array, xt_array in time_step:
+                        r.set_interface_data(r_array)
+                        xt.set_interface_data(xt_array)
+                        model.add(r, xt)
+                    model.finalize_solution_step()
+            r.set_interface_data(self.r3)
+            predictions = []
+            for model in models:
+                model.initialize_solution_step()
+                predictions.append(model.predict(-1 * r).get_interface_data())
+            return predictions
+
+        def create_model(**settings):
+            model = create_instance({'type': 'coupled_solvers.models.mvmf',
+                                     'settings': {'min_significant': 0., 'q': 10, **settings}})
+            model.size_in = model.size_out = self.m
+            model.out = self.interface.copy()
+            model.initialize()
+            return model
+
+        time_steps = [((self.r1, self.xt1), (self.r2, self.xt2), (self.r4, self.xt4)),
+                      ((self.r5, self.xt5), (self.r6, self.xt6)),
+                      ((self.r7, self.xt7), (self.r8, self.xt8), (self.r9, self.xt9)),
+                      ((self.r10, self.xt10), (self.r11, self.xt11))]
+
+        # budget not exceeded
+        reference, model = create_model(), create_model(max_columns=6)
+        dxt_reference, dxt = run([reference, model], time_steps)
+        np.testing.assert_array_equal(dxt, dxt_reference)
+
+        # low-rank factors used by IBQN give the same prediction
+        a, b = reference.get_factors()
+        np.testing.assert_allclose(a @ (b.T @ -self.r3), dxt_reference)
+
+        # most recent time steps are kept, older ones are merged and truncated to the budget
+        budget = 4
+        for settings in ({'max_columns': budget}, {'max_memory': budget * 2 * self.m * 8 / 1e6}):
+            reference, model = create_model(), create_model(**settings)
+            run([reference, model], time_steps)
+            self.assertEqual([qq.shape[1] for qq in model.qqprev], [1, 2, 1, 0])
+            for i in range(3):
+                np.testing.assert_array_equal(model.qqprev[i], reference.qqprev[i])
+                np.testing.assert_array_equal(model.wprev[i], reference.wprev[i])
+
+        # merging without truncation does not change the prediction: the differences of xt in the first time step
+        # are parallel, so its contribution has rank 1
+        time_steps = [((self.r1, self.xt1), (self.r2, self.xt2), (self.r4, 2 * self.xt2 - self.xt1)),
+                      ((self.r5, self.xt5), (self.r6, self.xt6))]
+        reference, model = create_model(), create_model(max_columns=2)
+        dxt_reference, dxt = run([reference, model], time_steps)
+        self.assertEqual([qq.shape[1] for qq in model.qqprev], [1, 1])
+        np.testing.assert_allclose(dxt, dxt_reference, atol=1e-12)
+
     def store_old_values(self):
         self.rrprev = self.model.rrprev.copy()
         self.qqprev = self.model.qqprev.copy()
@@ -0,0 +1,118 @@
+from coconut.tests.coupled_solvers.models import model
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+
+
+class TestModelMVR(model.TestModel):
+
+    def setUp(self):
+        self.min_significant = 1.0
+
+        self.parameters = {'type': 'coupled_solvers.models.mvr',
+                           'settings': {
+                               'min_significant': self.min_significant
+                           }}
+        self.settings = self.parameters['settings']
+
+        super().setUp()
+
+    def run_time_steps(self, models, time_steps):
+        # add the same information to all models and return their predictions
+        r = self.interface.copy()
+        xt = self.interface.copy()
+        predictions = []
+        for time_step in time_steps:
+            for model in models:
+                model.initialize_solution_step()
+                for r_array, xt_array in time_step:
+                    r.set_interface_data(r_array)
+                    xt.set_interface_data(xt_array)
+                    model.add(r, xt)
+            r.set_interface_data(self.r3)
+            predictions.append([model.predict(-1 * r).get_interface_data() for model in models])
+            for model in models:
+                model.finalize_solution_step()
+        return predictions
+
+    def create_model(self, parameters):
+        model = create_instance(parameters)
+        model.size_in = model.size_out = self.m
+        model.out = self.interface.copy()
+        model.initialize()
+        return model
+
+    def test_model(self):
+        # without truncation, the low-rank factors give the same Jacobian approximation as MV
+        self.settings['min_significant'] = 0.
+        time_steps = [((self.r1, self.xt1), (self.r2, self.xt2), (self.r4, self.xt4)),
+                      ((self.r5, self.xt5), (self.r6, self.xt6)),
+                      ((self.r7, self.xt7), (self.r8, self.xt8), (self.r9, self.xt9)),
+                      ((self.r10, self.xt10), (self.r11, self.xt11))]
+        mv = self.create_model({'type': 'coupled_solvers.models.mv', 'settings': {'min_significant': 0.}})
+        mvr = self.create_model(self.parameters)
+        self.settings['chunk_size'] = 2
+        self.settings['truncation'] = 0.
+        mvr_svd = self.create_model(self.parameters)
+        for dxt_mv, dxt_mvr, dxt_mvr_svd in self.run_time_steps([mv, mvr, mvr_svd], time_steps):
+            np.testing.assert_allclose(dxt_mvr, dxt_mv, atol=1e-12)
+            np.testing.assert_allclose(dxt_mvr_svd, dxt_mv, atol=1e-12)
+
+        # factors are stored instead of a dense matrix, the SVD restart merges them into one pair
+        self.assertEqual(len(mvr.aprev), len(time_steps))
+        self.assertEqual(sum(a.shape[1] for a in mvr.aprev), 6)
+        self.assertEqual(len(mvr_svd.aprev), 1)
+        self.assertLessEqual(mvr_svd.aprev[0].shape[1], self.m)
+
+        # filter_q removes the row space of the Jacobian approximation
+        r = self.interface.copy()
+        r.set_interface_data(self.r3)
+        np.testing.assert_allclose(mvr.filter_q(r).get_interface_data(), mv.filter_q(r).get_interface_data(),
+                                   atol=1e-12)
+
+    def test_restart_types(self):
+        self.settings['min_significant'] = 0.
+        self.settings['chunk_size'] = 2
+        self.settings['restart_type'] = 'zero'
+        time_steps = [((self.r1, self.xt1), (self.r2, self.xt2)), ((self.r4, self.xt4), (self.r5, self.xt5))]
+        mvr = self.create_model(self.parameters)
+        self.run_time_steps([mvr], time_steps)
+        self.assertEqual(mvr.aprev, [])
+        self.assertEqual(mvr.chunk, 0)
+        mvr.initialize_solution_step()
+        self.assertFalse(mvr.is_ready())
+
+        # truncation removes the smallest singular values
+        self.settings['restart_type'] = 'svd'
+        self.settings['truncation'] = 0.5
+        mvr = self.create_model(self.parameters)
+        time_steps = [((self.r1, self.xt1), (self.r2, self.xt2), (self.r4, self.xt4), (self.r5, self.xt5)),
+                      ((self.r6, self.xt6), (self.r7, self.xt7))]
+        self.run_time_steps([mvr], time_steps)
+        s = np.linalg.svd(mvr.aprev[0] @ mvr.bprev[0].T, compute_uv=False)
+        self.assertTrue(np.all(s[:mvr.aprev[0].shape[1]] >= 0.5 * s[0]))
+        self.assertLess(mvr.aprev[0].shape[1], 4)
+
+        for key, value in (('restart_type', 'lsq'), ('chunk_size', 0)):
+            parameters = {'type': 'coupled_solvers.models.mvr', 'settings': {key: value}}
+            self.assertRaises(ValueError, create_instance, parameters)
+
+    def store_old_values(self):
+        self.aprev = self.model.aprev.copy()
+        self.bprev = self.model.bprev.copy()
+        self.chunk = self.model.chunk
+
+    def set_new_values(self):
+        self.min_significant_new = 0.5
+        self.settings['min_significant'] = self.min_significant_new
+
+    def check_new_values(self):
+        self.assertEqual(self.model.min_significant, self.min_significant_new)
+        self.assertEqual(self.model.chunk, self.chunk)
+        np.testing.assert_array_equal(np.hstack(self.model.aprev), np.hstack(self.aprev))
+        np.testing.assert_array_equal(np.hstack(self.model.bprev), np.hstack(self.bprev))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+from coconut import data_structure
+from coconut.data_structure.interface import Interface
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+import copy
+
+
+class TestPreconditioners(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        m = cls.m = 5
+        model = data_structure.Model()
+        ids = np.arange(0, m)
+        model.create_model_part('wall', np.zeros(m), np.zeros(m), np.arange(0, m), ids)
+        model.create_model_part('bottom', np.zeros(m), np.ones(m), np.arange(0, m), ids)
+        interface_settings = [{'model_part': 'wall', 'variables': ['pressure', 'traction']},
+                              {'model_part': 'bottom', 'variables': ['pressure']}]
+        cls.interface = Interface(interface_settings, model)
+
+    def setUp(self):
+        self.r = self.interface.copy()
+        self.r.set_variable_data('wall', 'pressure', np.full((self.m, 1), 1e3))
+        self.r.set_variable_data('wall', 'traction', np.full((self.m, 3), 1.))
+        self.r.set_variable_data('bottom', 'pressure', np.zeros((self.m, 1)))
+
+        # model for which the secant equation is checked after rescaling
+        self.model = create_instance({'type': 'coupled_solvers.models.mv', 'settings': {'min_significant': 0}})
+        self.model.size_in = self.model.size_out = self.interface.size
+        self.model.out = self.interface.copy()
+        self.model.initialize()
+        self.model.initialize_solution_step()
+
+    def create_preconditioner(self, parameters):
+        preconditioner = create_instance(parameters)
+        preconditioner.initialize(self.interface, [self.model])
+        preconditioner.initialize_solution_step()
+        return preconditioner
+
+    def block_norms(self, interface):
+        return [np.linalg.norm(interface.get_variable_data(*pair)) for pair in interface.model_part_variable_pairs]
+
+    def test_dummy(self):
+        preconditioner = self.create_preconditioner(
+            {'type': 'coupled_solvers.preconditioners.dummy_preconditioner'})
+        preconditioner.update(self.r)
+        self.assertIs(preconditioner.apply(self.r), self.r)
+        self.assertIs(preconditioner.revert(self.r), self.r)
+
+    def test_constant(self):
+        preconditioner = self.create_preconditioner(
+            {'type': 'coupled_solvers.preconditioners.constant',
+             'settings': {'factors': {'pressure': 1e-3, 'bottom': {'pressure': 2.}}}})
+        r_preconditioned = preconditioner.apply(self.r)
+        np.testing.assert_allclose(r_preconditioned.get_variable_data('wall', 'pressure'), 1.)
+        np.testing.assert_array_equal(r_preconditioned.get_variable_data('wall', 'traction'), 1.)
+        np.testing.assert_array_equal(preconditioner.weights[preconditioner.slices[('bottom', 'pressure')]], 2.)
+        np.testing.assert_allclose(preconditioner.revert(r_preconditioned).get_interface_data(),
+                                   self.r.get_interface_data())
+
+    def test_residual_norm(self):
+        preconditioner = self.create_preconditioner({'type': 'coupled_solvers.preconditioners.residual_norm'})
+        preconditioner.update(self.r * 0)  # zero residual is ignored
+        np.testing.assert_array_equal(preconditioner.weights, 1.)
+
+        # non-zero blocks have the same norm and the norm of the residual is retained, the zero block is not scaled
+        preconditioner.update(self.r)
+        r_preconditioned = preconditioner.apply(self.r)
+        block_norms = self.block_norms(r_preconditioned)
+        self.assertAlmostEqual(block_norms[0], block_norms[1])
+        self.assertEqual(block_norms[2], 0.)
+        self.assertAlmostEqual(r_preconditioned.norm(), self.r.norm())
+        np.testing.assert_array_equal(preconditioner.weights[preconditioner.slices[('bottom', 'pressure')]], 1.)
+
+        # weights are updated only once per time step
+        weights = preconditioner.weights.copy()
+        r = self.r.copy()
+        r.set_variable_data('wall', 'pressure', np.full((self.m, 1), 1.))
+        preconditioner.update(r)
+        np.testing.assert_array_equal(preconditioner.weights, weights)
+        preconditioner.finalize_solution_step()
+        preconditioner.initialize_solution_step()
+        preconditioner.update(r)
+        block_norms = self.block_norms(preconditioner.apply(r))
+        self.assertAlmostEqual(block_norms[0], block_norms[1])
+
+    def test_residual_sum(self):
+        preconditioner = self.create_preconditioner({'type': 'coupled_solvers.preconditioners.residual_sum'})
+        preconditioner.update(self.r)
+        block_norms = self.block_norms(preconditioner.apply(self.r))
+        self.assertAlmostEqual(block_norms[0], block_norms[1])
+
+        # the residuals of later iterations are taken into account in the next time step
+        r = self.r.copy()
+        r.set_variable_data('wall', 'pressure', np.full((self.m, 1), 1.))
+        weights = preconditioner.weights.copy()
+        for i in range(3):
+            preconditioner.update(r)
+        np.testing.assert_array_equal(preconditioner.weights, weights)
+        self.assertEqual(preconditioner.count, 4)
+
+        restart_data = copy.deepcopy(preconditioner.save_restart_data())
+        preconditioner.finalize_solution_step()
+        preconditioner.initialize_solution_step()
+        preconditioner.update(r)
+
+        relative_norms = np.array([self.block_norms(r_i)[:2] / r_i.norm() for r_i in (self.r, r, r, r, r)])
+        mean = np.mean(relative_norms, axis=0)
+        weights = preconditioner.weights
+        for pair, weight in zip((('wall', 'pressure'), ('wall', 'traction')), 1 / (np.sqrt(2) * mean)):
+            np.testing.assert_allclose(weights[preconditioner.slices[pair]], weight)
+
+        # restart continues with the same sums
+        restarted = self.create_preconditioner({'type': 'coupled_solvers.preconditioners.residual_sum'})
+        restarted.restart(restart_data)
+        restarted.finalize_solution_step()
+        restarted.initialize_solution_step()
+        restarted.update(r)
+        np.testing.assert_array_equal(restarted.weights, preconditioner.weights)
+
+    def test_scale_models(self):
+        # the information in the models corresponds to the input with the current weights
+        preconditioner = self.create_preconditioner({'type': 'coupled_solvers.preconditioners.residual_norm'})
+        rng = np.random.default_rng(0)
+        r = self.r.copy()
+        xt = self.interface.copy()
+        data_r = [self.r.get_interface_data() * rng.random(self.interface.size) for _ in range(3)]
+        data_xt = [rng.random(self.interface.size) for _ in range(3)]
+        for data_r_i, data_xt_i in zip(data_r[:2], data_xt[:2]):
+            r.set_interface_data(data_r_i)
+            xt.set_interface_data(data_xt_i)
+            self.model.add(preconditioner.apply(r), xt)
+        preconditioner.update(self.r)
+        r.set_interface_data(data_r[2])
+        xt.set_interface_data(data_xt[2])
+        self.model.add(preconditioner.apply(r), xt)
+        for i in (1, 2):
+            r.set_interface_data(data_r[i] - data_r[i - 1])
+            dxt = self.model.predict(preconditioner.apply(r))
+            np.testing.assert_allclose(dxt.get_interface_data(), data_xt[i] - data_xt[i - 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 from coconut.tests.coupled_solvers import coupled_solver
+from coconut.tools import create_instance, cd
 
 import unittest
+import copy
+import numpy as np
 
 
 class TestCoupledSolverIBQN(coupled_solver.TestCoupledSolver):
@@ -19,6 +22,59 @@ class TestCoupledSolverIBQN(coupled_solver.TestCoupledSolver):
         self.assertEqual(coupled_solver.atol, self.atol_new)
         self.assertEqual(coupled_solver.rtol, self.rtol_new)
 
+    def test_linear_solver(self):
+        # compare direct solution of the low-rank block system to GMRES
+        models = [(self.settings['model_f'], self.settings['model_s']),
+                  ({'type': 'coupled_solvers.models.mvmf', 'settings': {'min_significant': 0, 'q': 10}},
+                   {'type': 'coupled_solvers.models.mvmf', 'settings': {'min_significant': 0, 'q': 10}})]
+        for model_f, model_s in models:
+            iterations = {}
+            solution_x = {}
+            for linear_solver in ('direct', 'gmres'):
+                parameters = copy.deepcopy(self.parameters)
+                parameters['settings']['model_f'] = copy.deepcopy(model_f)
+                parameters['settings']['model_s'] = copy.deepcopy(model_s)
+                parameters['settings']['linear_solver'] = linear_solver
+                with cd(self.working_dir):
+                    coupled_solver = create_instance(parameters)
+                    coupled_solver.initialize()
+                    for i in range(4):
+                        coupled_solver.initialize_solution_step()
+                        coupled_solver.solve_solution_step()
+                        coupled_solver.finalize_solution_step()
+                        coupled_solver.output_solution_step()
+                    coupled_solver.finalize()
+                iterations[linear_solver] = coupled_solver.iterations
+                solution_x[linear_solver] = coupled_solver.x.get_interface_data()
+            # convergence within round-off of the last iterations
+            self.assertLessEqual(np.max(np.abs(np.subtract(iterations['direct'], iterations['gmres']))), 1)
+            np.testing.assert_allclose(solution_x['direct'], solution_x['gmres'], rtol=1e-8, atol=1e-14)
+
+        # the direct solution also accounts for the weights of a preconditioner
+        iterations = {}
+        solution_x = {}
+        for linear_solver in ('direct', 'gmres'):
+            parameters = copy.deepcopy(self.parameters)
+            parameters['settings']['linear_solver'] = linear_solver
+            parameters['settings']['preconditioner'] = {'type': 'coupled_solvers.preconditioners.residual_sum'}
+            with cd(self.working_dir):
+                coupled_solver = create_instance(parameters)
+                coupled_solver.initialize()
+                for i in range(4):
+                    coupled_solver.initialize_solution_step()
+                    coupled_solver.solve_solution_step()
+                    coupled_solver.finalize_solution_step()
+                    coupled_solver.output_solution_step()
+                coupled_solver.finalize()
+            iterations[linear_solver] = coupled_solver.iterations
+            solution_x[linear_solver] = coupled_solver.x.get_interface_data()
+        self.assertLessEqual(np.max(np.abs(np.subtract(iterations['direct'], iterations['gmres']))), 1)
+        np.testing.assert_allclose(solution_x['direct'], solution_x['gmres'], rtol=1e-8, atol=1e-14)
+
+        self.settings['linear_solver'] = 'lu'
+        with cd(self.working_dir):
+            self.assertRaises(ValueError, create_instance, self.parameters)
+
 
 if __name__ == '__main__':
     unittest.main()
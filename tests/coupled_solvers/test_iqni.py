@@ -1,6 +1,11 @@
 from coconut.tests.coupled_solvers import coupled_solver
+from coconut.tools import create_instance, cd
 
 import unittest
+import os
+import pickle
+import copy
+import numpy as np
 
 
 class TestCoupledSolverIQNI(coupled_solver.TestCoupledSolver):
@@ -13,6 +18,79 @@ class TestCoupledSolverIQNI(coupled_solver.TestCoupledSolver):
     def check_new_values(self, coupled_solver):
         self.assertEqual(coupled_solver.omega, self.omega_new)
 
+    def test_precision(self):
+        # compare convergence with history and results stored in float32 to convergence with float64
+        models = [self.settings['model'],
+                  {'type': 'coupled_solvers.models.mv', 'settings': {'min_significant': 1e-12}},
+                  {'type': 'coupled_solvers.models.mvmf', 'settings': {'min_significant': 1e-12, 'q': 10}},
+                  {'type': 'coupled_solvers.models.mvr', 'settings': {'min_significant': 1e-12, 'chunk_size': 4}}]
+        self.settings['write_results'] = 1
+        for model in models:
+            iterations = {}
+            solution_x = {}
+            for precision in ('float64', 'float32'):
+                parameters = copy.deepcopy(self.parameters)
+                parameters['settings']['model'] = copy.deepcopy(model)
+                parameters['settings']['model']['settings']['precision'] = precision
+                parameters['settings']['results_precision'] = precision
+                with cd(self.working_dir):
+                    coupled_solver = create_instance(parameters)
+                    coupled_solver.initialize()
+                    for i in range(8):
+                        coupled_solver.initialize_solution_step()
+                        coupled_solver.solve_solution_step()
+                        coupled_solver.finalize_solution_step()
+                        coupled_solver.output_solution_step()
+                    coupled_solver.finalize()
+                self.assertEqual(coupled_solver.complete_solution_x.dtype, np.dtype(precision))
+                iterations[precision] = np.array(coupled_solver.iterations)
+                solution_x[precision] = coupled_solver.x.get_interface_data()
+
+            # at most one additional iteration per time step and same solution within the convergence tolerance
+            self.assertLessEqual(np.max(iterations['float32'] - iterations['float64']), 1)
+            self.assertLess(np.linalg.norm(solution_x['float32'] - solution_x['float64']), 1e-13)
+
+    def test_preconditioner(self):
+        # test if restart option works correctly with a preconditioner that changes its weights
+        preconditioners = [{'type': 'coupled_solvers.preconditioners.constant',
+                            'settings': {'factors': {'displacement': 1e3}}},
+                           {'type': 'coupled_solvers.preconditioners.residual_norm'},
+                           {'type': 'coupled_solvers.preconditioners.residual_sum'}]
+        for preconditioner in preconditioners:
+            self.setUp()
+            self.settings['preconditioner'] = preconditioner
+            self.test_restart()
+
+    def test_preconditioner_factors(self):
+        # factors which would corrupt the information in the model are not allowed
+        for factors in ({'displacement': 0}, {'displacement': -1e3}, {'wall': {'displacement': float('inf')}},
+                        {'displacement': float('nan')}, {'displacement': '1e3'}):
+            self.settings['preconditioner'] = {'type': 'coupled_solvers.preconditioners.constant',
+                                               'settings': {'factors': factors}}
+            with cd(self.working_dir):
+                self.assertRaises(ValueError, create_instance, self.parameters)
+
+    def test_time_step_controller(self):
+        # test if restart option works correctly with a variable time step size
+        self.parameters['time_step_controller'] = {'type': 'time_step_controllers.adaptive',
+                                                   'settings': {'delta_t_min': 0.0025, 'delta_t_max': 0.04,
+                                                                'target_iterations': 10}}
+        self.test_restart()
+
+        with open(os.path.join(self.working_dir, 'restart_results.pickle'), 'rb') as file:
+            results = pickle.load(file)
+        self.assertEqual(len(results['time_step_sizes']), 4)
+        self.assertEqual(results['time_step_sizes'][0], 0.01)
+        self.assertEqual(len(set(results['time_step_sizes'])), 4)
+
+    def test_subcycling(self):
+        # test if restart option works correctly with subcycling of the flow solver
+        parameters_flow = self.parameters['solver_wrappers'][0]
+        self.parameters['solver_wrappers'][0] = {'type': 'solver_wrappers.subcycling',
+                                                 'settings': {'number_of_substeps': 3,
+                                                              'solver_wrapper': parameters_flow}}
+        self.test_restart()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,42 @@
+from coconut.tests.coupled_solvers import coupled_solver
+from coconut.tools import create_instance, cd
+
+import unittest
+
+
+class TestCoupledSolverIQNP(coupled_solver.TestCoupledSolver):
+    parameter_file_name = 'test_iqnp.json'
+
+    def set_new_values(self):
+        self.omega_new = 0.1
+        self.settings['omega'] = self.omega_new
+
+    def check_new_values(self, coupled_solver):
+        self.assertEqual(coupled_solver.omega, self.omega_new)
+
+    def test_scaling(self):
+        # automatic scaling is determined from the first non-zero output of the solvers and restored on restart
+        with cd(self.working_dir):
+            self.settings.update({'save_restart': 2, 'case_name': 'scaling'})
+            coupled_solver = create_instance(self.parameters)
+            coupled_solver.initialize()
+            self.assertEqual(coupled_solver.scaling, [None, None])
+            for i in range(2):
+                coupled_solver.initialize_solution_step()
+                coupled_solver.solve_solution_step()
+                coupled_solver.finalize_solution_step()
+                coupled_solver.output_solution_step()
+            coupled_solver.finalize()
+            scaling = coupled_solver.scaling
+            self.assertTrue(all(isinstance(factor, float) and factor > 0. for factor in scaling))
+
+            self.settings['timestep_start'] = 2
+            self.remove_keys(('timestep_start', 'delta_t', 'save_restart', 'case_name'))  # avoid warnings
+            coupled_solver = create_instance(self.parameters)
+            coupled_solver.initialize()
+            self.assertEqual(coupled_solver.scaling, scaling)
+            coupled_solver.finalize()
+
+
+if __name__ == '__main__':
+    unittest.main()
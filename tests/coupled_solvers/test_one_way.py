@@ -3,6 +3,7 @@ from coconut.tests.coupled_solvers import coupled_solver
 
 import unittest
 import numpy as np
+import pickle
 
 
 class TestCoupledSolverOneway(coupled_solver.TestCoupledSolver):
@@ -34,6 +35,32 @@ class TestCoupledSolverOneway(coupled_solver.TestCoupledSolver):
 
             coupled_solver.finalize()
 
+    def test_pipelined(self):
+        # starting the next time step of solver 0 while solver 1 is running does not change the results
+        results = []
+        for pipelined in (False, True):
+            self.setUp()
+            self.parameters['settings'].update({'write_results': 4, 'number_of_timesteps': 4, 'pipelined': pipelined})
+            with cd(self.working_dir):
+                coupled_solver = create_instance(self.parameters)
+                coupled_solver.initialize()
+                for i in range(4):
+                    coupled_solver.initialize_solution_step()
+                    coupled_solver.solve_solution_step()
+                    coupled_solver.finalize_solution_step()
+                    coupled_solver.output_solution_step()
+                coupled_solver.finalize()
+                with open('case_results.pickle', 'rb') as file:
+                    results.append(pickle.load(file))
+            self.assertEqual(coupled_solver.solver_wrappers[0].n, 4)
+        for key in ('solution_x', 'solution_y'):
+            np.testing.assert_array_equal(results[0][key], results[1][key])
+        self.assertEqual(results[0]['residual'], results[1]['residual'])
+
+        self.parameters['settings'].pop('number_of_timesteps')
+        with cd(self.working_dir):
+            self.assertRaises(ValueError, create_instance, self.parameters)
+
 
 if __name__ == '__main__':
     unittest.main()
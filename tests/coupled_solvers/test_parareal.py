@@ -0,0 +1,85 @@
+from coconut.tools import create_instance, cd
+from coconut.tests.coupled_solvers import coupled_solver
+
+import unittest
+import numpy as np
+import copy
+import os
+
+
+class TestCoupledSolverParareal(coupled_solver.TestCoupledSolver):
+    parameter_file_name = 'test_parareal.json'
+
+    def solve(self, parameters, number_of_timesteps):
+        with cd(self.working_dir):
+            coupled_solver = create_instance(parameters)
+            coupled_solver.initialize()
+            solution_x = []
+            for i in range(number_of_timesteps):
+                coupled_solver.initialize_solution_step()
+                coupled_solver.solve_solution_step()
+                coupled_solver.finalize_solution_step()
+                coupled_solver.output_solution_step()
+                solution_x.append(coupled_solver.x.get_interface_data())
+            coupled_solver.finalize()
+        return coupled_solver, np.array(solution_x)
+
+    def get_serial_parameters(self):
+        parameters = copy.deepcopy(self.parameters)
+        parameters.update(self.settings['fine_coupled_solver'])
+        parameters['settings'].update({key: self.settings[key] for key in ('timestep_start', 'delta_t',
+                                                                            'save_restart')})
+        return parameters
+
+    def test_parareal(self):
+        # after as many iterations as time slices, the solution is the one of the fine coupled solver
+        self.settings.update({'number_of_timesteps': 8, 'number_of_slices': 4})
+        serial_parameters = self.get_serial_parameters()
+        coupled_solver, solution_x = self.solve(self.parameters, 8)
+        self.assertEqual(coupled_solver.parareal_iterations, [4])
+        self.assertEqual(len(coupled_solver.iterations), 8)
+        _, solution_x_serial = self.solve(serial_parameters, 8)
+        np.testing.assert_allclose(solution_x, solution_x_serial, rtol=1e-6, atol=1e-14)
+
+        # with a tolerance, fewer iterations are performed
+        self.setUp()
+        self.settings.update({'number_of_timesteps': 8, 'number_of_slices': 4, 'tolerance': 1e-3})
+        coupled_solver, solution_x = self.solve(self.parameters, 8)
+        self.assertLess(coupled_solver.parareal_iterations[0], 4)
+        np.testing.assert_allclose(solution_x, solution_x_serial, rtol=1e-2, atol=1e-9)
+
+    def test_predictor(self):
+        # the history of a predictor which is not polynomial is not corrected, only taken from the fine solution
+        self.parameters['predictor'] = {'type': 'predictors.pod', 'settings': {'modes': 1, 'snapshots': 5}}
+        serial_parameters = self.get_serial_parameters()
+        coupled_solver, solution_x = self.solve(self.parameters, 4)
+        self.assertEqual(coupled_solver.parareal_iterations, [2])
+        _, solution_x_serial = self.solve(serial_parameters, 4)
+        np.testing.assert_allclose(solution_x, solution_x_serial, rtol=1e-6, atol=1e-14)
+
+    def test_working_directories(self):
+        # the solver wrappers run in renamed copies of their working directories, also for absolute paths
+        serial_parameters = self.get_serial_parameters()
+        for solver_wrapper in self.parameters['solver_wrappers']:
+            solver_wrapper['settings']['working_directory'] = os.path.join(
+                self.working_dir, solver_wrapper['settings']['working_directory'])
+        coupled_solver, solution_x = self.solve(self.parameters, 4)
+        self.assertEqual([solver_wrapper['settings']['working_directory'] for solver_wrapper in
+                          coupled_solver.fine_parameters['solver_wrappers']], ['wrapper0', 'wrapper1'])
+        self.assertFalse(os.path.exists(coupled_solver.working_directory))
+        _, solution_x_serial = self.solve(serial_parameters, 4)
+        np.testing.assert_allclose(solution_x, solution_x_serial, rtol=1e-6, atol=1e-14)
+
+    def test_settings(self):
+        self.settings['number_of_timesteps'] = 3
+        with cd(self.working_dir):
+            self.assertRaises(ValueError, create_instance, self.parameters)
+        self.settings['number_of_timesteps'] = 4
+        self.parameters['time_step_controller'] = {'type': 'time_step_controllers.adaptive',
+                                                   'settings': {'delta_t_min': 0.005, 'delta_t_max': 0.02}}
+        with cd(self.working_dir):
+            self.assertRaises(ValueError, create_instance, self.parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()
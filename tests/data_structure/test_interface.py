@@ -1,7 +1,11 @@
 from coconut.data_structure.interface import Interface
 from coconut.data_structure.model import Model
 
+from multiprocessing import shared_memory
 import unittest
+import pickle
+import tempfile
+import json
 import numpy as np
 
 
@@ -176,6 +180,131 @@ class TestInterface(unittest.TestCase):
         self.interface_data *= 2
         np.testing.assert_array_equal(self.interface.get_interface_data(), self.interface_data / 2)
 
+    def test_views(self):
+        self.interface.set_interface_data(self.interface_data)
+        # view on interface data shares memory with the interface
+        interface_data = self.interface.get_interface_data(copy=False)
+        np.testing.assert_array_equal(interface_data, self.interface_data)
+        interface_data *= 2
+        np.testing.assert_array_equal(self.interface.get_interface_data(), self.interface_data * 2)
+        # view on variable data is a reshaped part of the same memory
+        traction = self.interface.get_variable_data('mp1', 'traction', copy=False)
+        self.assertEqual(traction.shape, (self.model_part_size, self.vector_size))
+        self.assertTrue(np.shares_memory(traction, interface_data))
+        traction[:] = self.traction
+        np.testing.assert_array_equal(self.interface.get_variable_data('mp1', 'traction'), self.traction)
+        # views remain valid after setting data
+        self.interface.set_interface_data(self.interface_data)
+        np.testing.assert_array_equal(interface_data, self.interface_data)
+        self.assertRaises(KeyError, self.interface.get_variable_data, 'mp2', 'pressure', copy=False)
+
+    def test_pickle(self):
+        self.interface.set_interface_data(self.interface_data)
+        interface = pickle.loads(pickle.dumps(self.interface))
+        self.assertEqual(interface, self.interface)
+        # views are recreated on the new buffer
+        interface.set_variable_data('mp1', 'pressure', self.pressure)
+        np.testing.assert_array_equal(interface.get_interface_data()[:self.model_part_size], self.pressure.flatten())
+        np.testing.assert_array_equal(self.interface.get_interface_data(), self.interface_data)
+        # only the ModelParts to which the Interface refers are pickled
+        self.assertEqual(list(interface.model), ['mp1', 'mp2'])
+        self.assertRaises(ValueError, interface.model.get_model_part, 'mp3')
+        self.assertTrue(self.interface.has_same_layout(interface))
+
+        # ModelParts shared by Interfaces are pickled once
+        interface_b = Interface(self.parameters['interface_b'], self.model)
+        interface, interface_b = pickle.loads(pickle.dumps((self.interface, interface_b)))
+        self.assertIs(interface.get_model_part('mp1'), interface_b.get_model_part('mp1'))
+
+    def test_save_load(self):
+        self.interface.set_interface_data(self.interface_data)
+        with tempfile.TemporaryDirectory() as directory:
+            self.interface.save(directory)
+            interface = Interface.load(directory)
+            self.assertEqual(interface, self.interface)
+            self.assertFalse(interface.read_only)
+
+            # memory-mapped data is read-only
+            interface = Interface.load(directory, mmap_mode='r')
+            self.assertEqual(interface, self.interface)
+            self.assertTrue(interface.read_only)
+            self.assertIsInstance(interface.get_interface_data(copy=False), np.memmap)
+            np.testing.assert_array_equal(interface.get_variable_data('mp2', 'density'),
+                                          self.interface.get_variable_data('mp2', 'density'))
+            del interface
+
+        # permutation of reordered ModelPart is saved
+        model = Model()
+        model.create_model_part('mp1', *np.random.rand(3, 10), np.arange(10), reorder=True)
+        interface = Interface([{'model_part': 'mp1', 'variables': ['pressure']}], model)
+        with tempfile.TemporaryDirectory() as directory:
+            interface.save(directory)
+            np.testing.assert_array_equal(Interface.load(directory).model.get_model_part('mp1').permutation,
+                                          model.get_model_part('mp1').permutation)
+
+    def test_shared_memory(self):
+        self.interface.set_interface_data(self.interface_data)
+        self.assertIsNone(self.interface.shared_memory_descriptor)
+        descriptor = self.interface.move_to_shared_memory()
+        self.assertEqual(json.loads(json.dumps(descriptor)), descriptor)
+        self.assertRaises(ValueError, self.interface.move_to_shared_memory)
+        np.testing.assert_array_equal(self.interface.get_interface_data(), self.interface_data)
+
+        # attach to shared memory as another process would do
+        shm = shared_memory.SharedMemory(name=descriptor['name'])
+        data = np.ndarray((descriptor['size'],), dtype=descriptor['dtype'], buffer=shm.buf)
+        for model_part_name, variable, start, stop, n_points, n_components in descriptor['variables']:
+            data[start:stop] = getattr(self, variable).flatten()
+            np.testing.assert_array_equal(self.interface.get_variable_data(model_part_name, variable),
+                                          getattr(self, variable))
+        self.interface *= 2.
+        np.testing.assert_array_equal(data[:self.model_part_size], 2. * self.pressure.flatten())
+        del data
+        shm.close()
+
+        # data is kept after releasing the shared memory, which is removed
+        interface_data = self.interface.get_interface_data()
+        self.interface.release_shared_memory()
+        self.assertIsNone(self.interface.shared_memory_descriptor)
+        np.testing.assert_array_equal(self.interface.get_interface_data(), interface_data)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=descriptor['name'])
+
+    def test_read_only_view(self):
+        self.interface.set_interface_data(self.interface_data)
+        self.assertFalse(self.interface.read_only)
+        view = self.interface.get_read_only_view()
+        self.assertTrue(view.read_only)
+        self.assertTrue(self.interface.has_same_layout(view))
+        self.assertEqual(view, self.interface)
+
+        # view shares memory with the Interface
+        self.interface.set_interface_data(2 * self.interface_data)
+        np.testing.assert_array_equal(view.get_interface_data(), 2 * self.interface_data)
+        np.testing.assert_array_equal(view.get_variable_data('mp1', 'traction', copy=False),
+                                      self.interface.get_variable_data('mp1', 'traction'))
+
+        # view can not be changed
+        with self.assertRaises(ValueError):
+            view.set_interface_data(self.interface_data)
+        with self.assertRaises(ValueError):
+            view.set_variable_data('mp1', 'pressure', self.pressure)
+        with self.assertRaises(ValueError):
+            view += 1.
+        with self.assertRaises(ValueError):
+            view.add_scaled(self.interface, 1.)
+        with self.assertRaises(ValueError):
+            self.interface.add(1., out=view)
+        with self.assertRaises(ValueError):
+            view.get_interface_data(copy=False)[0] = 0.
+        np.testing.assert_array_equal(self.interface.get_interface_data(), 2 * self.interface_data)
+
+        # copies and results of operations can be changed
+        for interface in (view.copy(), view + 1., view * 2., view.get_read_only_view().copy()):
+            self.assertFalse(interface.read_only)
+            interface.set_interface_data(self.interface_data)
+        self.assertFalse(pickle.loads(pickle.dumps(view)).read_only)
+
     def test_norm(self):
         self.interface.set_interface_data(self.interface_data)
         norm = np.linalg.norm(self.interface_data)
@@ -335,6 +464,74 @@ class TestInterface(unittest.TestCase):
             with self.assertRaises(TypeError):
                 interface1 /= other
 
+    def test_out(self):
+        interface_data1, interface_data2, interface1, interface2 = self.create_test_interfaces()
+        number = float(np.random.rand())
+
+        for method, other, data in ((interface1.add, interface2, interface_data1 + interface_data2),
+                                    (interface1.add, number, interface_data1 + number),
+                                    (interface1.subtract, interface2, interface_data1 - interface_data2),
+                                    (interface1.subtract, number, interface_data1 - number),
+                                    (interface1.multiply, number, interface_data1 * number)):
+            self.interface.set_interface_data(data)
+            # new Interface
+            interface_result = method(other)
+            self.assertEqual(interface_result, self.interface)
+            self.assertIsNot(interface_result, interface1)
+            # existing Interface
+            interface_out = interface2.copy()
+            data_out = interface_out.get_interface_data(copy=False)
+            self.assertIs(method(other, out=interface_out), interface_out)
+            self.assertEqual(interface_out, self.interface)
+            self.assertIs(interface_out.get_interface_data(copy=False), data_out)
+        np.testing.assert_array_equal(interface1.get_interface_data(), interface_data1)
+
+        # in place
+        interface3 = interface1.copy()
+        interface3.subtract(interface2, out=interface3)
+        self.interface.set_interface_data(interface_data1 - interface_data2)
+        self.assertEqual(interface3, self.interface)
+
+        # errors
+        for method in (interface1.add, interface1.subtract, interface1.multiply):
+            with self.assertRaises(TypeError):
+                method('a')
+            with self.assertRaises(TypeError):
+                method(True)
+        with self.assertRaises(TypeError):
+            interface1.multiply(interface2)
+        interface4 = Interface(self.parameters['interface_b'], self.model)
+        with self.assertRaises(ValueError):
+            interface1.add(interface2, out=interface4)
+        with self.assertRaises(ValueError):
+            interface1.add(interface2, out=interface_data1)
+
+    def test_add_scaled(self):
+        interface_data1, interface_data2, interface1, interface2 = self.create_test_interfaces()
+
+        for alpha in (np.random.rand(), float(np.random.rand()), int(10 * np.random.rand())):
+            interface3 = interface1.copy()
+            data3 = interface3.get_interface_data(copy=False)
+            self.assertIs(interface3.add_scaled(interface2, alpha), interface3)
+            self.assertIs(interface3.get_interface_data(copy=False), data3)
+            np.testing.assert_allclose(interface3.get_interface_data(), interface_data1 + alpha * interface_data2)
+        np.testing.assert_array_equal(interface2.get_interface_data(), interface_data2)
+
+        with self.assertRaises(TypeError):
+            interface1.add_scaled(interface_data2, 1.)
+        with self.assertRaises(TypeError):
+            interface1.add_scaled(interface2, 'a')
+        with self.assertRaises(TypeError):
+            interface1.add_scaled(interface2, True)
+
+    def test_has_same_layout(self):
+        interface2 = Interface(self.parameters['interface_a'], self.model)
+        self.assertTrue(self.interface.has_same_layout(interface2))
+        self.assertTrue(self.interface.has_same_layout(self.interface.copy()))
+        for interface_name in ('interface_b', 'interface_c', 'interface_d'):
+            interface3 = Interface(self.parameters[interface_name], self.model)
+            self.assertFalse(self.interface.has_same_layout(interface3))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,128 @@
+from coconut.data_structure.interface import Interface
+from coconut.data_structure.interface_block import InterfaceBlock
+from coconut.data_structure.model import Model
+
+import unittest
+import pickle
+import numpy as np
+
+
+class TestInterfaceBlock(unittest.TestCase):
+
+    def setUp(self):
+        self.model_part_size = model_part_size = 3
+        self.parameters = {
+            'interface_a': [{'model_part': 'mp1', 'variables': ['pressure', 'traction']},
+                            {'model_part': 'mp2', 'variables': ['density']}],
+            'interface_b': [{'model_part': 'mp1', 'variables': ['pressure', 'displacement']}],
+        }
+        self.model = Model()
+        for name in ('mp1', 'mp2'):
+            self.model.create_model_part(name, np.random.rand(model_part_size), np.random.rand(model_part_size),
+                                         np.random.rand(model_part_size), np.arange(0, model_part_size))
+
+        self.interface = Interface(self.parameters['interface_a'], self.model)
+        self.size = self.interface.size
+        self.data = np.random.rand(self.size, 10)
+
+    def test_instantiation(self):
+        block = InterfaceBlock(self.interface)
+        self.assertEqual(len(block), 0)
+        self.assertEqual(block.shape, (self.size, 0))
+        self.assertEqual(block.dtype, np.float64)
+        self.assertEqual(InterfaceBlock(self.interface, capacity=5, dtype=np.float32).capacity, 5)
+        with self.assertRaises(TypeError):
+            InterfaceBlock(self.interface.get_interface_data())
+
+    def test_append_prepend(self):
+        block = InterfaceBlock(self.interface)
+        self.interface.set_interface_data(self.data[:, 1])
+        block.append(self.interface)
+        block.append(self.data[:, 2:5])
+        block.prepend(self.data[:, 0])
+        np.testing.assert_array_equal(block.array, self.data[:, :5])
+
+        # growth is amortized
+        for i in range(5, 10):
+            block.append(self.data[:, i])
+        self.assertEqual(block.shape, (self.size, 10))
+        self.assertLessEqual(block.capacity, 20)
+        np.testing.assert_array_equal(block.array, self.data)
+
+        block = InterfaceBlock(self.interface, capacity=2)
+        for i in reversed(range(10)):
+            block.prepend(self.data[:, i])
+        np.testing.assert_array_equal(block.array, self.data)
+
+        # columns are stored contiguously
+        self.assertTrue(block.array[:, 0].flags.c_contiguous)
+
+        with self.assertRaises(ValueError):
+            block.append(Interface(self.parameters['interface_b'], self.model))
+        with self.assertRaises(ValueError):
+            block.append(np.zeros(self.size + 1))
+        with self.assertRaises(TypeError):
+            block.append(list(self.data[:, 0]))
+
+    def test_delete(self):
+        block = InterfaceBlock(self.interface)
+        block.append(self.data)
+        block.delete(1)
+        block.delete(-1)
+        block.delete(6)
+        np.testing.assert_array_equal(block.array, self.data[:, [0, 2, 3, 4, 5, 6, 8]])
+        block.clear()
+        self.assertEqual(len(block), 0)
+        self.assertGreaterEqual(block.capacity, 10)
+
+    def test_array_interface(self):
+        block = InterfaceBlock(self.interface)
+        block.append(self.data[:, :3])
+        np.testing.assert_array_equal(np.hstack((block, self.data[:, 3:])), self.data)
+        np.testing.assert_array_equal(block[:, 1], self.data[:, 1])
+        self.assertEqual(np.asarray(block, dtype=np.float32).dtype, np.float32)
+
+        # array is a view
+        block.array[0, 0] = -1.
+        self.assertEqual(block[0, 0], -1.)
+
+    def test_get_interface(self):
+        block = InterfaceBlock(self.interface, dtype=np.float32)
+        block.append(self.data[:, :3])
+        interface = block.get_interface(-1)
+        self.assertTrue(self.interface.has_same_layout(interface))
+        self.assertFalse(interface.read_only)
+        np.testing.assert_allclose(interface.get_interface_data(), self.data[:, 2], rtol=1e-7)
+
+    def test_get_variable_data(self):
+        block = InterfaceBlock(self.interface)
+        block.append(self.data[:, :4])
+        for column in range(4):
+            self.interface.set_interface_data(self.data[:, column])
+            for model_part_name, variable in self.interface.model_part_variable_pairs:
+                np.testing.assert_array_equal(block.get_variable_data(model_part_name, variable)[:, :, column],
+                                              self.interface.get_variable_data(model_part_name, variable))
+        np.testing.assert_array_equal(block.get_model_part_data('mp2'), self.data[-self.model_part_size:, :4])
+        np.testing.assert_array_equal(block.get_model_part_data('mp1'), self.data[:-self.model_part_size, :4])
+
+        # views share memory with the InterfaceBlock
+        block.get_variable_data('mp1', 'traction')[0, 1, 0] = -1.
+        self.assertEqual(block.get_model_part_data('mp1')[self.model_part_size + 1, 0], -1.)
+
+        with self.assertRaises(KeyError):
+            block.get_variable_data('mp2', 'pressure')
+        with self.assertRaises(KeyError):
+            block.get_model_part_data('mp3')
+
+    def test_pickle(self):
+        block = InterfaceBlock(self.interface, capacity=100)
+        block.append(self.data)
+        block_pickled = pickle.loads(pickle.dumps(block))
+        np.testing.assert_array_equal(block_pickled.array, self.data)
+        self.assertEqual(block_pickled.capacity, 10)
+        block_pickled.append(self.data[:, 0])
+        self.assertEqual(len(block_pickled), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
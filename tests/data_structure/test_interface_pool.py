@@ -0,0 +1,71 @@
+from coconut.data_structure.interface import Interface
+from coconut.data_structure.interface_pool import InterfacePool
+from coconut.data_structure.model import Model
+
+import unittest
+import numpy as np
+
+
+class TestInterfacePool(unittest.TestCase):
+
+    def setUp(self):
+        model_part_size = 3
+        self.parameters = {
+            'interface_a': [{'model_part': 'mp1', 'variables': ['pressure', 'traction']}],
+            'interface_b': [{'model_part': 'mp1', 'variables': ['pressure', 'displacement']}],
+        }
+        self.model = Model()
+        x0 = np.random.rand(model_part_size)
+        y0 = np.random.rand(model_part_size)
+        z0 = np.random.rand(model_part_size)
+        ids = np.arange(0, model_part_size)
+        self.model.create_model_part('mp1', x0, y0, z0, ids)
+
+        self.interface = Interface(self.parameters['interface_a'], self.model)
+        self.interface.set_interface_data(np.random.rand(self.interface.size))
+
+    def test_instantiation(self):
+        pool = InterfacePool(self.interface)
+        self.assertEqual(pool.allocated, 0)
+        self.assertEqual(pool.available, 0)
+        with self.assertRaises(TypeError):
+            InterfacePool(self.interface.get_interface_data())
+
+    def test_get_release(self):
+        pool = InterfacePool(self.interface)
+        interface1 = pool.get()
+        interface2 = pool.get()
+        self.assertIsNot(interface1, interface2)
+        self.assertIsNot(interface1, self.interface)
+        self.assertTrue(self.interface.has_same_layout(interface1))
+        self.assertEqual(pool.allocated, 2)
+
+        # released Interfaces are reused
+        pool.release(interface1, interface2)
+        self.assertEqual(pool.available, 2)
+        for _ in range(10):
+            interface3 = pool.get()
+            self.assertTrue(interface3 is interface1 or interface3 is interface2)
+            pool.release(interface3)
+        self.assertEqual(pool.allocated, 2)
+
+        # template is not affected by changes in the scratch Interfaces
+        data = self.interface.get_interface_data()
+        interface3 = pool.get()
+        interface3 *= 2.
+        np.testing.assert_array_equal(self.interface.get_interface_data(), data)
+
+    def test_release_errors(self):
+        pool = InterfacePool(self.interface)
+        interface1 = pool.get()
+        pool.release(interface1)
+        with self.assertRaises(ValueError):
+            pool.release(interface1)
+        with self.assertRaises(ValueError):
+            pool.release(Interface(self.parameters['interface_b'], self.model))
+        with self.assertRaises(ValueError):
+            pool.release(self.interface.get_interface_data())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ from coconut.data_structure.model import Model
 from coconut.data_structure.model_part import ModelPart
 
 import unittest
+import pickle
 import numpy as np
 
 
@@ -35,6 +36,14 @@ class TestModel(unittest.TestCase):
         z0 = np.random.rand(size)
         self.assertIsInstance(self.model.create_model_part(name, x0, y0, z0, ids), ModelPart)
 
+    def test_add_model_part(self):
+        model_part = self.model.get_model_part(self.name)
+        model2 = Model()
+        self.assertIs(model2.add_model_part(model_part), model_part)
+        self.assertIs(model2.get_model_part(self.name), model_part)
+        self.assertRaises(ValueError, model2.add_model_part, model_part)
+        self.assertRaises(TypeError, model2.add_model_part, self.name)
+
     def test_get_model_part(self):
         self.model.get_model_part('mp1')  # mp1 is already present (from setUp method)
         self.assertRaises(ValueError, self.model.get_model_part, 'mp2')
@@ -53,6 +62,11 @@ class TestModel(unittest.TestCase):
         for i, model_part_name in enumerate(self.model):
             self.assertEqual(model_part_name, name_list[i])
 
+    def test_pickle(self):
+        model = pickle.loads(pickle.dumps(self.model))
+        self.assertEqual(model, self.model)
+        self.assertEqual(list(model), list(self.model))
+
     def test_attribute_change(self):
         with self.assertRaises(AttributeError):
             self.model.model_parts
@@ -1,6 +1,7 @@
 from coconut.data_structure.model_part import ModelPart
 
 import unittest
+import pickle
 import numpy as np
 
 
@@ -60,6 +61,89 @@ class TestModelPart(unittest.TestCase):
         with self.assertRaises(AttributeError):
             mp.id = np.arange(self.correct_size)
 
+    def test_coordinates(self):
+        mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
+        coords = np.column_stack((self.x0, self.y0, self.z0))
+        np.testing.assert_array_equal(mp.coords, coords)
+        np.testing.assert_array_equal(mp.x0, self.x0)
+        np.testing.assert_array_equal(mp.y0, self.y0)
+        np.testing.assert_array_equal(mp.z0, self.z0)
+        np.testing.assert_array_equal(mp.id, self.ids)
+
+        # no copies are made, ModelPart is not affected by changes in input arrays
+        self.assertIs(mp.coords, mp.coords)
+        self.assertIs(mp.x0, mp.x0)
+        self.assertTrue(np.shares_memory(mp.x0, mp.coords))
+        self.x0[0] += 1.
+        self.ids[0] += 100
+        np.testing.assert_array_equal(mp.coords, coords)
+
+        # arrays are read-only
+        for array in (mp.coords, mp.x0, mp.y0, mp.z0, mp.id, mp.bounding_box):
+            with self.assertRaises(ValueError):
+                array[0] = 0
+
+    def test_bounding_box(self):
+        mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
+        coords = np.column_stack((self.x0, self.y0, self.z0))
+        np.testing.assert_array_equal(mp.bounding_box, np.vstack((coords.min(axis=0), coords.max(axis=0))))
+        self.assertIs(mp.bounding_box, mp.bounding_box)
+        empty = np.array([])
+        mp_empty = ModelPart(self.name, empty, empty, empty, np.array([], dtype=int))
+        self.assertTrue(np.all(np.isnan(mp_empty.bounding_box)))
+
+    def test_get_indices(self):
+        mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
+        np.testing.assert_array_equal(mp.get_indices(self.ids), np.arange(self.correct_size))
+        np.testing.assert_array_equal(mp.get_indices(self.ids[::-1]), np.arange(self.correct_size)[::-1])
+        self.assertEqual(mp.get_indices(self.ids[1]), 1)
+        with self.assertRaises(KeyError):
+            mp.get_indices(np.array([np.max(self.ids) + 1]))
+        with self.assertRaises(KeyError):
+            mp.get_indices(np.array([np.min(self.ids) - 1]))
+
+    def test_reorder(self):
+        mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
+        self.assertIsNone(mp.permutation)
+        data = np.random.rand(self.correct_size, 3)
+        self.assertIs(mp.from_original_order(data), data)
+        self.assertIs(mp.to_original_order(data), data)
+
+        # points on a regular 2D grid in random order, the Morton order visits the 2x2 blocks one by one
+        x, y = np.meshgrid(np.arange(4.), np.arange(4.), indexing='ij')
+        x0, y0 = x.flatten(), y.flatten()
+        ids = np.random.permutation(16) + 100
+        order = np.random.permutation(16)
+        mp = ModelPart(self.name, x0[order], y0[order], np.zeros(16), ids[order], reorder=True)
+        np.testing.assert_array_equal(mp.coords[:4, :2], [[0., 0.], [1., 0.], [0., 1.], [1., 1.]])
+        np.testing.assert_array_equal(mp.coords[-4:, :2], [[2., 2.], [3., 2.], [2., 3.], [3., 3.]])
+        np.testing.assert_array_equal(mp.x0, x0[order][mp.permutation])
+        np.testing.assert_array_equal(mp.id, ids[order][mp.permutation])
+        np.testing.assert_array_equal(mp.get_indices(mp.id), np.arange(16))
+        self.assertFalse(mp.permutation.flags.writeable)
+
+        # data is converted between the original order and the ModelPart order
+        data = np.column_stack((x0[order], y0[order]))
+        np.testing.assert_array_equal(mp.from_original_order(data), mp.coords[:, :2])
+        np.testing.assert_array_equal(mp.to_original_order(mp.from_original_order(data)), data)
+
+        mp_pickled = pickle.loads(pickle.dumps(mp))
+        self.assertEqual(mp, mp_pickled)
+        np.testing.assert_array_equal(mp_pickled.to_original_order(mp_pickled.coords[:, :2]), data)
+
+        # empty ModelPart
+        empty = np.array([])
+        mp_empty = ModelPart(self.name, empty, empty, empty, np.array([], dtype=int), reorder=True)
+        self.assertEqual(mp_empty.permutation.size, 0)
+
+    def test_pickle(self):
+        mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
+        mp.bounding_box
+        mp_pickled = pickle.loads(pickle.dumps(mp))
+        self.assertEqual(mp, mp_pickled)
+        self.assertFalse(mp_pickled.coords.flags.writeable)
+        self.assertTrue(np.shares_memory(mp_pickled.z0, mp_pickled.coords))
+
     def test_eq(self):
         mp = ModelPart(self.name, self.x0, self.y0, self.z0, self.ids)
         name_2 = 'mp2'
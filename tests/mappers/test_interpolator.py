@@ -1,5 +1,6 @@
 from coconut import data_structure
 from coconut.tools import create_instance
+from coconut.coupling_components.mappers import interpolator
 
 import unittest
 import numpy as np
@@ -59,6 +60,41 @@ class TestMapperInterpolator(unittest.TestCase):
         self.assertRaises(ValueError, mapper.initialize, *(mp_from, mp_to))
         mapper.finalize()
 
+    def test_spatial_tree(self):
+        self.parameters['settings']['directions'] = ['x', 'y', 'z']
+        self.parameters['settings']['check_bounding_box'] = False
+        model = data_structure.Model()
+        mp_from = model.create_model_part('mp_from', *split(np.random.rand(10, 3)), np.arange(10))
+        mp_to_1 = model.create_model_part('mp_to_1', *split(np.random.rand(5, 3)), np.arange(5))
+        mp_to_2 = model.create_model_part('mp_to_2', *split(np.random.rand(6, 3)), np.arange(6))
+
+        # same from-ModelPart, directions and scaling: tree is shared
+        mapper_1 = create_instance(self.parameters)
+        mapper_1.initialize(mp_from, mp_to_1)
+        mapper_2 = create_instance(self.parameters)
+        mapper_2.initialize(mp_from, mp_to_2)
+        self.assertIs(mapper_1.tree, mapper_2.tree)
+        self.assertTrue(mapper_1.spatial_tree['duplicates_checked'])
+        np.testing.assert_array_equal(mapper_1.coords_from, mp_from.coords)
+
+        # different directions or scaling: different tree
+        self.parameters['settings']['directions'] = ['x', 'y']
+        mapper_3 = create_instance(self.parameters)
+        mapper_3.initialize(mp_from, mp_to_1)
+        self.assertIsNot(mapper_1.tree, mapper_3.tree)
+        self.parameters['settings']['scaling'] = [1., 2.]
+        mapper_4 = create_instance(self.parameters)
+        mapper_4.initialize(mp_from, mp_to_1)
+        self.assertIsNot(mapper_3.tree, mapper_4.tree)
+        np.testing.assert_array_equal(mapper_4.coords_from, mp_from.coords[:, :2] * np.array([[1., 2.]]))
+
+        # entries are removed when the ModelPart no longer exists
+        n_entries = len(interpolator.spatial_trees)
+        for mapper in (mapper_1, mapper_2, mapper_3, mapper_4):
+            mapper.finalize()
+        del model, mp_from, mapper_1, mapper_2, mapper_3, mapper_4, mapper
+        self.assertEqual(len(interpolator.spatial_trees), n_entries - 3)
+
 
 class Case1D:
     # 1D case: square-root grid + linear function
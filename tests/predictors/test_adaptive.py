@@ -0,0 +1,109 @@
+from coconut import data_structure
+from coconut.data_structure.interface import Interface
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+import contextlib
+import io
+import pickle
+
+
+class TestPredictorAdaptive(unittest.TestCase):
+    def setUp(self):
+        self.m = 10
+        dz = 3
+        variable = 'area'
+        model_part_name = 'wall'
+        interface_settings = [{'model_part': model_part_name, 'variables': [variable]}]
+
+        # create model and model_part
+        model = data_structure.Model()
+        ids = np.arange(0, self.m)
+        x0 = np.zeros(self.m)
+        y0 = np.zeros(self.m)
+        self.z0 = np.arange(0, self.m * dz, dz)
+        model.create_model_part(model_part_name, x0, y0, self.z0, ids)
+
+        # create interface
+        self.interface = Interface(interface_settings, model)
+
+        self.parameters = {'type': 'predictors.adaptive'}
+
+    def get_solution(self, n):
+        # cubic in time until a sudden change after time step 8, constant afterwards
+        t = min(n, 9)
+        return (1 + t + 0.5 * t ** 2 + 0.1 * t ** 3) * (1 + self.z0 / 30) + (5 if n > 8 else 0)
+
+    def do_time_steps(self, predictor, time_steps):
+        errors = []
+        extrapolations = []
+        for n in time_steps:
+            predictor.initialize_solution_step()
+            prediction = predictor.predict(self.interface).get_interface_data()
+            errors.append(np.linalg.norm(prediction - self.get_solution(n)))
+            extrapolations.append(getattr(predictor, 'extrapolation', None))
+            self.interface.set_interface_data(self.get_solution(n))
+            predictor.update(self.interface)
+            predictor.finalize_solution_step()
+        return errors, extrapolations
+
+    def test_predictor_adaptive(self):
+        self.interface.set_interface_data(self.get_solution(0))
+        predictor = create_instance(self.parameters)
+        predictor.initialize(self.interface)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            errors, extrapolations = self.do_time_steps(predictor, range(1, 21))
+
+        self.interface.set_interface_data(self.get_solution(0))
+        predictor_cubic = create_instance({'type': 'predictors.cubic'})
+        predictor_cubic.initialize(self.interface)
+        errors_cubic, _ = self.do_time_steps(predictor_cubic, range(1, 21))
+
+        # an extrapolation is selected once it has been scored, one time step after sufficient solutions are available
+        self.assertEqual(extrapolations[:4], ['constant', 'constant', 'linear', 'quadratic'])
+        # exact cubic extrapolation before the sudden change
+        self.assertEqual(extrapolations[4:9], 5 * ['cubic'])
+        self.assertLess(max(errors[4:8]), 1e-10)
+        # after the sudden change, the constant extrapolation is exact earlier than the cubic one
+        self.assertEqual(extrapolations[10:], 10 * ['constant'])
+        self.assertLess(max(errors[10:]), 1e-10)
+        self.assertGreater(min(errors_cubic[9:12]), 1)
+        # the selection is logged
+        self.assertIn('changed from cubic to', output.getvalue())
+
+    def test_extrapolations(self):
+        # selection among the given extrapolations only
+        self.parameters['settings'] = {'extrapolations': ['linear', 'legacy']}
+        self.interface.set_interface_data(self.get_solution(0))
+        predictor = create_instance(self.parameters)
+        predictor.initialize(self.interface)
+        self.assertEqual(predictor.order, 2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, extrapolations = self.do_time_steps(predictor, range(1, 21))
+        self.assertEqual(set(extrapolations), {'linear', 'legacy'})
+
+        self.parameters['settings'] = {'extrapolations': ['linear', 'spline']}
+        self.assertRaises(ValueError, create_instance, self.parameters)
+        self.parameters['settings'] = {'extrapolations': []}
+        self.assertRaises(ValueError, create_instance, self.parameters)
+
+    def test_restart(self):
+        self.interface.set_interface_data(self.get_solution(0))
+        predictor = create_instance(self.parameters)
+        predictor.initialize(self.interface)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.do_time_steps(predictor, range(1, 10))
+            restart_data = pickle.loads(pickle.dumps(predictor.save_restart_data()))
+            errors, extrapolations = self.do_time_steps(predictor, range(10, 16))
+
+            predictor_restart = create_instance(self.parameters)
+            predictor_restart.initialize(self.interface)
+            predictor_restart.restart(restart_data)
+            errors_restart, extrapolations_restart = self.do_time_steps(predictor_restart, range(10, 16))
+        np.testing.assert_allclose(errors_restart, errors, atol=1e-12)
+        self.assertEqual(extrapolations_restart, extrapolations)
+
+
+if __name__ == '__main__':
+    unittest.main()
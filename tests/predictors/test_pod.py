@@ -0,0 +1,151 @@
+from coconut import data_structure
+from coconut.data_structure.interface import Interface
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+import pickle
+
+
+class TestPredictorPOD(unittest.TestCase):
+    def setUp(self):
+        self.m = 10
+        dz = 3
+        variable = 'area'
+        model_part_name = 'wall'
+        interface_settings = [{'model_part': model_part_name, 'variables': [variable]}]
+
+        # create model and model_part
+        model = data_structure.Model()
+        ids = np.arange(0, self.m)
+        x0 = np.zeros(self.m)
+        y0 = np.zeros(self.m)
+        self.z0 = np.arange(0, self.m * dz, dz)
+        model.create_model_part(model_part_name, x0, y0, self.z0, ids)
+
+        # create interface
+        self.interface = Interface(interface_settings, model)
+
+        self.parameters = {'type': 'predictors.pod', 'settings': {'modes': 4, 'snapshots': 12}}
+
+    def get_solution(self, t):
+        # periodic solution consisting of three modes
+        phase = 2 * np.pi * t / 13
+        return 1 + np.sin(phase) * np.sin(self.z0 / 5) + 0.5 * np.cos(phase) * self.z0 / 30
+
+    def get_standing_wave(self, t):
+        # oscillation of a single mode around a nonzero mean
+        return 1 + np.sin(2 * np.pi * t / 13) * np.sin(self.z0 / 7)
+
+    def do_time_steps(self, predictor, time_steps, get_solution=None, delta_t=None):
+        get_solution = get_solution or self.get_solution
+        errors = []
+        for t in time_steps:
+            predictor.initialize_solution_step()
+            if delta_t is not None:
+                predictor.set_delta_t(delta_t)
+            prediction = predictor.predict(self.interface).get_interface_data()
+            errors.append(np.linalg.norm(prediction - get_solution(t)))
+            self.interface.set_interface_data(get_solution(t))
+            predictor.update(self.interface)
+            predictor.finalize_solution_step()
+        return errors
+
+    def test_predictor_pod(self):
+        predictors = {}
+        errors = {}
+        for predictor_type in ('pod', 'cubic'):
+            self.interface.set_interface_data(self.get_solution(0))
+            self.parameters['type'] = f'predictors.{predictor_type}'
+            predictors[predictor_type] = create_instance(self.parameters)
+            predictors[predictor_type].initialize(self.interface)
+            errors[predictor_type] = self.do_time_steps(predictors[predictor_type], range(1, 21))
+
+        # polynomial extrapolation as long as insufficient time steps are available
+        np.testing.assert_allclose(errors['pod'][:3], errors['cubic'][:3])
+        # exact prediction of the periodic solution, unlike the cubic extrapolation
+        self.assertLess(max(errors['pod'][-10:]), 1e-10)
+        self.assertGreater(min(errors['cubic'][-10:]), 1e-3)
+        # memory is bounded
+        self.assertEqual(predictors['pod'].basis.shape, (self.m, 3))
+        self.assertEqual(predictors['pod'].coefficients.shape, (12, 3))
+
+    def test_standing_wave(self):
+        # the recurrence on the coefficients of several previous time steps represents an oscillation around a mean
+        errors = {}
+        for predictor_type in ('pod', 'cubic'):
+            self.interface.set_interface_data(self.get_standing_wave(0))
+            self.parameters['type'] = f'predictors.{predictor_type}'
+            predictor = create_instance(self.parameters)
+            predictor.initialize(self.interface)
+            errors[predictor_type] = self.do_time_steps(predictor, range(1, 21), self.get_standing_wave)
+        self.assertLess(max(errors['pod'][-10:]), 1e-10)
+        self.assertGreater(np.mean(errors['cubic'][-10:]), 1e-2)
+
+    def test_time_step_change(self):
+        predictors = {}
+        errors = {}
+        for predictor_type in ('pod', 'cubic'):
+            self.interface.set_interface_data(self.get_solution(0))
+            self.parameters['type'] = f'predictors.{predictor_type}'
+            predictors[predictor_type] = create_instance(self.parameters)
+            predictors[predictor_type].initialize(self.interface)
+            self.do_time_steps(predictors[predictor_type], range(1, 21), delta_t=1.)
+            errors[predictor_type] = self.do_time_steps(predictors[predictor_type], np.arange(20.5, 30.5, 0.5),
+                                                        delta_t=0.5)
+
+        # the basis is restarted and the solutions of different time step sizes are extrapolated by the polynomial
+        self.assertEqual(predictors['pod'].coefficients.shape[0], 12)
+        np.testing.assert_allclose(errors['pod'][:5], errors['cubic'][:5])
+        self.assertGreater(min(errors['cubic'][:5]), 1e-4)
+        # exact prediction once sufficient time steps with the new time step size are available
+        self.assertLess(max(errors['pod'][-5:]), 1e-10)
+
+    def test_zero_solution(self):
+        # the initial solution does not contribute to the basis
+        self.interface.set_interface_data(np.zeros(self.m))
+        predictor = create_instance(self.parameters)
+        predictor.initialize(self.interface)
+        self.assertEqual(predictor.basis.shape, (self.m, 0))
+        errors = self.do_time_steps(predictor, range(1, 21))
+        self.assertLess(max(errors[-5:]), 1e-10)
+
+    def test_restart(self):
+        self.interface.set_interface_data(self.get_solution(0))
+        predictor = create_instance(self.parameters)
+        predictor.initialize(self.interface)
+        self.do_time_steps(predictor, range(1, 11))
+        restart_data = pickle.loads(pickle.dumps(predictor.save_restart_data()))
+        errors = self.do_time_steps(predictor, range(11, 16))
+
+        # restart with the same type of predictor
+        predictor_restart = create_instance(self.parameters)
+        predictor_restart.initialize(self.interface)
+        predictor_restart.restart(restart_data)
+        np.testing.assert_allclose(self.do_time_steps(predictor_restart, range(11, 16)), errors, atol=1e-14)
+
+        # restart from a polynomial predictor, only the solutions of the last time steps are available
+        predictor_restart = create_instance(self.parameters)
+        predictor_restart.initialize(self.interface)
+        predictor_restart.restart({'dataprev': [self.get_solution(n) for n in range(10, 6, -1)]})
+        self.assertEqual(predictor_restart.coefficients.shape[0], 4)
+        self.assertEqual(len(predictor_restart.dataprev), 4)
+        errors = self.do_time_steps(predictor_restart, range(11, 21))
+        self.assertLess(errors[-1], 1e-10)
+
+    def test_settings(self):
+        self.parameters['settings']['snapshots'] = 1
+        self.assertRaises(ValueError, create_instance, self.parameters)
+        # the recurrence on the delayed coefficients of all modes requires sufficient time steps
+        self.parameters['settings']['snapshots'] = 10
+        self.assertRaises(ValueError, create_instance, self.parameters)
+        self.parameters['settings']['snapshots'] = 11
+        create_instance(self.parameters)
+        for key, value in (('modes', 0), ('delays', 1.5)):
+            self.parameters['settings'][key] = value
+            self.assertRaises(ValueError, create_instance, self.parameters)
+            del self.parameters['settings'][key]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,29 @@ class TestPredictor(unittest.TestCase):
             _ = self.predictor.update(interface)
             _ = self.predictor.predict(interface)
 
+    def test_variable_time_step_size(self):
+        # polynomials in time are extrapolated exactly when the time step size varies
+        interface = self.interface
+        interface_as_array = interface.get_interface_data()
+
+        def f(t):
+            return 1 + 2 * t - t ** 2 + 0.5 * t ** 3
+
+        self.predictor.initialize(interface)
+        t = 0.
+        for delta_t in (0.1, 0.3, 0.2, 0.05):
+            self.predictor.set_delta_t(delta_t)
+            self.predictor.initialize_solution_step()
+            t += delta_t
+            interface.set_interface_data(f(t) * interface_as_array)
+            self.predictor.update(interface)
+            self.predictor.finalize_solution_step()
+
+        self.predictor.set_delta_t(0.4)
+        self.predictor.initialize_solution_step()
+        np.testing.assert_allclose(self.predictor.predict(interface).get_interface_data(),
+                                   f(t + 0.4) * interface_as_array)
+
     def test_change_settings_on_restart(self):
         # test if changing settings upon restart works correctly
 
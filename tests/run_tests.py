@@ -31,7 +31,8 @@ def generate_test_suite(keys, all_tests):
             test_suite.addTests(generate_test_suite(['tests.convergence_criteria', 'tests.coupled_solvers',
                                                      'tests.data_structure', 'tests.mappers', 'tests.predictors',
                                                      'tests.solver_wrappers.python', 'tests.solver_wrappers.combined',
-                                                     'tests.post_processing'],
+                                                     'tests.solver_wrappers.subcycling',
+                                                     'tests.post_processing', 'tests.time_step_controllers'],
                                                     all_tests))
         else:
             for test in all_tests:
@@ -108,6 +108,49 @@ class TestSolverWrapperCombined(unittest.TestCase):
         tools.print_info('\n')
         tools.print_info(comb_solver.get_time_allocation())
 
+    @mock.patch('coconut.tools.create_instance', side_effect=mock_create_instance)
+    def test_solve_solution_step_async(self, create_instance):
+        # the Futures of the (mapped) solver wrappers give the same output as solve_solution_step
+        comb_solver = create_instance(self.comb_sol_par)
+        model_part = comb_solver.get_interface_input().get_model_part(self.mp_name_in)
+        interface_input = comb_solver.get_interface_input()
+        interface_input.set_variable_data(self.mp_name_in, 'displacement',
+                                          self.get_displacement(model_part.x0, model_part.y0, model_part.z0))
+
+        comb_solver.initialize()
+        comb_solver.initialize_solution_step()
+        for sol_wrapper in comb_solver.solver_wrappers:
+            output_sync = sol_wrapper.solve_solution_step(interface_input).get_interface_data()
+            future = sol_wrapper.solve_solution_step_async(interface_input.get_read_only_view())
+            np.testing.assert_array_equal(future.result().get_interface_data(), output_sync)
+        self.assertIsNotNone(comb_solver.master_solver_wrapper.executor)
+        comb_solver.finalize_solution_step()
+        comb_solver.finalize()
+        self.assertIsNone(comb_solver.master_solver_wrapper.executor)
+
+    @mock.patch('coconut.tools.create_instance', side_effect=mock_create_instance)
+    def test_concurrent(self, create_instance):
+        # concurrent and sequential execution give the same output, as the outputs are summed in the same order
+        outputs = []
+        for concurrent in (True, False):
+            self.setUp()
+            self.comb_sol_par['settings']['concurrent'] = concurrent
+            comb_solver = create_instance(self.comb_sol_par)
+            model_part = comb_solver.get_interface_input().get_model_part(self.mp_name_in)
+            interface_input = comb_solver.get_interface_input()
+            interface_input.set_variable_data(self.mp_name_in, 'displacement',
+                                              self.get_displacement(model_part.x0, model_part.y0, model_part.z0))
+            comb_solver.initialize()
+            comb_solver.initialize_solution_step()
+            outputs.append(comb_solver.solve_solution_step(interface_input).get_interface_data())
+            comb_solver.finalize_solution_step()
+            comb_solver.finalize()
+
+            run_time = comb_solver.get_time_allocation()['run_time']
+            self.assertGreaterEqual(run_time['coupling'], 0.)
+            self.assertEqual(len(run_time), len(comb_solver.solver_wrappers) + 2)
+        np.testing.assert_array_equal(outputs[0], outputs[1])
+
 
 if __name__ == '__main__':
     unittest.main()
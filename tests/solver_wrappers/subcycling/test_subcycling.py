@@ -0,0 +1,161 @@
+from coconut.tools import create_instance, cd
+
+import unittest
+import os
+import shutil
+import json
+import copy
+import numpy as np
+
+
+def get_dy(x):
+    return 0.0001 * np.sin(2 * np.pi / 0.05 * x)
+
+
+class TestSolverWrapperSubcycling(unittest.TestCase):
+
+    def setUp(self):
+        dir_name = os.path.realpath(os.path.dirname(__file__))  # path to subcycling directory
+        setup_dir = os.path.join(dir_name, '../python/tube/test_tube_flow')
+
+        # read settings of tube flow solver
+        parameter_file_name = os.path.join(setup_dir, 'test_tube_flow_solver.json')
+        with open(parameter_file_name, 'r') as parameter_file:
+            self.parameters_flow = json.load(parameter_file)
+        self.parameters_flow['settings']['working_directory'] = 'CFD'
+        self.parameters_flow['settings'].pop('save_restart')
+        self.parameters_flow['settings'].pop('delta_t')
+        self.delta_t = 0.0004
+        self.number_of_substeps = 4
+        self.model_part_name = 'wall'
+
+        # set working directory
+        self.working_dir = os.path.join(dir_name, 'subcycling_tmp')
+        working_dir_cfd = os.path.join(self.working_dir, 'CFD')
+
+        # setup
+        shutil.rmtree(self.working_dir, ignore_errors=True)
+        os.mkdir(self.working_dir)
+        os.mkdir(working_dir_cfd)
+        shutil.copy(os.path.join(setup_dir, 'setup_tube_flow/solver_parameters.json'), working_dir_cfd)
+
+    def tearDown(self):
+        shutil.rmtree(self.working_dir)
+
+    def get_parameters(self, timestep_start=0, save_restart=0):
+        return {'type': 'solver_wrappers.subcycling',
+                'settings': {'timestep_start': timestep_start, 'number_of_timesteps': 4, 'save_restart': save_restart,
+                             'delta_t': self.delta_t, 'number_of_substeps': self.number_of_substeps,
+                             'solver_wrapper': copy.deepcopy(self.parameters_flow)}}
+
+    def get_displacements(self, interface, number_of_time_steps):
+        z0 = interface.get_model_part(self.model_part_name).z0
+        displacement = interface.get_variable_data(self.model_part_name, 'displacement')
+        displacement[:, 1] = get_dy(z0)
+        return [(i + 1) ** 2 * displacement for i in range(number_of_time_steps)]
+
+    def test_subcycling(self):
+        # subcycling gives the same output as the solver with linearly interpolated input and a smaller time step
+        with cd(self.working_dir):
+            solvers = [create_instance(self.get_parameters()) for _ in range(2)]
+            solvers[1].average_output = False
+            parameters_flow = copy.deepcopy(self.parameters_flow)
+            parameters_flow['settings'].update({'timestep_start': 0, 'number_of_timesteps': 12, 'save_restart': 0,
+                                                'delta_t': self.delta_t / self.number_of_substeps})
+            solver_ref = create_instance(parameters_flow)
+            for s in solvers + [solver_ref]:
+                s.initialize()
+            interface_input = solvers[0].get_interface_input()
+            displacements = self.get_displacements(interface_input, 3)
+
+            displacement_previous = 0 * displacements[0]
+            for displacement in displacements:
+                outputs = []
+                for s in solvers:
+                    s.initialize_solution_step()
+                    interface_input.set_variable_data(self.model_part_name, 'displacement', displacement)
+                    outputs.append(s.solve_solution_step(interface_input).get_interface_data())
+                    s.finalize_solution_step()
+                    s.output_solution_step()
+
+                output_average = 0
+                for i in range(1, self.number_of_substeps + 1):
+                    solver_ref.initialize_solution_step()
+                    interface_input.set_variable_data(self.model_part_name, 'displacement', displacement_previous + i
+                                                      / self.number_of_substeps * (displacement - displacement_previous)
+                                                      if i < self.number_of_substeps else displacement)
+                    output_last = solver_ref.solve_solution_step(interface_input).get_interface_data()
+                    output_average += output_last / self.number_of_substeps
+                    solver_ref.finalize_solution_step()
+                    solver_ref.output_solution_step()
+                displacement_previous = displacement
+
+                np.testing.assert_allclose(outputs[0], output_average, rtol=1e-14)
+                np.testing.assert_array_equal(outputs[1], output_last)
+            self.assertEqual(solvers[0].solver_wrapper.n, 3 * self.number_of_substeps)
+            for s in solvers + [solver_ref]:
+                s.finalize()
+
+    def test_restore_state(self):
+        # solving again in the same time step gives the same output as solving only once
+        with cd(self.working_dir):
+            solvers = [create_instance(self.get_parameters()) for _ in range(2)]
+            for s in solvers:
+                s.initialize()
+            interface_input = solvers[0].get_interface_input()
+            displacements = self.get_displacements(interface_input, 2)
+
+            for displacement in displacements:
+                outputs = []
+                for s in solvers:
+                    s.initialize_solution_step()
+                interface_input.set_variable_data(self.model_part_name, 'displacement', -displacement)
+                solvers[0].solve_solution_step(interface_input)
+                interface_input.set_variable_data(self.model_part_name, 'displacement', displacement)
+                for s in solvers:
+                    outputs.append(s.solve_solution_step(interface_input).get_interface_data())
+                    s.finalize_solution_step()
+                    s.output_solution_step()
+                np.testing.assert_array_equal(outputs[0], outputs[1])
+            for s in solvers:
+                s.finalize()
+
+    def test_restart(self):
+        # test if restart option works correctly
+        with cd(self.working_dir):
+            solver = create_instance(self.get_parameters(save_restart=2))
+            solver.initialize()
+            interface_input = solver.get_interface_input()
+            displacements = self.get_displacements(interface_input, 4)
+
+            # run solver for 4 time steps
+            for displacement in displacements:
+                solver.initialize_solution_step()
+                interface_input.set_variable_data(self.model_part_name, 'displacement', displacement)
+                output_1 = solver.solve_solution_step(interface_input).get_interface_data()
+                solver.finalize_solution_step()
+                solver.output_solution_step()
+            solver.finalize()
+
+            # create solver which restarts at time step 2 and run solver for 2 more time steps
+            solver = create_instance(self.get_parameters(timestep_start=2))
+            solver.initialize()
+            for displacement in displacements[2:]:
+                solver.initialize_solution_step()
+                interface_input.set_variable_data(self.model_part_name, 'displacement', displacement)
+                output_2 = solver.solve_solution_step(interface_input).get_interface_data()
+                solver.finalize_solution_step()
+                solver.output_solution_step()
+            solver.finalize()
+
+        np.testing.assert_array_equal(output_1, output_2)
+
+    def test_number_of_substeps(self):
+        parameters = self.get_parameters()
+        parameters['settings']['number_of_substeps'] = 0
+        with self.assertRaises(ValueError):
+            create_instance(parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+from coconut.tools import create_instance
+
+import unittest
+import numpy as np
+
+
+class DummyResidual:
+    def __init__(self, norm):
+        self.value = norm
+
+    def norm(self):
+        return self.value
+
+
+class TestTimeStepControllerAdaptive(unittest.TestCase):
+    def setUp(self):
+        self.parameters = {'type': 'time_step_controllers.adaptive',
+                           'settings': {'delta_t_min': 0.1, 'delta_t_max': 1., 'target_iterations': 4}}
+        self.controller = create_instance(self.parameters)
+        self.controller.initialize(0.4)
+
+    def do_time_step(self, norms):
+        self.controller.initialize_solution_step()
+        for norm in norms:
+            self.controller.update(DummyResidual(norm))
+        self.controller.finalize_solution_step()
+        return self.controller.get_delta_t()
+
+    def test_adaptive(self):
+        # increase when less iterations than the target are needed, limited by increase_factor
+        self.assertAlmostEqual(self.do_time_step([1., 1e-3, 1e-6]), 0.4 * 4 / 3)
+        self.assertAlmostEqual(self.do_time_step([1., 1e-6]), 0.4 * 4 / 3 * 1.5)
+        # no change when the target is met
+        self.assertAlmostEqual(self.do_time_step([1., 1e-2, 1e-4, 1e-6]), 0.8)
+        # decrease when more iterations than the target are needed, limited by decrease_factor
+        self.assertAlmostEqual(self.do_time_step(np.logspace(0, -6, 5)), 0.8 * 4 / 5)
+        self.assertAlmostEqual(self.do_time_step(np.logspace(0, -6, 20)), 0.32)
+        # decrease when the residual reduction is slow
+        self.assertAlmostEqual(self.do_time_step([1., 0.9]), 0.16)
+        # bounds
+        self.assertAlmostEqual(self.do_time_step([1., 0.9]), 0.1)
+        for _ in range(10):
+            self.do_time_step([1., 1e-6])
+        self.assertAlmostEqual(self.controller.get_delta_t(), 1.)
+
+    def test_errors(self):
+        for settings in ({'delta_t_min': 1., 'delta_t_max': 0.1}, {'delta_t_min': 0.1, 'delta_t_max': 1.,
+                                                                   'increase_factor': 0.9}):
+            with self.assertRaises(ValueError):
+                create_instance({'type': 'time_step_controllers.adaptive', 'settings': settings})
+        with self.assertRaises(ValueError):
+            create_instance(self.parameters).initialize(2.)
+
+    def test_restart(self):
+        self.do_time_step([1., 1e-6])
+        restart_data = self.controller.save_restart_data()
+        controller = create_instance(self.parameters)
+        controller.initialize(0.4)
+        controller.restart(restart_data)
+        self.assertEqual(controller.get_delta_t(), self.controller.get_delta_t())
+
+
+if __name__ == '__main__':
+    unittest.main()
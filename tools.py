@@ -269,6 +269,21 @@ def pass_on_parameters(settings_from, settings_to, keys):
             settings_to[key] = settings_from[key]
 
 
+# input for solve_solution_step: read-only view if solver_wrapper does not modify or keep its input, copy otherwise
+def get_solver_input(solver_wrapper, interface):
+    if getattr(solver_wrapper, 'mutates_input', True):
+        return interface.copy()
+    return interface.get_read_only_view()
+
+
+# storage precision from settings: 'float64' (default) or 'float32', computations are always done in float64
+def get_precision(settings, key='precision'):
+    precision = settings.get(key, 'float64')
+    if precision not in ('float32', 'float64'):
+        raise ValueError(f'"{key}" should be "float32" or "float64", not "{precision}"')
+    return np.dtype(precision)
+
+
 # compare bounding box of ModelParts
 def check_bounding_box(mp_a, mp_b, directions, tol_center_warning=.02, tol_center_error=.1,
                        tol_minmax_warning=.1, tol_minmax_error=.3):
@@ -296,18 +311,10 @@ def check_bounding_box(mp_a, mp_b, directions, tol_center_warning=.02, tol_cente
     if len(directions) == 0:
         raise ValueError(f'No directions specified')
 
-    # extract coordinate data
-    mp_a_coords = np.zeros(shape=(mp_a.size, len(directions)))
-    mp_b_coords = np.zeros(shape=(mp_b.size, len(directions)))
-    for i, d in enumerate(directions):
-        mp_a_coords[:, i] = getattr(mp_a, d)
-        mp_b_coords[:, i] = getattr(mp_b, d)
-
-    # get bounding boxes
-    mp_a_min = np.min(mp_a_coords, axis=0)
-    mp_a_max = np.max(mp_a_coords, axis=0)
-    mp_b_min = np.min(mp_b_coords, axis=0)
-    mp_b_max = np.max(mp_b_coords, axis=0)
+    # get bounding boxes, these are cached in the ModelParts
+    columns = [['x0', 'y0', 'z0'].index(d) for d in directions]
+    mp_a_min, mp_a_max = mp_a.bounding_box[:, columns]
+    mp_b_min, mp_b_max = mp_b.bounding_box[:, columns]
     mp_a_center = (mp_a_min + mp_a_max) / 2
     mp_b_center = (mp_b_min + mp_b_max) / 2
 